@@ -4,7 +4,7 @@ import logging
 import shutil
 import sys
 from contextlib import contextmanager
-from threading import Event, Thread
+from threading import Event, Lock, Thread
 from typing import TYPE_CHECKING, Final
 
 from pipx.constants import WINDOWS
@@ -30,6 +30,27 @@ if WINDOWS:
         _fields_ = (("size", ctypes.c_int), ("visible", ctypes.c_byte))
 
 
+class _Animations:
+    # worker pools pause spinners for their lifetime, since spinners from concurrent threads redraw over one another
+    lock: Final[Lock] = Lock()
+    paused: int = 0
+
+
+_ANIMATIONS: Final[_Animations] = _Animations()
+
+
+@contextmanager
+def animations_paused() -> Generator[None, None, None]:
+    """Print each step as a plain line instead of a spinner while the block runs, whatever ``do_animation`` says."""
+    with _ANIMATIONS.lock:
+        _ANIMATIONS.paused += 1
+    try:
+        yield
+    finally:
+        with _ANIMATIONS.lock:
+            _ANIMATIONS.paused -= 1
+
+
 def _env_supports_animation() -> bool:
     (term_cols, _) = shutil.get_terminal_size(fallback=(0, 0))
     return STDERR_IS_TTY and term_cols > MINIMUM_COLS_ALLOW_ANIMATION
@@ -43,7 +64,7 @@ def animate(message: str, *, do_animation: bool, delay: float = 0) -> Generator[
         yield
         return
 
-    if not do_animation or not _env_supports_animation():
+    if not do_animation or _ANIMATIONS.paused or not _env_supports_animation():
         sys.stderr.write(f"{message}...\n")
         yield
         return
@@ -151,6 +172,7 @@ __all__ = [
     "NONEMOJI_ANIMATION_FRAMES",
     "NONEMOJI_FRAME_PERIOD",
     "animate",
+    "animations_paused",
     "hide_cursor",
     "show_cursor",
 ]
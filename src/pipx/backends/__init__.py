@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import os
+import sys
 from functools import cache
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from pipx.backends._base import KNOWN_BACKENDS, PIP, UV, Backend, OutdatedPackage
-from pipx.backends.pip import PipBackend
-from pipx.backends.uv import UvBackend, find_uv_binary
 from pipx.util import PipxError
 
+if TYPE_CHECKING:
+    from pipx.backends.uv import find_uv_binary
+
 
 def resolve_backend_name(
     *,
@@ -24,7 +28,8 @@ def resolve_backend_name(
     for candidate, source in ((cli_value, "cli"), (metadata_value, "metadata"), (env_value, "env")):
         if (validated := _validate(candidate)) is not None:
             return validated, source
-    if auto and (binary_source := find_uv_binary()[1]) != "missing":
+    # looked up on the package, so the uv module loads only once auto-detection runs
+    if auto and (binary_source := sys.modules[__name__].find_uv_binary()[1]) != "missing":
         return UV, f"auto-{binary_source}"
     return PIP, "auto-pip"
 
@@ -34,8 +39,12 @@ def get_backend(name: str) -> Backend:
     # Cached so ``UvBackend.__init__``'s version probe and log line fire once
     # per process even when validation + construction both ask for the backend.
     if name == PIP:
+        from pipx.backends.pip import PipBackend  # ruff:ignore[import-outside-top-level]  # kept off the CLI startup path
+
         return PipBackend()
     if name == UV:
+        from pipx.backends.uv import UvBackend  # ruff:ignore[import-outside-top-level]  # kept off the CLI startup path
+
         return UvBackend()
     msg = f"Unknown backend {name!r}. Valid backends: {', '.join(KNOWN_BACKENDS)}."
     raise PipxError(msg)
@@ -58,6 +67,15 @@ def env_default_backend() -> str | None:
     return raw.strip() if raw else None
 
 
+def __getattr__(name: str) -> object:
+    if name != "find_uv_binary":
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = import_module(f"{__name__}.uv").find_uv_binary
+    globals()[name] = value
+    return value
+
+
 def _validate(candidate: str | None) -> str | None:
     if not candidate:
         return None
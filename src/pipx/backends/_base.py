@@ -144,6 +144,27 @@ def _parse_outdated_packages(output: str) -> tuple[OutdatedPackage, ...]:
         raise PipxError(msg, wrap_message=False) from error
 
 
+def latest_version_from_process(process: CompletedProcess[str]) -> str | None:
+    """The ``latest`` field of a ``pip index versions --json`` answer, ``None`` when the index has no release."""
+    if process.returncode:
+        if _NO_MATCHING_DISTRIBUTION in process.stderr:
+            return None
+        msg = f"Package backend exited with code {process.returncode}.\nstderr: {process.stderr}"
+        raise PipxError(msg, wrap_message=False)
+    try:
+        latest = cast("_IndexVersionsEntry", json.loads(process.stdout))["latest"]
+    except (json.JSONDecodeError, KeyError, TypeError) as error:
+        msg = "Package backend returned invalid JSON for an outdated query."
+        raise PipxError(msg, wrap_message=False) from error
+    if not isinstance(latest, str):
+        msg = "Package backend returned invalid JSON for an outdated query."
+        raise PipxError(msg, wrap_message=False)
+    return latest
+
+
+_NO_MATCHING_DISTRIBUTION: Final[str] = "No matching distribution found"
+
+
 @dataclass(frozen=True)
 class OutdatedPackage:
     name: str
@@ -157,11 +178,18 @@ class _OutdatedEntry(TypedDict):
     latest_version: str
 
 
+class _IndexVersionsEntry(TypedDict):
+    name: str
+    versions: list[str]
+    latest: str
+
+
 __all__ = [
     "KNOWN_BACKENDS",
     "PIP",
     "UV",
     "Backend",
     "OutdatedPackage",
+    "latest_version_from_process",
     "outdated_packages_from_process",
 ]
@@ -2,21 +2,30 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import partial
 from typing import TYPE_CHECKING, Final
 
 from pipx.animate import animate
-from pipx.backends._base import PIP, Backend, OutdatedPackage, outdated_packages_from_process
+from pipx.backends._base import (
+    PIP,
+    Backend,
+    OutdatedPackage,
+    latest_version_from_process,
+    outdated_packages_from_process,
+)
 from pipx.constants import PIPX_SHARED_PTH
 from pipx.shared_libs import shared_libs
+from pipx.trace import traced
 from pipx.util import (
     PipxError,
-    get_site_packages,
+    StreamedProcess,
     get_venv_paths,
     run_subprocess,
     subprocess_post_check,
     subprocess_post_check_handle_pip_error,
 )
-from pipx.venv_inspect import list_not_required_packages
+from pipx.venv_inspect import list_not_required_packages, probe_venv
+from pipx.venv_template import clone_venv
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -25,6 +34,24 @@ if TYPE_CHECKING:
 _LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
 
 
+def _create_venv(root: Path, *, python: str, venv_args: list[str], include_pip: bool, verbose: bool) -> None:
+    cmd = [python, "-m", "venv"]
+    if not include_pip:
+        cmd.append("--without-pip")
+    cmd += [*venv_args, str(root)]
+    with animate("creating virtual environment", do_animation=not verbose):
+        venv_process = run_subprocess(cmd, run_dir=str(root))
+    subprocess_post_check(venv_process)
+
+
+def _create_shared_libs_venv(root: Path, *, python: str, venv_args: list[str], verbose: bool) -> None:
+    _create_venv(root, python=python, venv_args=venv_args, include_pip=False, verbose=verbose)
+    _, python_path, _ = get_venv_paths(root)
+    purelib = probe_venv(python_path).purelib
+    purelib.mkdir(parents=True, exist_ok=True)
+    (purelib / PIPX_SHARED_PTH).write_text("".join(f"{path}\n" for path in shared_libs.site_packages))
+
+
 class PipBackend(Backend):
     name = PIP
 
@@ -47,6 +74,7 @@ class PipBackend(Backend):
         )
         subprocess_post_check(process)
 
+    @traced("backend")
     def create_venv(  # ruff:ignore[no-self-use, too-many-arguments]  # Backend interface method mirroring venv-creation inputs
         self,
         root: Path,
@@ -57,21 +85,20 @@ class PipBackend(Backend):
         include_pip: bool,
         verbose: bool,
     ) -> None:
-        cmd = [python, "-m", "venv"]
-        if not include_pip:
-            cmd.append("--without-pip")
-        cmd += [*venv_args, str(root)]
-        with animate("creating virtual environment", do_animation=not verbose):
-            venv_process = run_subprocess(cmd, run_dir=str(root))
-        subprocess_post_check(venv_process)
-
+        if include_pip:
+            _create_venv(root, python=python, venv_args=venv_args, include_pip=True, verbose=verbose)
+            shared_libs.create(verbose=verbose, pip_args=pip_args)
+            return
+        # the template's pth file names the shared libraries, so they have to exist before it is keyed and built
         shared_libs.create(verbose=verbose, pip_args=pip_args)
-        if not include_pip:
-            _, python_path, _ = get_venv_paths(root)
-            purelib = get_site_packages(python_path)[0]
-            purelib.mkdir(parents=True, exist_ok=True)
-            (purelib / PIPX_SHARED_PTH).write_text("".join(f"{path}\n" for path in shared_libs.site_packages))
+        clone_venv(
+            root,
+            python=python,
+            key=(PIP, *venv_args, "\0", *map(str, shared_libs.site_packages)),
+            create=partial(_create_shared_libs_venv, python=python, venv_args=venv_args, verbose=verbose),
+        )
 
+    @traced("backend")
     def install(  # ruff:ignore[no-self-use, too-many-arguments]  # Backend interface method mapping flags to pip options
         self,
         *,
@@ -100,14 +127,19 @@ class PipBackend(Backend):
             run_dir=str(venv_root),
             stream_output=verbose or progress,
         )
-        if log_pip_errors:
-            subprocess_post_check_handle_pip_error(process)
+        try:
+            if log_pip_errors:
+                subprocess_post_check_handle_pip_error(process)
+        finally:
+            if isinstance(process, StreamedProcess):
+                process.close()
         return process
 
     @staticmethod
     def cooldown_args(cooldown_days: int | None) -> list[str]:
         return [] if not cooldown_days else ["--uploaded-prior-to", f"P{cooldown_days}D"]
 
+    @traced("backend")
     def uninstall(  # ruff:ignore[no-self-use]  # Backend interface method, must dispatch polymorphically
         self,
         *,
@@ -157,6 +189,21 @@ class PipBackend(Backend):
         )
         return outdated_packages_from_process(process)
 
+    def latest_version(  # ruff:ignore[no-self-use]  # sits beside list_outdated so both index queries share the backend
+        self,
+        *,
+        venv_root: Path,
+        venv_python: Path,
+        index_args: list[str],
+        package: str,
+    ) -> str | None:
+        """Newest release of one project the index offers ``venv_python``, without inspecting the venv's packages."""
+        process = run_subprocess(
+            [str(venv_python), "-m", "pip", "index", "versions", "--json", *index_args, package],
+            run_dir=str(venv_root),
+        )
+        return latest_version_from_process(process)
+
     def run_raw_pip(  # ruff:ignore[no-self-use, too-many-arguments]  # Backend interface method passing raw pip controls through
         self,
         *,
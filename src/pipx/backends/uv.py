@@ -5,22 +5,27 @@ import logging
 import re
 import shutil
 import subprocess
-from functools import cache
+from functools import cache, partial
 from importlib import import_module
 from pathlib import Path
-from typing import TYPE_CHECKING, Final, cast
+from typing import TYPE_CHECKING, Any, Final, cast
 
 from packaging.version import InvalidVersion, Version
 
+from pipx import paths
 from pipx.animate import animate
 from pipx.backends._base import UV, Backend, OutdatedPackage, outdated_packages_from_process
+from pipx.trace import traced
 from pipx.util import (
     PipxError,
+    StreamedProcess,
+    replace_json,
     run_subprocess,
     subprocess_post_check,
     subprocess_post_check_handle_pip_error,
 )
 from pipx.venv_inspect import list_not_required_packages
+from pipx.venv_template import clone_venv
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -46,6 +51,8 @@ _VERSION_RE: Final[re.Pattern[str]] = re.compile(
     re.VERBOSE,
 )
 _UV_PROBE_TIMEOUT: Final[int] = 10
+UV_CACHE_FILENAME: Final[str] = "uv_cache.json"
+_UV_CACHE_VERSION: Final[int] = 1
 
 
 class UvBackend(Backend):
@@ -65,6 +72,7 @@ class UvBackend(Backend):
     ) -> None:
         del venv_python, pip_args, verbose  # uv venvs ship no pip to upgrade.
 
+    @traced("backend")
     def create_venv(  # ruff:ignore[too-many-arguments]  # Backend interface method mirroring venv-creation inputs
         self,
         root: Path,
@@ -82,12 +90,26 @@ class UvBackend(Backend):
                 "Reinstall the package with `--backend pip` (or unset PIPX_DEFAULT_BACKEND)."
             )
             raise PipxError(msg)
+        try:
+            # a different uv may lay the venv out differently
+            binary_mtime = str(self._binary.stat().st_mtime_ns)
+        except OSError:
+            binary_mtime = ""
+        clone_venv(
+            root,
+            python=python,
+            key=(UV, str(self._binary), binary_mtime, *venv_args),
+            create=partial(self._create_venv, python=python, venv_args=venv_args, verbose=verbose),
+        )
+
+    def _create_venv(self, root: Path, *, python: str, venv_args: list[str], verbose: bool) -> None:
         cmd: list[str | Path] = [self._binary, "venv", "--python", python, "--allow-existing", *venv_args]
         cmd.extend(("--verbose" if verbose else "--quiet", str(root)))
         with animate("creating virtual environment", do_animation=not verbose):
             process = run_subprocess(cmd, run_dir=str(root), env_overrides=_uv_env_overrides())
         subprocess_post_check(process)
 
+    @traced("backend")
     def install(  # ruff:ignore[too-many-arguments]  # Backend interface method mapping flags to uv options
         self,
         *,
@@ -115,14 +137,19 @@ class UvBackend(Backend):
             env_overrides=_uv_env_overrides(progress=progress),
             stream_output=verbose or progress,
         )
-        if log_pip_errors:
-            subprocess_post_check_handle_pip_error(process, tool_name="uv")
+        try:
+            if log_pip_errors:
+                subprocess_post_check_handle_pip_error(process, tool_name="uv")
+        finally:
+            if isinstance(process, StreamedProcess):
+                process.close()
         return process
 
     @staticmethod
     def cooldown_args(cooldown_days: int | None) -> list[str]:
         return [] if not cooldown_days else ["--exclude-newer", f"P{cooldown_days}D"]
 
+    @traced("backend")
     def uninstall(
         self,
         *,
@@ -242,15 +269,21 @@ def find_uv_binary() -> tuple[Path | None, str]:
             # ``is_file`` rejects a stale path from a half-installed extra;
             # ``_binary_runs`` catches the exec-fails case (missing dylib,
             # ENOEXEC) so we fall through to PATH instead of erroring later.
-            if bundled.is_file() and _binary_runs(bundled):
+            if bundled.is_file() and _binary_usable(bundled):
                 return bundled, "bundled"
     # Probe the PATH candidate too, so a broken or hanging ``uv`` on PATH is
     # skipped here instead of stalling the later version check.
-    if (path := shutil.which("uv")) and _binary_runs(candidate := Path(path)):
+    if (path := shutil.which("uv")) and _binary_usable(candidate := Path(path)):
         return candidate, "path"
     return None, "missing"
 
 
+def _binary_usable(binary: Path) -> bool:
+    # A binary that reported its version in an earlier run and has the same size and mtime since is trusted without
+    # starting it again; replacing or upgrading uv changes both, so the new binary gets the full probe.
+    return _remembered_version(binary) is not None or _binary_runs(binary)
+
+
 def _binary_runs(binary: Path) -> bool:
     # Liveness probe; full floor-version check stays in ``_check_uv_version``.
     try:
@@ -260,7 +293,7 @@ def _binary_runs(binary: Path) -> bool:
     except (OSError, subprocess.TimeoutExpired) as exc:
         _LOGGER.debug("uv launch probe failed for %s: %s", binary, exc)
         return False
-    if process.returncode != 0 or not _VERSION_RE.search(process.stdout):
+    if process.returncode != 0 or (match := _VERSION_RE.search(process.stdout)) is None:
         _LOGGER.debug(
             "uv launch probe rejected %s: rc=%s, stdout=%r, stderr=%r",
             binary,
@@ -269,12 +302,30 @@ def _binary_runs(binary: Path) -> bool:
             process.stderr,
         )
         return False
+    _remember_version(binary, match.group(1))
     return True
 
 
 @cache
 def _check_uv_version(binary: Path) -> Version:
     # Cached so ``upgrade-all`` over many venvs doesn't fork uv repeatedly.
+    if (reported := _remembered_version(binary)) is None:
+        reported = _probe_version(binary)
+    try:
+        version = Version(reported)
+    except InvalidVersion as exc:
+        msg = f"Unrecognized uv version {reported!r}."
+        raise PipxError(msg) from exc
+    if version < _MIN_UV_VERSION:
+        msg = (
+            f"pipx needs uv>={_MIN_UV_VERSION}, but {binary} reports {version}.\n"
+            "Upgrade uv (`uv self update` or reinstall pipx[uv]), or run with `--backend pip` to bypass."
+        )
+        raise PipxError(msg)
+    return version
+
+
+def _probe_version(binary: Path) -> str:
     try:
         process = subprocess.run(
             [str(binary), "--version"], check=False, text=True, capture_output=True, timeout=_UV_PROBE_TIMEOUT
@@ -291,18 +342,65 @@ def _check_uv_version(binary: Path) -> Version:
             f"(rc={process.returncode}, stdout={process.stdout!r}, stderr={process.stderr!r})."
         )
         raise PipxError(msg)
+    if process.returncode == 0:
+        _remember_version(binary, match.group(1))
+    return match.group(1)
+
+
+def _remembered_version(binary: Path) -> str | None:
+    """The version ``binary`` reported in an earlier run, while it is still the same size and modification time."""
+    entry = _read_uv_cache(paths.ctx.lookup_cache / UV_CACHE_FILENAME).get(str(binary))
+    if entry is None or entry["identity"] != _identity(binary):
+        return None
+    return str(entry["version"])
+
+
+def _remember_version(binary: Path, reported: str) -> None:
+    if (identity := _identity(binary)) is None:
+        return
+    cache_file: Final[Path] = paths.ctx.lookup_cache / UV_CACHE_FILENAME
+    entries: Final[dict[str, dict[str, Any]]] = _read_uv_cache(cache_file)
+    entry: Final[dict[str, Any]] = {"identity": identity, "version": reported}
+    if entries.get(str(binary)) == entry:
+        return
+    entries[str(binary)] = entry
+    _write_uv_cache(cache_file, entries)
+
+
+def _identity(binary: Path) -> list[int] | None:
     try:
-        version = Version(match.group(1))
-    except InvalidVersion as exc:
-        msg = f"Unrecognized uv version {match.group(1)!r}."
-        raise PipxError(msg) from exc
-    if version < _MIN_UV_VERSION:
-        msg = (
-            f"pipx needs uv>={_MIN_UV_VERSION}, but {binary} reports {version}.\n"
-            "Upgrade uv (`uv self update` or reinstall pipx[uv]), or run with `--backend pip` to bypass."
-        )
-        raise PipxError(msg)
-    return version
+        binary_stat = binary.stat()
+    except OSError:
+        return None
+    # upgrading uv in place, as ``uv self update`` does, changes both
+    return [binary_stat.st_size, binary_stat.st_mtime_ns]
+
+
+def _read_uv_cache(cache_file: Path) -> dict[str, dict[str, Any]]:
+    """Entries of the uv cache, empty when it is missing, unreadable, or from another pipx."""
+    try:
+        with cache_file.open("rb") as cache_fh:
+            payload = json.load(cache_fh)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != _UV_CACHE_VERSION:
+        return {}
+    entries = payload.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {
+        key: entry
+        for key, entry in entries.items()
+        if isinstance(entry, dict) and isinstance(entry.get("identity"), list) and isinstance(entry.get("version"), str)
+    }
+
+
+def _write_uv_cache(cache_file: Path, entries: dict[str, dict[str, Any]]) -> None:
+    try:
+        replace_json({"version": _UV_CACHE_VERSION, "entries": entries}, cache_file)
+    except OSError as exc:
+        # the cache only saves running ``uv --version``, so the next run simply does that again
+        _LOGGER.debug("Unable to write %s: %s", cache_file, exc)
 
 
 def _uv_env_overrides(*, progress: bool = False) -> dict[str, str | None]:
@@ -320,6 +418,7 @@ def _strip_pip_quiet_flags(pip_args: list[str]) -> list[str]:
 
 
 __all__ = [
+    "UV_CACHE_FILENAME",
     "UvBackend",
     "find_uv_binary",
     "resolve_uv_binary",
@@ -1,33 +1,105 @@
 from __future__ import annotations
 
-from pipx.commands.cache import CacheData, print_cache_dir, purge_cache
-from pipx.commands.ensure_path import ensure_pipx_paths
-from pipx.commands.environment import environment
-from pipx.commands.execute import execute
-from pipx.commands.expose import ExposureData, expose, unexpose
-from pipx.commands.health import HealthData, RepairData, health, repair
-from pipx.commands.inject import InjectionData, inject
-from pipx.commands.install import InstallData, install, install_all
-from pipx.commands.interpreter import (
-    InterpreterData,
-    list_interpreters,
-    prune_interpreters,
-    upgrade_interpreters,
-)
-from pipx.commands.list_packages import list_packages
-from pipx.commands.manifest import ManifestData, lock_manifest, sync_manifest
-from pipx.commands.outdated import OutdatedData, list_outdated
-from pipx.commands.pin import PinData, pin, unpin
-from pipx.commands.reinstall import ReinstallData, reinstall, reinstall_all
-from pipx.commands.reset import ResetData, reset
-from pipx.commands.run import run
-from pipx.commands.run_pip import run_pip
-from pipx.commands.uninject import uninject
-from pipx.commands.uninstall import UninstallData, uninstall, uninstall_all
-from pipx.commands.upgrade import SharedData, upgrade, upgrade_all, upgrade_shared
+from importlib import import_module
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from pipx.commands.cache import CacheData, print_cache_dir, purge_cache
+    from pipx.commands.dedupe import DedupeData, dedupe
+    from pipx.commands.ensure_path import ensure_pipx_paths
+    from pipx.commands.environment import environment
+    from pipx.commands.execute import execute
+    from pipx.commands.expose import ExposureData, expose, unexpose
+    from pipx.commands.health import HealthData, RepairData, health, repair
+    from pipx.commands.inject import InjectionData, inject
+    from pipx.commands.install import InstallData, install, install_all
+    from pipx.commands.interpreter import (
+        InterpreterData,
+        list_interpreters,
+        prune_interpreters,
+        upgrade_interpreters,
+    )
+    from pipx.commands.list_packages import list_packages
+    from pipx.commands.manifest import ManifestData, lock_manifest, sync_manifest
+    from pipx.commands.outdated import OutdatedData, list_outdated
+    from pipx.commands.pin import PinData, pin, unpin
+    from pipx.commands.reinstall import ReinstallData, reinstall, reinstall_all
+    from pipx.commands.reset import ResetData, reset
+    from pipx.commands.run import run
+    from pipx.commands.run_pip import run_pip
+    from pipx.commands.uninject import uninject
+    from pipx.commands.uninstall import UninstallData, uninstall, uninstall_all
+    from pipx.commands.upgrade import SharedData, upgrade, upgrade_all, upgrade_shared
+
+# command modules load on first use, so a pipx invocation only imports the command it dispatches
+_EXPORTS: Final[dict[str, str]] = {
+    "CacheData": "cache",
+    "print_cache_dir": "cache",
+    "purge_cache": "cache",
+    "DedupeData": "dedupe",
+    "dedupe": "dedupe",
+    "ensure_pipx_paths": "ensure_path",
+    "environment": "environment",
+    "execute": "execute",
+    "ExposureData": "expose",
+    "expose": "expose",
+    "unexpose": "expose",
+    "HealthData": "health",
+    "RepairData": "health",
+    "health": "health",
+    "repair": "health",
+    "InjectionData": "inject",
+    "inject": "inject",
+    "InstallData": "install",
+    "install": "install",
+    "install_all": "install",
+    "InterpreterData": "interpreter",
+    "list_interpreters": "interpreter",
+    "prune_interpreters": "interpreter",
+    "upgrade_interpreters": "interpreter",
+    "list_packages": "list_packages",
+    "ManifestData": "manifest",
+    "lock_manifest": "manifest",
+    "sync_manifest": "manifest",
+    "OutdatedData": "outdated",
+    "list_outdated": "outdated",
+    "PinData": "pin",
+    "pin": "pin",
+    "unpin": "pin",
+    "ReinstallData": "reinstall",
+    "reinstall": "reinstall",
+    "reinstall_all": "reinstall",
+    "ResetData": "reset",
+    "reset": "reset",
+    "run": "run",
+    "run_pip": "run_pip",
+    "uninject": "uninject",
+    "UninstallData": "uninstall",
+    "uninstall": "uninstall",
+    "uninstall_all": "uninstall",
+    "SharedData": "upgrade",
+    "upgrade": "upgrade",
+    "upgrade_all": "upgrade",
+    "upgrade_shared": "upgrade",
+}
+
+
+def __getattr__(name: str) -> object:
+    if (module := _EXPORTS.get(name)) is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value: Final[object] = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "CacheData",
+    "DedupeData",
     "ExposureData",
     "HealthData",
     "InjectionData",
@@ -41,6 +113,7 @@ __all__ = [
     "ResetData",
     "SharedData",
     "UninstallData",
+    "dedupe",
     "ensure_pipx_paths",
     "environment",
     "execute",
@@ -12,6 +12,7 @@ from pathlib import Path
 from re import Pattern
 from shutil import which
 from tempfile import TemporaryDirectory
+from threading import RLock
 from typing import TYPE_CHECKING, Final
 
 import userpath
@@ -23,15 +24,19 @@ from pipx.constants import COMPLETION_SECTIONS, MAN_SECTIONS, WINDOWS
 from pipx.emojis import hazard, stars
 from pipx.package_specifier import parse_specifier_for_install, valid_pypi_name
 from pipx.result import OutputMessage, OutputStream
-from pipx.util import PipxError, mkdir, pipx_wrap, rmdir, safe_unlink
+from pipx.script import script_name_from_spec
+from pipx.trace import traced
+from pipx.util import PipxError, get_venv_paths, mkdir, pipx_wrap, rmdir, safe_unlink
 from pipx.venv import Venv
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping, Sequence
+    from collections.abc import Callable, Iterable, Mapping, Sequence
 
-    from pipx.pipx_metadata_file import PackageInfo
+    from pipx.pipx_metadata_file import PackageInfo, PipxMetadata
 
 _LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+# the bin, man, and completion directories are shared by every environment; concurrent workers take turns writing them
+RESOURCE_EXPOSURE_LOCK: Final[RLock] = RLock()
 
 
 class VenvProblems:
@@ -97,6 +102,7 @@ def expose_resources_globally(
     return collisions
 
 
+@traced("expose")
 def expose_package_resources(
     package_metadata: PackageInfo,
     local_bin_dir: Path,
@@ -105,17 +111,18 @@ def expose_package_resources(
     force: bool,
 ) -> list[Path]:
     collisions: Final[list[Path]] = []
-    if app_paths := package_metadata.app_paths_to_expose:
-        collisions.extend(
-            expose_resources_globally("app", local_bin_dir, app_paths, force=force, suffix=package_metadata.suffix)
-        )
-    if man_paths := package_metadata.man_paths_to_expose:
-        collisions.extend(expose_resources_globally("man", local_man_dir, man_paths, force=force))
-    if completion_paths := package_metadata.completion_paths_to_expose:
-        # the script names the command it completes, so a suffix here would point the shell at a command that is gone
-        collisions.extend(
-            expose_resources_globally("completion", paths.ctx.completion_dir, completion_paths, force=force)
-        )
+    with RESOURCE_EXPOSURE_LOCK:
+        if app_paths := package_metadata.app_paths_to_expose:
+            collisions.extend(
+                expose_resources_globally("app", local_bin_dir, app_paths, force=force, suffix=package_metadata.suffix)
+            )
+        if man_paths := package_metadata.man_paths_to_expose:
+            collisions.extend(expose_resources_globally("man", local_man_dir, man_paths, force=force))
+        if completion_paths := package_metadata.completion_paths_to_expose:
+            # the script names the command it completes, so a suffix would point the shell at a command that is gone
+            collisions.extend(
+                expose_resources_globally("completion", paths.ctx.completion_dir, completion_paths, force=force)
+            )
     return collisions
 
 
@@ -244,18 +251,41 @@ def _symlink_package_resource(
 
 
 def venv_health_check(venv: Venv, package_name: str | None = None) -> tuple[VenvProblems, str]:
-    venv_dir = venv.root
-    python_path = venv.python_path.resolve()
+    return _health_check(
+        venv.root,
+        venv.python_path,
+        venv.package_metadata,
+        venv.main_package_name if package_name is None else package_name,
+    )
+
+
+def metadata_health_check(venv_dir: Path, pipx_metadata: PipxMetadata) -> tuple[VenvProblems, str]:
+    """Check the main package of ``venv_dir`` like :func:`venv_health_check`, from its metadata alone.
+
+    This spares read-only listings building a :class:`~pipx.venv.Venv`, and resolving its backend, for every venv.
+    """
+    main_package: Final[PackageInfo] = pipx_metadata.main_package
+    package_metadata: Final[dict[str, PackageInfo]] = pipx_metadata.injected_packages.copy()
+    if main_package.package is not None:
+        package_metadata[main_package.package] = main_package
+    return _health_check(
+        venv_dir,
+        get_venv_paths(venv_dir)[1],
+        package_metadata,
+        venv_dir.name if main_package.package is None else main_package.package,
+    )
 
-    if package_name is None:
-        package_name = venv.main_package_name
 
+def _health_check(
+    venv_dir: Path, python_path: Path, package_metadata: Mapping[str, PackageInfo], package_name: str
+) -> tuple[VenvProblems, str]:
+    # is_file follows the interpreter symlink to its target; the resolved path is only needed to name a broken one
     if not python_path.is_file():
         return (
             VenvProblems(invalid_interpreter=True),
-            f"   package {red(bold(venv_dir.name))} has invalid interpreter {python_path!s}\r{hazard}",
+            f"   package {red(bold(venv_dir.name))} has invalid interpreter {python_path.resolve()!s}\r{hazard}",
         )
-    if not venv.package_metadata:
+    if not package_metadata:
         return (
             VenvProblems(missing_metadata=True),
             f"   package {red(bold(venv_dir.name))} has missing internal pipx metadata.\r{hazard}",
@@ -265,7 +295,7 @@ def venv_health_check(venv: Venv, package_name: str | None = None) -> tuple[Venv
             VenvProblems(bad_venv_name=True),
             f"   package {red(bold(venv_dir.name))} needs its internal data updated.\r{hazard}",
         )
-    if not venv.package_metadata[package_name].package_version:
+    if not package_metadata[package_name].package_version:
         return (
             VenvProblems(not_installed=True),
             f"   package {red(bold(package_name))} {red('is not installed')} in the venv {venv_dir.name}\r{hazard}",
@@ -313,8 +343,9 @@ def get_venv_summary(
     package_name: str | None = None,
     new_install: bool = False,
     include_injected: bool = False,
+    pipx_metadata: PipxMetadata | None = None,
 ) -> tuple[str, VenvProblems]:
-    venv = Venv(venv_dir)
+    venv = Venv(venv_dir, pipx_metadata=pipx_metadata)
 
     if package_name is None:
         package_name = venv.main_package_name
@@ -534,6 +565,58 @@ def package_name_from_spec(  # ruff:ignore[too-many-arguments]  # resolver input
     return package_name
 
 
+def requirement_for_main_install(
+    package_spec: str,
+    pip_args: list[str],
+    cooldown_days: int | None,
+    *,
+    main_pip_args: list[str],
+    main_cooldown_days: int | None,
+) -> str | None:
+    """The requirement that installs an injected package in the same backend call as its venv's main package.
+
+    One call takes one set of installer arguments, so ``None`` when the package was injected with other arguments or
+    another cooldown. Editable installs and scripts, which need a call or a built wheel of their own, get ``None`` too.
+    """
+    if pip_args != main_pip_args or cooldown_days != main_cooldown_days or "--editable" in pip_args:
+        return None
+    if script_name_from_spec(package_spec, ()) is not None:
+        return None
+    requirement, _ = parse_specifier_for_install(package_spec, pip_args)
+    return requirement
+
+
+def _batched_injections(
+    injected_packages: Mapping[str, PackageInfo],
+    package_spec: Callable[[PackageInfo], str],
+    *,
+    main_pip_args: list[str],
+    main_cooldown_days: int | None,
+    cooldown_days: int | None = None,
+) -> dict[str, str]:
+    """Requirements, by injected package, that go into the main package's install instead of one install each.
+
+    Each package is compared by the installer arguments it was injected with; ``cooldown_days`` replaces the recorded
+    cooldowns when the command was given one.
+    """
+    batched: Final[dict[str, str]] = {}
+    for name, injected_package in injected_packages.items():
+        requirement = requirement_for_main_install(
+            package_spec(injected_package),
+            injected_package.pip_args,
+            cooldown_days if cooldown_days is not None else injected_package.cooldown_days,
+            main_pip_args=main_pip_args,
+            main_cooldown_days=main_cooldown_days,
+        )
+        if requirement is not None:
+            batched[name] = requirement
+    return batched
+
+
+def _unbatched_message(batched: Mapping[str, str], venv_name: str) -> str:
+    return f"Could not install {', '.join(sorted(batched))} together with {venv_name}; injecting each one on its own."
+
+
 def run_post_install_actions(  # ruff:ignore[too-many-arguments]  # post-install needs venv, both resource dirs, and the venv dir
     venv: Venv,
     package_name: str,
@@ -586,8 +669,9 @@ def run_post_install_actions(  # ruff:ignore[too-many-arguments]  # post-install
             raise PipxError(msg)
 
     if venv.pipx_metadata.exposure_enabled:
-        expose_package_resources(package_metadata, local_bin_dir, local_man_dir, force=force)
-        _remove_stale_venv_resources(previous_resource_paths, venv, local_bin_dir, local_man_dir)
+        with RESOURCE_EXPOSURE_LOCK:
+            expose_package_resources(package_metadata, local_bin_dir, local_man_dir, force=force)
+            _remove_stale_venv_resources(previous_resource_paths, venv, local_bin_dir, local_man_dir)
 
     package_summary, _ = get_venv_summary(venv_dir, package_name=package_name, new_install=True)
     pipx_logger: Final[logging.Logger] = logging.getLogger("pipx")
@@ -722,7 +806,10 @@ def locked_package_message(package_name: str) -> str:
 
 
 __all__ = [
+    "RESOURCE_EXPOSURE_LOCK",
     "VenvProblems",
+    "_batched_injections",
+    "_unbatched_message",
     "add_suffix",
     "can_symlink",
     "expose_package_resources",
@@ -733,7 +820,9 @@ __all__ = [
     "get_venv_summary",
     "group_resource_paths",
     "locked_package_message",
+    "metadata_health_check",
     "package_name_from_spec",
+    "requirement_for_main_install",
     "run_post_install_actions",
     "validate_expected_apps",
     "validate_suffix",
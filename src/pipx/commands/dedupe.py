@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import logging
+import os
+import stat
+from contextlib import ExitStack, suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, TypeGuard
+
+from pipx.result import OperationData, OperationResult, OutputMessage
+from pipx.util import replace_json
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from pipx.venv import VenvContainer
+
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+DEDUPE_INDEX_FILENAME: Final[str] = ".pipx_dedupe_index.json"
+_DEDUPE_INDEX_VERSION: Final[int] = 1
+_HASH_CHUNK_SIZE: Final[int] = 1024 * 1024
+_KIB: Final[int] = 1024
+_SIZE_UNITS: Final[tuple[str, ...]] = ("KiB", "MiB", "GiB")
+# purelib and platlib under every layout a venv uses; lib64 is often a symlink to lib, so each is resolved and seen once
+_RECORD_PATTERNS: Final[tuple[str, ...]] = (
+    "lib*/python*/site-packages/*.dist-info/RECORD",
+    "Lib/site-packages/*.dist-info/RECORD",
+)
+
+_InodeKey = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class _Inode:
+    stat: os.stat_result
+    paths: tuple[Path, ...]
+
+
+@dataclass(frozen=True)
+class DedupeData(OperationData):
+    environments: tuple[str, ...]
+    linked: int
+    freed_bytes: int
+
+
+def dedupe(venv_container: VenvContainer, venv_dirs: Iterable[Path]) -> OperationResult[DedupeData]:
+    """Hardlink byte-identical files that installed distributions share across environments to a single copy.
+
+    Only files listed in a ``RECORD`` inside site-packages are considered, and only files on the same filesystem with
+    the same permissions are linked. Installers replace files rather than write into them, so an upgrade in one
+    environment leaves the copy the others link to untouched.
+    """
+    venv_dirs = tuple(venv_dirs)
+    index_path: Final[Path] = venv_container.root / DEDUPE_INDEX_FILENAME
+    environments: Final[set[str]] = set()
+    freed: Final[set[_InodeKey]] = set()
+    linked = freed_bytes = 0
+    with ExitStack() as locks:
+        for venv_dir in venv_dirs:
+            locks.enter_context(venv_container.venv_lock(venv_dir))
+        inodes: Final[dict[_InodeKey, _Inode]] = _installed_inodes(venv_dirs)
+        cached: Final[dict[str, list[int | str]]] = _read_index(index_path)
+        digests: Final[dict[str, list[int | str]]] = {}
+        for candidates in _same_size_inodes(inodes):
+            by_digest: dict[str, list[_InodeKey]] = {}
+            for key in candidates:
+                if (digest := _digest(key, inodes[key], cached, digests)) is not None:
+                    by_digest.setdefault(digest, []).append(key)
+            for keys in by_digest.values():
+                # the copy that already has the most links is kept, so repeat runs only relink new arrivals
+                keep, *duplicates = sorted(keys, key=lambda key: (-inodes[key].stat.st_nlink, inodes[key].paths[0]))
+                for key in duplicates:
+                    relinked = [path for path in inodes[key].paths if _link(inodes[keep].paths[0], path)]
+                    linked += len(relinked)
+                    environments.update(_environment(venv_container, path) for path in relinked)
+                    if len(relinked) == inodes[key].stat.st_nlink:
+                        freed_bytes += inodes[key].stat.st_size
+                        digests.pop(_index_key(key), None)
+                        freed.add(key)
+        # keep what is known about copies that had no twin this time, so a later arrival only hashes itself
+        for key, inode in inodes.items():
+            index_key = _index_key(key)
+            if key not in freed and index_key not in digests and _is_current(cached.get(index_key), inode):
+                digests[index_key] = cached[index_key]
+        _write_index(index_path, digests)
+
+    message: Final[str] = (
+        f"Linked {linked} duplicate {'file' if linked == 1 else 'files'} in {len(environments)} "
+        f"{'environment' if len(environments) == 1 else 'environments'}, freeing {_format_size(freed_bytes)}."
+        if linked
+        else "pipx found no duplicate files to link."
+    )
+    return OperationResult(
+        command=("dedupe",),
+        data=DedupeData(environments=tuple(sorted(environments)), linked=linked, freed_bytes=freed_bytes),
+        messages=(OutputMessage(message),),
+    )
+
+
+def _installed_inodes(venv_dirs: Iterable[Path]) -> dict[_InodeKey, _Inode]:
+    paths: Final[dict[_InodeKey, list[Path]]] = {}
+    stats: Final[dict[_InodeKey, os.stat_result]] = {}
+    for path in _installed_files(venv_dirs):
+        try:
+            file_stat = path.lstat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(file_stat.st_mode) or not file_stat.st_size:
+            continue
+        key: _InodeKey = (file_stat.st_dev, file_stat.st_ino)
+        stats.setdefault(key, file_stat)
+        paths.setdefault(key, []).append(path)
+    return {key: _Inode(stats[key], tuple(dict.fromkeys(paths[key]))) for key in paths}
+
+
+def _installed_files(venv_dirs: Iterable[Path]) -> Iterator[Path]:
+    seen: Final[set[Path]] = set()
+    for venv_dir in venv_dirs:
+        for pattern in _RECORD_PATTERNS:
+            for record in sorted(venv_dir.glob(pattern)):
+                if (resolved := record.parent.resolve()) in seen:
+                    continue
+                seen.add(resolved)
+                site_packages = record.parent.parent
+                try:
+                    rows = list(csv.reader(record.read_text(encoding="utf-8").splitlines()))
+                except (OSError, UnicodeDecodeError, csv.Error):
+                    continue
+                for row in rows:
+                    if not row or not row[0]:
+                        continue
+                    # scripts outside site-packages carry the environment's own interpreter in their shebang
+                    path = Path(os.path.normpath(site_packages / row[0]))
+                    if site_packages in path.parents:
+                        yield path
+
+
+def _same_size_inodes(inodes: dict[_InodeKey, _Inode]) -> Iterator[list[_InodeKey]]:
+    # a hardlink shares its mode and can't cross a filesystem, and only files of one size can hold the same bytes
+    groups: Final[dict[tuple[int, int, int], list[_InodeKey]]] = {}
+    for key, inode in inodes.items():
+        groups.setdefault((inode.stat.st_dev, inode.stat.st_size, inode.stat.st_mode), []).append(key)
+    yield from (keys for keys in groups.values() if len(keys) > 1)
+
+
+def _digest(
+    key: _InodeKey,
+    inode: _Inode,
+    cached: dict[str, list[int | str]],
+    digests: dict[str, list[int | str]],
+) -> str | None:
+    index_key: Final[str] = _index_key(key)
+    if _is_current(entry := cached.get(index_key), inode):
+        digests[index_key] = entry
+        return str(entry[2])
+    digest = hashlib.sha256()
+    try:
+        with inode.paths[0].open("rb") as file_fh:
+            while chunk := file_fh.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    except OSError:
+        return None
+    digests[index_key] = [inode.stat.st_size, inode.stat.st_mtime_ns, digest.hexdigest()]
+    return digest.hexdigest()
+
+
+def _is_current(entry: list[int | str] | None, inode: _Inode) -> TypeGuard[list[int | str]]:
+    return entry is not None and entry[:2] == [inode.stat.st_size, inode.stat.st_mtime_ns]
+
+
+def _link(source: Path, target: Path) -> bool:
+    temporary: Final[Path] = target.with_name(f".{target.name}.pipx-dedupe")
+    try:
+        temporary.hardlink_to(source)
+        temporary.replace(target)
+    except OSError as error:
+        # a filesystem without hardlinks, or a file at its link limit, simply keeps its own copy
+        _LOGGER.debug("Unable to link %s to %s: %s", target, source, error)
+        with suppress(OSError):
+            temporary.unlink()
+        return False
+    return True
+
+
+def _environment(venv_container: VenvContainer, path: Path) -> str:
+    return path.relative_to(venv_container.root).parts[0]
+
+
+def _index_key(key: _InodeKey) -> str:
+    return f"{key[0]}:{key[1]}"
+
+
+def _format_size(size: int) -> str:
+    if size < _KIB:
+        return f"{size} bytes"
+    value = size / _KIB
+    for unit in _SIZE_UNITS[:-1]:
+        if value < _KIB:
+            return f"{value:.1f} {unit}"
+        value /= _KIB
+    return f"{value:.1f} {_SIZE_UNITS[-1]}"
+
+
+def _read_index(index_path: Path) -> dict[str, list[int | str]]:
+    """Digests from earlier runs, keyed by device and inode and valid while the size and mtime still match."""
+    try:
+        with index_path.open("rb") as index_fh:
+            payload = json.load(index_fh)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != _DEDUPE_INDEX_VERSION:
+        return {}
+    files = payload.get("files")
+    if not isinstance(files, dict):
+        return {}
+    return {
+        key: entry
+        for key, entry in files.items()
+        if isinstance(entry, list) and [type(value) for value in entry] == [int, int, str]
+    }
+
+
+def _write_index(index_path: Path, digests: dict[str, list[int | str]]) -> None:
+    try:
+        replace_json({"version": _DEDUPE_INDEX_VERSION, "files": digests}, index_path)
+    except OSError as exc:
+        # without the index the next run hashes every candidate again
+        _LOGGER.debug("Unable to write %s: %s", index_path, exc)
+
+
+__all__ = [
+    "DEDUPE_INDEX_FILENAME",
+    "DedupeData",
+    "dedupe",
+]
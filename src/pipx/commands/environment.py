@@ -4,8 +4,8 @@ import os
 from functools import cache
 from typing import TYPE_CHECKING, Final
 
-from pipx import paths
-from pipx.backends import env_default_backend, find_uv_binary, resolve_backend_name
+from pipx import backends, paths
+from pipx.backends import env_default_backend, resolve_backend_name
 from pipx.constants import EXIT_CODE_OK, ExitCode
 from pipx.emojis import EMOJI_SUPPORT
 from pipx.interpreter import get_default_python
@@ -13,6 +13,7 @@ from pipx.shared_libs import (
     DISABLE_SHARED_LIBS_AUTO_UPGRADE,
     shared_libs_auto_upgrade_disabled,
 )
+from pipx.trace import PIPX_TRACE
 from pipx.util import PipxError
 
 if TYPE_CHECKING:
@@ -34,6 +35,9 @@ ENVIRONMENT_VARIABLES: Final = [
     "PIPX_FETCH_PYTHON",
     DISABLE_SHARED_LIBS_AUTO_UPGRADE,
     "PIPX_USE_EMOJI",
+    "PIPX_RUN_CACHE_MAX_ENTRIES",
+    "PIPX_RUN_CACHE_MAX_SIZE",
+    PIPX_TRACE,
 ]
 DERIVED_ENVIRONMENT_VARIABLES: Final = [
     "PIPX_LOCAL_VENVS",
@@ -68,7 +72,7 @@ def _get_derived_values() -> dict[str, Callable[[], object]]:
         "PIPX_DEFAULT_PYTHON": get_default_python,
         "PIPX_RESOLVED_BACKEND": lambda: resolve_backend()[0],
         "PIPX_BACKEND_SOURCE": lambda: resolve_backend()[1],
-        "PIPX_UV_BINARY": lambda: str(binary) if (binary := find_uv_binary()[0]) else "",
+        "PIPX_UV_BINARY": lambda: str(binary) if (binary := backends.find_uv_binary()[0]) else "",
         "UV_CACHE_DIR": lambda: os.environ.get("UV_CACHE_DIR", ""),
         DISABLE_SHARED_LIBS_AUTO_UPGRADE: lambda: str(shared_libs_auto_upgrade_disabled()).lower(),
         "PIPX_USE_EMOJI": lambda: str(EMOJI_SUPPORT).lower(),
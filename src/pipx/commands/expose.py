@@ -5,10 +5,11 @@ from enum import Enum
 from typing import TYPE_CHECKING, Final
 
 from pipx import paths
-from pipx.commands.common import expose_package_resources
+from pipx.commands.common import RESOURCE_EXPOSURE_LOCK, expose_package_resources
 from pipx.commands.uninstall import _get_venv_resource_paths
 from pipx.constants import COMPLETION_SECTIONS, MAN_SECTIONS, ExitCode
 from pipx.result import OperationData, OperationError, OperationResult, OutputLevel, OutputMessage, OutputStream
+from pipx.trace import span
 from pipx.util import safe_unlink
 from pipx.venv import Venv
 
@@ -45,6 +46,18 @@ def _set_exposure(
         status = _ExposureStatus.EXPOSED if enabled else _ExposureStatus.UNEXPOSED
         return _success(command, venv.name, status, f"{venv.name}: already {status.value}")
 
+    with span(command[0], "expose", package=venv.name), RESOURCE_EXPOSURE_LOCK:
+        return _apply_exposure(command, venv, local_bin_dir, local_man_dir, enabled=enabled)
+
+
+def _apply_exposure(
+    command: tuple[str, ...],
+    venv: Venv,
+    local_bin_dir: Path,
+    local_man_dir: Path,
+    *,
+    enabled: bool,
+) -> OperationResult[ExposureData]:
     if enabled:
         attempted: Final[int] = sum(
             len(package_metadata.app_paths_to_expose)
@@ -61,6 +61,7 @@ def inject_dep(  # ruff:ignore[too-many-arguments, too-many-locals]  # inject re
     backend: str | None = None,
     env_backend: str | None = None,
     cooldown_days: int | None = None,
+    already_installed: bool = False,
     emit_output: bool = True,
 ) -> OperationResult[InjectionData]:
     _LOGGER.debug("Injecting package %s", package_spec)
@@ -110,7 +111,12 @@ def inject_dep(  # ruff:ignore[too-many-arguments, too-many-locals]  # inject re
     assert_not_pip_under_uv(canonicalize_name(package_name), venv.backend_name)
 
     is_main_package = canonicalize_name(package_name) == canonicalize_name(venv.main_package_name)
-    if not force and venv.has_package(package_name) and (not is_main_package or not get_extras(package_spec)):
+    if (
+        not force
+        and not already_installed
+        and venv.has_package(package_name)
+        and (not is_main_package or not get_extras(package_spec))
+    ):
         _LOGGER.info("Package %s is already installed", package_name)
         return _finish_inject(
             OperationResult(
@@ -164,6 +170,7 @@ def inject_dep(  # ruff:ignore[too-many-arguments, too-many-locals]  # inject re
             suffix=venv_suffix,
             pinned=pinned,
             cooldown_days=cooldown_days,
+            already_installed=already_installed,
         )
         if include_apps:
             messages.extend(
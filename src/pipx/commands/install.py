@@ -2,15 +2,20 @@ from __future__ import annotations
 
 import json
 import re
-import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass, replace
+from functools import partial
 from typing import TYPE_CHECKING, Final
 
 from packaging.utils import canonicalize_name
 
-from pipx import commands, paths
+from pipx import paths
+from pipx.animate import animations_paused
 from pipx.backends import PIP
 from pipx.commands.common import (
+    _batched_injections,
+    _unbatched_message,
     expose_package_resources,
     get_expected_venv_resource_paths,
     locked_package_message,
@@ -19,6 +24,7 @@ from pipx.commands.common import (
     validate_expected_apps,
     validate_suffix,
 )
+from pipx.commands.inject import inject, inject_dep
 from pipx.commands.transaction import preserve_venv
 from pipx.constants import (
     EXIT_CODE_OK,
@@ -42,16 +48,18 @@ from pipx.result import (
     render_result,
 )
 from pipx.script import script_name_from_spec
-from pipx.util import PipxError, pipx_wrap, rmdir
+from pipx.util import PipxError, map_in_context, pipx_wrap, rmdir
 from pipx.venv import Venv, VenvContainer
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Callable, Iterator, Sequence
     from pathlib import Path
 
     from filelock import BaseFileLock
     from packaging.specifiers import SpecifierSet
 
+    from pipx.commands.inject import InjectionData
+
 _PYLOCK_NAME_RE: Final[re.Pattern[str]] = re.compile(r"pylock(?:\.[^.]+)?\.toml")
 
 
@@ -86,6 +94,7 @@ def install(  # ruff:ignore[too-many-arguments, too-many-positional-arguments, t
     fetch_python: FetchPythonOptions = FetchPythonOptions.NEVER,
     replace_expected_apps: bool = False,
     replace_lock: bool = False,
+    injected_requirements: Sequence[str] = (),
     emit_output: bool = True,
 ) -> OperationResult[InstallData]:
     validate_suffix(suffix)
@@ -230,6 +239,8 @@ def install(  # ruff:ignore[too-many-arguments, too-many-positional-arguments, t
                         expected_apps=required_apps,
                         lock_file=required_lock,
                         cooldown_days=required_cooldown,
+                        # a locked environment takes no injections, and a lock fixes the whole dependency set anyway
+                        injected_requirements=tuple(injected_requirements) if required_lock is None else (),
                     )
                     venv = _install_on_supported_python(
                         venv,
@@ -635,75 +646,181 @@ def install_all(  # ruff:ignore[too-many-arguments, too-many-positional-argument
     backend: str | None = None,
     env_backend: str | None = None,
     cooldown_days: int | None = None,
+    jobs: int = 1,
 ) -> ExitCode:
-    venv_container: Final[VenvContainer] = VenvContainer(paths.ctx.venvs)
+    venv_metadata_entries: Final[tuple[PipxMetadata, ...]] = tuple(extract_venv_metadata(spec_metadata_file))
+    restore_one: Final[Callable[[PipxMetadata], _RestoredEnvironment]] = partial(
+        _install_all_entry,
+        VenvContainer(paths.ctx.venvs),
+        local_bin_dir=local_bin_dir,
+        local_man_dir=local_man_dir,
+        python=python,
+        pip_args=pip_args,
+        venv_args=venv_args,
+        verbose=verbose,
+        force=force,
+        backend=backend,
+        env_backend=env_backend,
+        cooldown_days=cooldown_days,
+    )
     failed: Final[list[str]] = []
     installed: Final[list[str]] = []
 
-    for venv_metadata in extract_venv_metadata(spec_metadata_file):
-        main_package = venv_metadata.main_package
-        venv_dir = venv_container.get_venv_dir(f"{main_package.package}{main_package.suffix}")
-        try:
-            with venv_container.venv_lock(venv_dir) as venv_lock:
-                package_cooldown = _resolve_cooldown(
-                    main_package.lock_file,
-                    cooldown_days,
-                    main_package.cooldown_days,
-                    modifies_existing=False,
+    with ExitStack() as stack:
+        outcomes: Iterator[_RestoredEnvironment]
+        if jobs > 1 and len(venv_metadata_entries) > 1:
+            stack.enter_context(animations_paused())
+            executor: ThreadPoolExecutor = stack.enter_context(
+                ThreadPoolExecutor(max_workers=min(jobs, len(venv_metadata_entries)))
+            )
+            # map yields in spec-file order, so each entry is reported once it and every entry before it finished
+            outcomes = map_in_context(executor, restore_one, venv_metadata_entries)
+        else:
+            outcomes = map(restore_one, venv_metadata_entries)
+        for outcome in outcomes:
+            render_messages(outcome.messages, quiet=0)
+            (failed if outcome.failed else installed).append(outcome.environment)
+    if not installed:
+        print(  # ruff:ignore[print]  # user-facing CLI output
+            f"No packages installed after running 'pipx install-all {spec_metadata_file}' {sleep}"
+        )
+    if failed:
+        msg = f"The following package(s) failed to install: {', '.join(failed)}"
+        raise PipxError(msg)
+    return EXIT_CODE_OK
+
+
+def _install_all_entry(  # ruff:ignore[too-many-arguments]  # forwards the shared install-all context to each worker
+    venv_container: VenvContainer,
+    venv_metadata: PipxMetadata,
+    *,
+    local_bin_dir: Path,
+    local_man_dir: Path,
+    python: str | None,
+    pip_args: list[str],
+    venv_args: list[str],
+    verbose: bool,
+    force: bool,
+    backend: str | None,
+    env_backend: str | None,
+    cooldown_days: int | None,
+) -> _RestoredEnvironment:
+    main_package: Final[PackageInfo] = venv_metadata.main_package
+    venv_dir: Final[Path] = venv_container.get_venv_dir(f"{main_package.package}{main_package.suffix}")
+    messages: Final[list[OutputMessage]] = []
+    try:  # ruff:ignore[too-many-statements-in-try-clause]  # one PipxError handler must cover the install and every injection
+        with venv_container.venv_lock(venv_dir) as venv_lock:
+            package_cooldown = _resolve_cooldown(
+                main_package.lock_file,
+                cooldown_days,
+                main_package.cooldown_days,
+                modifies_existing=False,
+            )
+            batched: dict[str, str] = (
+                {}
+                if main_package.lock_file is not None
+                else _batched_injections(
+                    venv_metadata.injected_packages,
+                    generate_package_spec,
+                    main_pip_args=main_package.pip_args,
+                    main_cooldown_days=package_cooldown,
+                    cooldown_days=cooldown_days,
                 )
-                install(
-                    venv_dir,
-                    None,
-                    [generate_package_spec(main_package)],
-                    local_bin_dir,
-                    local_man_dir,
-                    python or get_python_interpreter(venv_metadata.source_interpreter),
-                    pip_args,
-                    venv_args,
-                    verbose=verbose,
-                    force=force,
-                    reinstall=False,
-                    include_dependencies=main_package.include_dependencies,
-                    include_resources_from=main_package.include_resources_from,
-                    preinstall_packages=[],
-                    expected_apps=main_package.expected_apps,
-                    lock_file=main_package.lock_file,
-                    suffix=main_package.suffix,
-                    backend=backend or venv_metadata.backend,
-                    env_backend=env_backend,
-                    exposure_enabled=venv_metadata.exposure_enabled,
-                    replace_expected_apps=True,
-                    replace_lock=True,
-                    venv_lock=venv_lock,
-                    cooldown_days=package_cooldown,
+            )
+            install_main = partial(
+                install,
+                venv_dir,
+                None,
+                [generate_package_spec(main_package)],
+                local_bin_dir,
+                local_man_dir,
+                python or _source_interpreter(venv_metadata.source_interpreter, messages),
+                pip_args,
+                venv_args,
+                verbose=verbose,
+                force=force,
+                reinstall=False,
+                include_dependencies=main_package.include_dependencies,
+                include_resources_from=main_package.include_resources_from,
+                preinstall_packages=[],
+                expected_apps=main_package.expected_apps,
+                lock_file=main_package.lock_file,
+                suffix=main_package.suffix,
+                backend=backend or venv_metadata.backend,
+                env_backend=env_backend,
+                exposure_enabled=venv_metadata.exposure_enabled,
+                replace_expected_apps=True,
+                replace_lock=True,
+                venv_lock=venv_lock,
+                cooldown_days=package_cooldown,
+                emit_output=False,
+            )
+            installed = install_main(injected_requirements=tuple(batched.values()))
+            if installed.errors and batched:
+                # a conflicting or unresolvable injected package must not sink the main package, inject each one alone
+                messages.append(OutputMessage(_unbatched_message(batched, venv_dir.name), stream=OutputStream.STDERR))
+                batched = {}
+                installed = install_main()
+            _collect_entry_messages(installed, messages)
+            # an existing venv left alone without --force skipped the shared install too
+            rebuilt: Final[bool] = bool(installed.data.packages)
+            for name, inject_package in venv_metadata.injected_packages.items():
+                # inject() widens include_apps the same way, so a package exposes the same apps on either path
+                include_apps = (
+                    inject_package.include_apps
+                    or inject_package.include_dependencies
+                    or bool(inject_package.include_resources_from)
                 )
-                for inject_package in venv_metadata.injected_packages.values():
-                    commands.inject(
+                if rebuilt and name in batched:
+                    injected = inject_dep(
+                        venv_dir,
+                        name,
+                        generate_package_spec(inject_package),
+                        pip_args,
+                        verbose=verbose,
+                        include_apps=include_apps,
+                        include_dependencies=inject_package.include_dependencies,
+                        include_resources_from=inject_package.include_resources_from,
+                        force=force,
+                        suffix=inject_package.suffix == main_package.suffix,
+                        cooldown_days=_injection_cooldown(inject_package, cooldown_days),
+                        already_installed=True,
+                        emit_output=False,
+                    )
+                else:
+                    injected = inject(
                         venv_dir=venv_dir,
                         package_specs=[generate_package_spec(inject_package)],
                         requirement_files=[],
                         pip_args=pip_args,
                         verbose=verbose,
-                        include_apps=inject_package.include_apps,
+                        include_apps=include_apps,
                         include_dependencies=inject_package.include_dependencies,
                         include_resources_from=inject_package.include_resources_from,
                         force=force,
                         suffix=inject_package.suffix == main_package.suffix,
-                        cooldown_days=(cooldown_days if cooldown_days is not None else inject_package.cooldown_days),
+                        cooldown_days=_injection_cooldown(inject_package, cooldown_days),
+                        emit_output=False,
                     )
-        except PipxError as error:
-            print(error, file=sys.stderr)  # ruff:ignore[print]  # user-facing CLI output
-            failed.append(venv_dir.name)
-        else:
-            installed.append(venv_dir.name)
-    if not installed:
-        print(  # ruff:ignore[print]  # user-facing CLI output
-            f"No packages installed after running 'pipx install-all {spec_metadata_file}' {sleep}"
-        )
-    if failed:
-        msg = f"The following package(s) failed to install: {', '.join(failed)}"
-        raise PipxError(msg)
-    return EXIT_CODE_OK
+                _collect_entry_messages(injected, messages)
+    except PipxError as error:
+        messages.append(OutputMessage(str(error), stream=OutputStream.STDERR, level=OutputLevel.ERROR))
+        return _RestoredEnvironment(venv_dir.name, tuple(messages), failed=True)
+    return _RestoredEnvironment(venv_dir.name, tuple(messages), failed=False)
+
+
+def _injection_cooldown(inject_package: PackageInfo, cooldown_days: int | None) -> int | None:
+    return cooldown_days if cooldown_days is not None else inject_package.cooldown_days
+
+
+def _collect_entry_messages(
+    result: OperationResult[InstallData] | OperationResult[InjectionData], messages: list[OutputMessage]
+) -> None:
+    # same split as emitting the result directly: a failure keeps the progress lines and raises its first error
+    if result.errors:
+        messages.extend(message for message in result.messages if message.level is OutputLevel.NORMAL)
+        raise PipxError(result.errors[0].message)
+    messages.extend(result.messages)
 
 
 def extract_venv_metadata(spec_metadata_file: Path) -> Iterator[PipxMetadata]:
@@ -743,21 +860,36 @@ def get_python_interpreter(
     source_interpreter: Path | None,
 ) -> str | None:
     """Get appropriate python interpreter."""
+    messages: Final[list[OutputMessage]] = []
+    interpreter: Final[str | None] = _source_interpreter(source_interpreter, messages)
+    render_messages(tuple(messages), quiet=0)
+    return interpreter
+
+
+def _source_interpreter(source_interpreter: Path | None, messages: list[OutputMessage]) -> str | None:
     if source_interpreter is not None and source_interpreter.is_file():
         return str(source_interpreter)
 
-    print(  # ruff:ignore[print]  # user-facing CLI output
-        pipx_wrap(
-            f"""
-            The exported python interpreter '{source_interpreter}' is ignored
-            as not found.
-            """
+    messages.append(
+        OutputMessage(
+            pipx_wrap(
+                f"""
+                The exported python interpreter '{source_interpreter}' is ignored
+                as not found.
+                """
+            )
         )
     )
-
     return None
 
 
+@dataclass(frozen=True)
+class _RestoredEnvironment:
+    environment: str
+    messages: tuple[OutputMessage, ...]
+    failed: bool
+
+
 @dataclass(frozen=True)
 class _InstalledPackage:
     environment: str
@@ -813,6 +945,7 @@ class _EnvironmentBuild:
     expected_apps: tuple[str, ...]
     lock_file: Path | None
     cooldown_days: int | None
+    injected_requirements: tuple[str, ...]
 
     def run(self, venv: Venv) -> None:
         venv.create_venv(self.venv_args, self.pip_args, override_shared=self.override_shared)
@@ -833,6 +966,7 @@ class _EnvironmentBuild:
             expected_apps=self.expected_apps,
             lock_file=self.lock_file,
             cooldown_days=self.cooldown_days,
+            with_requirements=self.injected_requirements,
         )
 
 
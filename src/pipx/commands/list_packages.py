@@ -3,39 +3,44 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from pipx import paths
 from pipx.colors import bold
-from pipx.commands.common import VenvProblems, get_venv_summary, venv_health_check
+from pipx.commands.common import VenvProblems, get_venv_summary, metadata_health_check
 from pipx.constants import EXIT_CODE_LIST_PROBLEM, EXIT_CODE_OK, ExitCode
 from pipx.emojis import sleep
-from pipx.pipx_metadata_file import JsonEncoderHandlesPath, PipxMetadata
-from pipx.venv import Venv, VenvContainer
+from pipx.pipx_metadata_file import JsonEncoderHandlesPath, PipxMetadata, PipxMetadataIndex
 
 if TYPE_CHECKING:
     from collections.abc import Collection, Iterable
     from pathlib import Path
 
+    from pipx.venv import VenvContainer
+
 logger = logging.getLogger(__name__)
 
 PIPX_SPEC_VERSION = "0.1"
 
 
-def get_venv_metadata_summary(venv_dir: Path) -> tuple[PipxMetadata, VenvProblems, str]:
-    venv = Venv(venv_dir)
+def get_venv_metadata_summary(
+    venv_dir: Path, pipx_metadata: PipxMetadata | None = None
+) -> tuple[PipxMetadata, VenvProblems, str]:
+    venv_metadata: Final[PipxMetadata] = pipx_metadata if pipx_metadata is not None else PipxMetadata(venv_dir)
 
-    (venv_problems, warning_message) = venv_health_check(venv)
+    (venv_problems, warning_message) = metadata_health_check(venv_dir, venv_metadata)
     if venv_problems.any_():
         return (PipxMetadata(venv_dir, read=False), venv_problems, warning_message)
 
-    return (venv.pipx_metadata, venv_problems, "")
+    return (venv_metadata, venv_problems, "")
 
 
-def list_short(venv_dirs: Iterable[Path]) -> VenvProblems:
+def list_short(venv_dirs: Iterable[Path], metadata_index: PipxMetadataIndex) -> VenvProblems:
     all_venv_problems = VenvProblems()
     for venv_dir in venv_dirs:
-        venv_metadata, venv_problems, warning_str = get_venv_metadata_summary(venv_dir)
+        venv_metadata, venv_problems, warning_str = get_venv_metadata_summary(
+            venv_dir, metadata_index.metadata(venv_dir)
+        )
         if venv_problems.any_():
             logger.warning(warning_str)
         else:
@@ -48,7 +53,9 @@ def list_short(venv_dirs: Iterable[Path]) -> VenvProblems:
     return all_venv_problems
 
 
-def list_text(venv_dirs: Iterable[Path], venv_root_dir: str, *, include_injected: bool) -> VenvProblems:
+def list_text(
+    venv_dirs: Iterable[Path], venv_root_dir: str, metadata_index: PipxMetadataIndex, *, include_injected: bool
+) -> VenvProblems:
     print(f"venvs are in {bold(venv_root_dir)}")  # ruff:ignore[print]  # user-facing CLI output
     print(f"apps are exposed on your $PATH at {bold(str(paths.ctx.bin_dir))}")  # ruff:ignore[print]  # user-facing CLI output
     print(f"manual pages are exposed at {bold(str(paths.ctx.man_dir))}")  # ruff:ignore[print]  # user-facing CLI output
@@ -58,7 +65,9 @@ def list_text(venv_dirs: Iterable[Path], venv_root_dir: str, *, include_injected
 
     all_venv_problems = VenvProblems()
     for venv_dir in venv_dirs:
-        package_summary, venv_problems = get_venv_summary(venv_dir, include_injected=include_injected)
+        package_summary, venv_problems = get_venv_summary(
+            venv_dir, include_injected=include_injected, pipx_metadata=metadata_index.metadata(venv_dir)
+        )
         if venv_problems.any_():
             logger.warning(package_summary)
         else:
@@ -68,7 +77,7 @@ def list_text(venv_dirs: Iterable[Path], venv_root_dir: str, *, include_injected
     return all_venv_problems
 
 
-def list_json(venv_dirs: Iterable[Path]) -> VenvProblems:
+def list_json(venv_dirs: Iterable[Path], metadata_index: PipxMetadataIndex) -> VenvProblems:
     warning_messages = []
     spec_metadata: dict[str, Any] = {
         "pipx_spec_version": PIPX_SPEC_VERSION,
@@ -76,7 +85,9 @@ def list_json(venv_dirs: Iterable[Path]) -> VenvProblems:
     }
     all_venv_problems = VenvProblems()
     for venv_dir in venv_dirs:
-        (venv_metadata, venv_problems, warning_str) = get_venv_metadata_summary(venv_dir)
+        (venv_metadata, venv_problems, warning_str) = get_venv_metadata_summary(
+            venv_dir, metadata_index.metadata(venv_dir)
+        )
         all_venv_problems.or_(venv_problems)
         if venv_problems.any_():
             warning_messages.append(warning_str)
@@ -94,10 +105,14 @@ def list_json(venv_dirs: Iterable[Path]) -> VenvProblems:
     return all_venv_problems
 
 
-def list_pinned(venv_dirs: Iterable[Path], *, include_injected: bool) -> VenvProblems:
+def list_pinned(
+    venv_dirs: Iterable[Path], metadata_index: PipxMetadataIndex, *, include_injected: bool
+) -> VenvProblems:
     all_venv_problems = VenvProblems()
     for venv_dir in venv_dirs:
-        venv_metadata, venv_problems, warning_str = get_venv_metadata_summary(venv_dir)
+        venv_metadata, venv_problems, warning_str = get_venv_metadata_summary(
+            venv_dir, metadata_index.metadata(venv_dir)
+        )
         if venv_problems.any_():
             logger.warning(warning_str)
         else:
@@ -130,13 +145,20 @@ def list_packages(  # ruff:ignore[too-many-arguments]  # flat CLI-facing list op
     if not venv_dirs:
         print(f"nothing has been installed with pipx {sleep}", file=sys.stderr)  # ruff:ignore[print]  # user-facing CLI output
 
+    # one read of the container index answers every venv whose metadata has not changed since it was indexed
+    metadata_index: Final[PipxMetadataIndex] = PipxMetadataIndex(venv_container.root)
     if json_format:
-        all_venv_problems = list_json(venv_container.iter_locked_venv_dirs(venv_dirs, allow_permission_error=True))
+        all_venv_problems = list_json(
+            venv_container.iter_locked_venv_dirs(venv_dirs, allow_permission_error=True), metadata_index
+        )
     elif short_format:
-        all_venv_problems = list_short(venv_container.iter_locked_venv_dirs(venv_dirs, allow_permission_error=True))
+        all_venv_problems = list_short(
+            venv_container.iter_locked_venv_dirs(venv_dirs, allow_permission_error=True), metadata_index
+        )
     elif pinned_only:
         all_venv_problems = list_pinned(
             venv_container.iter_locked_venv_dirs(venv_dirs, allow_permission_error=True),
+            metadata_index,
             include_injected=include_injected,
         )
     else:
@@ -145,8 +167,10 @@ def list_packages(  # ruff:ignore[too-many-arguments]  # flat CLI-facing list op
         all_venv_problems = list_text(
             venv_container.iter_locked_venv_dirs(venv_dirs, allow_permission_error=True),
             str(venv_container),
+            metadata_index,
             include_injected=include_injected,
         )
+    metadata_index.save()
 
     if all_venv_problems.bad_venv_name:
         logger.warning(
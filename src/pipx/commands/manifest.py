@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import subprocess
 import sys
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, time
+from functools import partial
 from importlib import import_module
 from pathlib import Path
 from shutil import copy2, which
@@ -14,8 +18,11 @@ from typing import TYPE_CHECKING, Final, TypeAlias, cast
 from packaging.requirements import InvalidRequirement, Requirement
 from packaging.utils import canonicalize_name
 
+from pipx.animate import animations_paused
+from pipx.commands.common import add_suffix
 from pipx.commands.expose import expose, unexpose
 from pipx.commands.install import install
+from pipx.commands.reinstall import _get_reinstall_resource_paths
 from pipx.commands.uninstall import uninstall
 from pipx.constants import EXIT_CODE_OK, ExitCode
 from pipx.pipx_metadata_file import PipxMetadata
@@ -27,15 +34,16 @@ from pipx.result import (
     OutputMessage,
     OutputStream,
 )
-from pipx.util import PipxError
+from pipx.util import PipxError, get_venv_paths, map_in_context
+from pipx.venv import Venv, VenvContainer
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     if sys.version_info >= (3, 11):
         import tomllib
     else:
         import tomli as tomllib
-
-    from pipx.venv import VenvContainer
 else:
     tomllib = import_module("tomli" if sys.version_info < (3, 11) else "tomllib")
 
@@ -51,70 +59,204 @@ def sync_manifest(  # ruff:ignore[too-many-arguments]  # manifest sync forwards
     prune: bool,
     backend: str | None,
     env_backend: str | None,
+    jobs: int = 1,
 ) -> OperationResult[ManifestData]:
     manifest = _load_manifest(manifest_file, require_locks=True)
+    sync_tool: Final[Callable[[_ManifestTool], _ToolSync]] = partial(
+        _sync_tool,
+        venv_container,
+        local_bin_dir=local_bin_dir,
+        local_man_dir=local_man_dir,
+        python=python,
+        verbose=verbose,
+        backend=backend,
+        env_backend=env_backend,
+    )
+    plan: Final[tuple[tuple[_ManifestTool, ...], ...]] = _plan_sync(manifest.tools)
+    outcomes: Final[dict[str, _ToolSync]] = {}
+    if jobs > 1 and len(plan) > 1:
+        with animations_paused(), ThreadPoolExecutor(max_workers=min(jobs, len(plan))) as executor:
+            for chain_outcomes in map_in_context(executor, partial(_sync_chain, sync_tool), plan):
+                outcomes.update((outcome.environment, outcome) for outcome in chain_outcomes)
+    else:
+        outcomes.update((tool.environment, sync_tool(tool)) for tool in manifest.tools)
+
     failures: list[_FailedTool] = []
     messages: list[OutputMessage] = []
     synced: list[str] = []
+    unchanged: list[str] = []
+    # report in manifest order whichever chain finished first
     for tool in manifest.tools:
-        venv_dir = venv_container.get_venv_dir(tool.environment)
-        with venv_container.venv_lock(venv_dir) as venv_lock:
-            existed = venv_dir.is_dir()
-            was_exposed = existed and PipxMetadata(venv_dir).exposure_enabled
-            if was_exposed:
-                unexpose(venv_dir, local_bin_dir, local_man_dir, verbose=verbose)
-            try:
-                outcome = install(
-                    venv_dir,
-                    [tool.package_name],
-                    [tool.package],
-                    local_bin_dir,
-                    local_man_dir,
-                    python,
-                    [],
-                    [],
-                    verbose=verbose,
-                    force=existed,
-                    reinstall=False,
-                    include_dependencies=tool.include_dependencies,
-                    include_resources_from=tool.include_resources_from,
-                    preinstall_packages=None,
-                    expected_apps=tool.apps,
-                    lock_file=tool.lock_file,
-                    suffix=tool.suffix,
-                    backend=backend,
-                    env_backend=env_backend,
-                    exposure_enabled=tool.expose,
-                    preserve_existing=True,
-                    replace_expected_apps=True,
-                    replace_lock=True,
-                    venv_lock=venv_lock,
-                    emit_output=False,
-                )
-                error_message = outcome.errors[0].message if outcome.errors else None
-            except PipxError as error:
-                error_message = str(error)
-            # install returns a failed result rather than raising when it does not render, so check both
-            if error_message is not None:
-                failures.append(_FailedTool(tool.environment, error_message))
-                messages.append(OutputMessage(error_message, stream=OutputStream.STDERR, level=OutputLevel.ERROR))
-                if was_exposed:
-                    expose(venv_dir, local_bin_dir, local_man_dir, verbose=verbose)
-            else:
-                synced.append(tool.environment)
+        outcome = outcomes[tool.environment]
+        if outcome.error is not None:
+            failures.append(_FailedTool(tool.environment, outcome.error))
+            messages.append(OutputMessage(outcome.error, stream=OutputStream.STDERR, level=OutputLevel.ERROR))
+        elif outcome.unchanged:
+            unchanged.append(tool.environment)
+            messages.append(OutputMessage(f"{tool.environment} is unchanged", stream=OutputStream.LOG))
+        else:
+            synced.append(tool.environment)
 
     if prune and not failures:
         messages.extend(_prune_environments(manifest, venv_container, local_bin_dir, local_man_dir, verbose=verbose))
     return OperationResult(
         command=("manifest", "sync"),
-        data=ManifestData(environments=tuple(synced), locks=()),
+        data=ManifestData(environments=tuple(synced), locks=(), unchanged=tuple(unchanged)),
         messages=tuple(messages),
         exit_code=ExitCode(1) if failures else EXIT_CODE_OK,
         errors=tuple(
             OperationError(code="manifest_sync_failed", message=f.error, environment=f.environment) for f in failures
         ),
-        succeeded=bool(synced),
+        succeeded=bool(synced or unchanged),
+    )
+
+
+def _plan_sync(tools: Sequence[_ManifestTool]) -> tuple[tuple[_ManifestTool, ...], ...]:
+    # tools exposing the same app would race for one bin entry, so they share a chain that runs in manifest order;
+    # every other tool has its own venv, lock file, and resources, and can sync alongside the rest
+    chain_of: Final[list[int]] = list(range(len(tools)))
+    app_owner: Final[dict[str, int]] = {}
+    for index, tool in enumerate(tools):
+        for app in _planned_apps(tool):
+            owner = app_owner.setdefault(app, index)
+            old_chain, new_chain = chain_of[index], chain_of[owner]
+            chain_of[:] = [new_chain if chain == old_chain else chain for chain in chain_of]
+    chains: Final[dict[int, list[_ManifestTool]]] = {}
+    for index, tool in enumerate(tools):
+        chains.setdefault(chain_of[index], []).append(tool)
+    return tuple(tuple(chain) for chain in chains.values())
+
+
+def _planned_apps(tool: _ManifestTool) -> tuple[str, ...]:
+    if tool.apps and not tool.include_dependencies and not tool.include_resources_from:
+        return tuple(add_suffix(app, tool.suffix) for app in tool.apps)
+    # which apps the tool exposes is only known once it is installed, so every such tool shares the one chain that
+    # the empty name, which no app can have, stands for
+    return ("",)
+
+
+def _sync_chain(
+    sync_tool: Callable[[_ManifestTool], _ToolSync], chain: Sequence[_ManifestTool]
+) -> tuple[_ToolSync, ...]:
+    return tuple(map(sync_tool, chain))
+
+
+def _sync_tool(  # ruff:ignore[too-many-arguments]  # forwards the shared sync context to each worker
+    venv_container: VenvContainer,
+    tool: _ManifestTool,
+    *,
+    local_bin_dir: Path,
+    local_man_dir: Path,
+    python: str,
+    verbose: bool,
+    backend: str | None,
+    env_backend: str | None,
+) -> _ToolSync:
+    venv_dir = venv_container.get_venv_dir(tool.environment)
+    tool_digest: Final[Callable[[PipxMetadata], str | None]] = partial(
+        _tool_digest,
+        tool,
+        venv_dir,
+        local_bin_dir=local_bin_dir,
+        local_man_dir=local_man_dir,
+        python=python,
+        backend=backend,
     )
+    with venv_container.venv_lock(venv_dir) as venv_lock:
+        existed = venv_dir.is_dir()
+        metadata = PipxMetadata(venv_dir, read=existed)
+        if (
+            metadata.manifest_digest is not None
+            and metadata.manifest_digest == tool_digest(metadata)
+            and get_venv_paths(venv_dir)[1].is_file()
+        ):
+            return _ToolSync(tool.environment, None, unchanged=True)
+        was_exposed = existed and metadata.exposure_enabled
+        if was_exposed:
+            unexpose(venv_dir, local_bin_dir, local_man_dir, verbose=verbose)
+        try:
+            outcome = install(
+                venv_dir,
+                [tool.package_name],
+                [tool.package],
+                local_bin_dir,
+                local_man_dir,
+                python,
+                [],
+                [],
+                verbose=verbose,
+                force=existed,
+                reinstall=False,
+                include_dependencies=tool.include_dependencies,
+                include_resources_from=tool.include_resources_from,
+                preinstall_packages=None,
+                expected_apps=tool.apps,
+                lock_file=tool.lock_file,
+                suffix=tool.suffix,
+                backend=backend,
+                env_backend=env_backend,
+                exposure_enabled=tool.expose,
+                preserve_existing=True,
+                replace_expected_apps=True,
+                replace_lock=True,
+                venv_lock=venv_lock,
+                emit_output=False,
+            )
+            error_message = outcome.errors[0].message if outcome.errors else None
+        except PipxError as error:
+            error_message = str(error)
+        # install returns a failed result rather than raising when it does not render, so check both
+        if error_message is None:
+            metadata = PipxMetadata(venv_dir)
+            if (digest := tool_digest(metadata)) != metadata.manifest_digest:
+                metadata.manifest_digest = digest
+                metadata.write()
+        elif was_exposed:
+            expose(venv_dir, local_bin_dir, local_man_dir, verbose=verbose)
+    return _ToolSync(tool.environment, error_message)
+
+
+def _tool_digest(  # ruff:ignore[too-many-arguments]  # every sync input that decides whether the backend must run
+    tool: _ManifestTool,
+    venv_dir: Path,
+    metadata: PipxMetadata,
+    *,
+    local_bin_dir: Path,
+    local_man_dir: Path,
+    python: str,
+    backend: str | None,
+) -> str | None:
+    # the backend re-resolves unlocked specs on every sync, so only a locked tool has a state worth remembering
+    if tool.lock_file is None:
+        return None
+    try:
+        lock_digest = hashlib.sha256(tool.lock_file.read_bytes()).hexdigest()
+    except OSError:
+        return None
+    try:
+        # the interpreter the venv was built on, so recreating it on another Python is a change too
+        pyvenv_digest = hashlib.sha256((venv_dir / "pyvenv.cfg").read_bytes()).hexdigest()
+    except OSError:
+        return None
+    venv: Final[Venv] = Venv(venv_dir, python=python, pipx_metadata=metadata)
+    state: Final[dict[str, object]] = {
+        "package": tool.package,
+        "suffix": tool.suffix,
+        "apps": tool.apps,
+        "include_dependencies": tool.include_dependencies,
+        "include_resources_from": tool.include_resources_from,
+        "expose": tool.expose,
+        "lock": lock_digest,
+        "package_version": metadata.main_package.package_version,
+        # expose and unexpose change the venv's resources without going through the manifest
+        "exposed": sorted(str(path) for path in _get_reinstall_resource_paths(venv, local_bin_dir, local_man_dir)),
+        "pyvenv": pyvenv_digest,
+        "interpreter": which(python) or python,
+        "backend": backend,
+        "bin_dir": str(local_bin_dir),
+        "man_dir": str(local_man_dir),
+    }
+    return hashlib.sha256(json.dumps(state, sort_keys=True).encode()).hexdigest()
 
 
 def lock_manifest(manifest_file: Path) -> OperationResult[ManifestData]:
@@ -462,6 +604,13 @@ _TOOL_KEYS: Final[frozenset[str]] = frozenset({
 })
 
 
+@dataclass(frozen=True)
+class _ToolSync:
+    environment: str
+    error: str | None
+    unchanged: bool = False
+
+
 @dataclass(frozen=True)
 class _FailedTool:
     environment: str
@@ -472,6 +621,7 @@ class _FailedTool:
 class ManifestData(OperationData):
     environments: tuple[str, ...]
     locks: tuple[str, ...]
+    unchanged: tuple[str, ...] = ()
 
 
 __all__ = [
@@ -1,25 +1,39 @@
 from __future__ import annotations
 
+import json
+import logging
+import os
+import time
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from functools import partial
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final, cast
 
 from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
 
+from pipx import paths
+from pipx.backends.pip import PipBackend
 from pipx.constants import ExitCode
 from pipx.package_specifier import extract_index_options, valid_pypi_name
 from pipx.result import OperationData, OperationError, OperationResult, OutputLevel, OutputMessage, OutputStream
-from pipx.util import PipxError
+from pipx.util import PipxError, replace_json
 from pipx.venv import Venv, VenvContainer
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Collection, Sequence
+    from collections.abc import Callable, Collection, Iterable, Sequence
     from pathlib import Path
 
     from pipx.pipx_metadata_file import PackageInfo
 
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
 _MAX_OUTDATED_WORKERS: Final[int] = 8
+OUTDATED_CACHE_FILENAME: Final[str] = "outdated_cache.json"
+OUTDATED_CACHE_MAX_AGE_SEC: Final[float] = 60 * 60
+_OUTDATED_CACHE_VERSION: Final[int] = 1
+# pip settings that pick the index without showing up in the pip arguments pipx passes along
+_INDEX_ENVIRONMENT: Final[tuple[str, ...]] = ("PIP_INDEX_URL", "PIP_EXTRA_INDEX_URL", "PIP_FIND_LINKS", "PIP_NO_INDEX")
 
 
 def list_outdated(
@@ -27,11 +41,13 @@ def list_outdated(
     venv_dirs: Collection[Path],
     *,
     include_injected: bool,
+    refresh: bool = False,
 ) -> OperationResult[OutdatedData]:
     data: Final[OutdatedData] = inspect_outdated(
         venv_container,
         include_injected=include_injected,
         venv_dirs=venv_dirs,
+        refresh=refresh,
     )
     messages: Final[list[OutputMessage]] = [
         OutputMessage(
@@ -75,7 +91,15 @@ def inspect_outdated(  # ruff:ignore[too-many-arguments]  # forwards the full ou
     backend: str | None = None,
     env_backend: str | None = None,
     venv_dirs: Collection[Path] | None = None,
+    cooldown_days: int | None = None,
+    refresh: bool = False,
 ) -> OutdatedData:
+    """Compare every selected package against its index.
+
+    Index answers are kept in :data:`OUTDATED_CACHE_FILENAME` under the pipx cache for
+    :data:`OUTDATED_CACHE_MAX_AGE_SEC`; ``refresh`` asks the index again regardless. ``cooldown_days`` overrides the
+    cooldown each package was installed with, as an upgrade with the same override would.
+    """
     selected_venv_dirs: Final[tuple[Path, ...]] = tuple(
         sorted(
             venv_dir
@@ -91,6 +115,8 @@ def inspect_outdated(  # ruff:ignore[too-many-arguments]  # forwards the full ou
         pip_args=pip_args,
         backend=backend,
         env_backend=env_backend,
+        cooldown_days=cooldown_days,
+        refresh=refresh,
     )
     packages: Final[tuple[_OutdatedPackage, ...]] = tuple(
         sorted(
@@ -127,6 +153,8 @@ def _list_environments_outdated(  # ruff:ignore[too-many-arguments]  # forwards
     pip_args: Sequence[str],
     backend: str | None,
     env_backend: str | None,
+    cooldown_days: int | None,
+    refresh: bool,
 ) -> tuple[_EnvironmentOutdated, ...]:
     if not venv_dirs:
         return ()
@@ -138,11 +166,17 @@ def _list_environments_outdated(  # ruff:ignore[too-many-arguments]  # forwards
         pip_args=pip_args,
         backend=backend,
         env_backend=env_backend,
+        cooldown_days=cooldown_days,
     )
     if len(venv_dirs) == 1:
-        return (check(venv_dirs[0]),)
-    with ThreadPoolExecutor(max_workers=min(_MAX_OUTDATED_WORKERS, len(venv_dirs))) as executor:
-        return tuple(executor.map(check, venv_dirs))
+        checks: tuple[_EnvironmentOutdated, ...] = (check(venv_dirs[0]),)
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_OUTDATED_WORKERS, len(venv_dirs))) as executor:
+            checks = tuple(executor.map(check, venv_dirs))
+    latest_versions: Final[dict[_IndexQuery, _LatestVersion]] = _query_latest_versions(
+        (lookup for environment in checks for lookup in environment.lookups), refresh=refresh
+    )
+    return tuple(_apply_latest_versions(environment, latest_versions) for environment in checks)
 
 
 def _list_environment_outdated(  # ruff:ignore[too-many-arguments]  # forwards the shared outdated-check context for one venv
@@ -154,6 +188,7 @@ def _list_environment_outdated(  # ruff:ignore[too-many-arguments]  # forwards t
     pip_args: Sequence[str],
     backend: str | None,
     env_backend: str | None,
+    cooldown_days: int | None,
 ) -> _EnvironmentOutdated:
     with venv_container.venv_lock(venv_dir):
         if not venv_dir.is_dir():
@@ -163,6 +198,7 @@ def _list_environment_outdated(  # ruff:ignore[too-many-arguments]  # forwards t
             include_injected=include_injected,
             upgradable_only=upgradable_only,
             pip_args=pip_args,
+            cooldown_days=cooldown_days,
         )
 
 
@@ -172,6 +208,7 @@ def _list_venv_outdated(
     include_injected: bool,
     upgradable_only: bool,
     pip_args: Sequence[str],
+    cooldown_days: int | None,
 ) -> _EnvironmentOutdated:
     if not venv.package_metadata:
         return _EnvironmentOutdated(failures=(_FailedEnvironment(venv.name, "Missing internal pipx metadata."),))
@@ -199,15 +236,37 @@ def _list_venv_outdated(
                 canonicalize_name(package_name)
             ] = package_info
 
-    for index_args, package_infos in packages_by_index.items():
-        index_packages, index_failures = _collect_outdated(venv, index_args, package_infos)
-        packages.extend(index_packages)
-        failures.extend(index_failures)
+    lookups: Final[list[_IndexLookup]] = []
+    if isinstance(venv.backend, PipBackend):
+        # the installed versions are already in the metadata, so only the index needs asking, once per project for
+        # every venv on the same Python; venvs without a recorded version share nothing
+        python_key: Final[str] = venv.pipx_metadata.python_version or str(venv.root)
+        lookups.extend(
+            _IndexLookup(
+                _IndexQuery(
+                    python_key,
+                    index_args,
+                    cooldown_days if cooldown_days is not None else package_info.cooldown_days,
+                    name,
+                ),
+                venv,
+                package_info,
+                injected=package_info.package != venv.main_package_name,
+            )
+            for index_args, package_infos in packages_by_index.items()
+            for name, package_info in package_infos.items()
+        )
+    else:
+        for index_args, package_infos in packages_by_index.items():
+            index_packages, index_failures = _collect_outdated(venv, index_args, package_infos)
+            packages.extend(index_packages)
+            failures.extend(index_failures)
     return _EnvironmentOutdated(
         sum(len(package_infos) for package_infos in packages_by_index.values()),
         tuple(packages),
         tuple(skipped),
         tuple(failures),
+        tuple(lookups),
     )
 
 
@@ -235,6 +294,131 @@ def _collect_outdated(
     return packages, []
 
 
+def _query_latest_versions(lookups: Iterable[_IndexLookup], *, refresh: bool) -> dict[_IndexQuery, _LatestVersion]:
+    # the first venv to ask stands in for every venv sharing its Python and index options
+    representatives: Final[dict[_IndexQuery, _IndexLookup]] = {}
+    for lookup in lookups:
+        representatives.setdefault(lookup.query, lookup)
+    if not representatives:
+        return {}
+    cache_file: Final[Path] = paths.ctx.lookup_cache / OUTDATED_CACHE_FILENAME
+    now: Final[float] = time.time()
+    cached: Final[dict[str, dict[str, Any]]] = _read_outdated_cache(cache_file, now)
+    latest_versions: Final[dict[_IndexQuery, _LatestVersion]] = {}
+    pending: Final[dict[_IndexQuery, _IndexLookup]] = {}
+    for query, lookup in representatives.items():
+        if not refresh and (entry := cached.get(_cache_key(query))) is not None:
+            latest_versions[query] = _LatestVersion(entry["latest"])
+        else:
+            pending[query] = lookup
+    if not pending:
+        return latest_versions
+    if len(pending) == 1:
+        fetched: dict[_IndexQuery, _LatestVersion] = {
+            query: _query_latest_version(lookup) for query, lookup in pending.items()
+        }
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_OUTDATED_WORKERS, len(pending))) as executor:
+            fetched = dict(zip(pending, executor.map(_query_latest_version, pending.values()), strict=True))
+    latest_versions.update(fetched)
+    # failures are left out so the next check asks the index again
+    cached.update({
+        _cache_key(query): {"fetched": now, "latest": latest.version}
+        for query, latest in fetched.items()
+        if latest.error is None
+    })
+    _write_outdated_cache(cache_file, cached)
+    return latest_versions
+
+
+def _query_latest_version(lookup: _IndexLookup) -> _LatestVersion:
+    venv: Final[Venv] = lookup.venv
+    try:
+        return _LatestVersion(
+            cast("PipBackend", venv.backend).latest_version(
+                venv_root=venv.root,
+                venv_python=venv.python_path,
+                index_args=[*lookup.query.index_args, *PipBackend.cooldown_args(lookup.query.cooldown_days)],
+                package=lookup.query.package,
+            )
+        )
+    except PipxError as error:
+        return _LatestVersion(None, str(error))
+
+
+def _cache_key(query: _IndexQuery) -> str:
+    return json.dumps([
+        query.python,
+        list(query.index_args),
+        [os.environ.get(name) for name in _INDEX_ENVIRONMENT],
+        query.cooldown_days,
+        query.package,
+    ])
+
+
+def _read_outdated_cache(cache_file: Path, now: float) -> dict[str, dict[str, Any]]:
+    """Unexpired entries of the outdated cache, empty when it is missing, unreadable, or from another pipx."""
+    try:
+        with cache_file.open("rb") as cache_fh:
+            payload = json.load(cache_fh)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != _OUTDATED_CACHE_VERSION:
+        return {}
+    entries = payload.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {
+        key: entry
+        for key, entry in entries.items()
+        if isinstance(entry, dict)
+        and isinstance(fetched := entry.get("fetched"), int | float)
+        and 0 <= now - fetched <= OUTDATED_CACHE_MAX_AGE_SEC
+        and isinstance(entry.get("latest"), str | None)
+    }
+
+
+def _write_outdated_cache(cache_file: Path, entries: dict[str, dict[str, Any]]) -> None:
+    try:
+        replace_json({"version": _OUTDATED_CACHE_VERSION, "entries": entries}, cache_file)
+    except OSError as exc:
+        # the cache only saves index round trips, so the next check simply asks again
+        _LOGGER.debug("Unable to write %s: %s", cache_file, exc)
+
+
+def _apply_latest_versions(
+    environment: _EnvironmentOutdated, latest_versions: dict[_IndexQuery, _LatestVersion]
+) -> _EnvironmentOutdated:
+    if not environment.lookups:
+        return environment
+    packages: Final[list[_OutdatedPackage]] = list(environment.packages)
+    failures: Final[list[_FailedEnvironment]] = list(environment.failures)
+    for lookup in environment.lookups:
+        latest: _LatestVersion = latest_versions[lookup.query]
+        if latest.error is not None:
+            if (failure := _FailedEnvironment(lookup.venv.name, latest.error)) not in failures:
+                failures.append(failure)
+        elif latest.version is not None and _is_newer(latest.version, lookup.package_info.package_version):
+            packages.append(
+                _OutdatedPackage(
+                    environment=lookup.venv.name,
+                    package=f"{lookup.package_info.package}{lookup.package_info.suffix}",
+                    version=lookup.package_info.package_version,
+                    latest_version=latest.version,
+                    injected=lookup.injected,
+                    pinned=lookup.package_info.pinned,
+                )
+            )
+    return replace(environment, packages=tuple(packages), failures=tuple(failures), lookups=())
+
+
+def _is_newer(latest: str, installed: str) -> bool:
+    try:
+        return Version(latest) > Version(installed)
+    except InvalidVersion:
+        return latest != installed
+
+
 def _package_message(package: _OutdatedPackage) -> OutputMessage:
     subject: Final[str] = (
         f"{package.package} (injected in {package.environment})" if package.injected else package.package
@@ -267,12 +451,36 @@ class _FailedEnvironment:
     error: str
 
 
+@dataclass(frozen=True)
+class _IndexQuery:
+    python: str
+    index_args: tuple[str, ...]
+    cooldown_days: int | None
+    package: str
+
+
+@dataclass(frozen=True)
+class _IndexLookup:
+    query: _IndexQuery
+    venv: Venv
+    package_info: PackageInfo
+    injected: bool
+
+
+@dataclass(frozen=True)
+class _LatestVersion:
+    version: str | None
+    error: str | None = None
+
+
 @dataclass(frozen=True)
 class _EnvironmentOutdated:
     packages_checked: int = 0
     packages: tuple[_OutdatedPackage, ...] = ()
     skipped: tuple[_SkippedPackage, ...] = ()
     failures: tuple[_FailedEnvironment, ...] = ()
+    # index queries still to answer before ``packages`` is complete
+    lookups: tuple[_IndexLookup, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -290,6 +498,8 @@ class OutdatedData(OperationData):
 
 
 __all__ = [
+    "OUTDATED_CACHE_FILENAME",
+    "OUTDATED_CACHE_MAX_AGE_SEC",
     "OutdatedData",
     "inspect_outdated",
     "list_outdated",
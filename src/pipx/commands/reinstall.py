@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from tempfile import mkdtemp
 from typing import TYPE_CHECKING, Final
@@ -9,7 +12,8 @@ from typing import TYPE_CHECKING, Final
 from packaging.utils import canonicalize_name
 
 from pipx import paths
-from pipx.commands.common import add_suffix
+from pipx.animate import animations_paused
+from pipx.commands.common import _batched_injections, _unbatched_message, add_suffix
 from pipx.commands.inject import inject_dep
 from pipx.commands.install import install
 from pipx.commands.uninstall import _get_venv_package_infos, _get_venv_resource_paths
@@ -22,12 +26,20 @@ from pipx.constants import (
     ExitCode,
 )
 from pipx.emojis import error, sleep, stars
-from pipx.result import OperationData, OperationError, OperationResult, OutputLevel, OutputMessage, OutputStream
+from pipx.result import (
+    OperationData,
+    OperationError,
+    OperationResult,
+    OutputLevel,
+    OutputMessage,
+    OutputStream,
+    render_messages,
+)
 from pipx.util import PipxError, rmdir, safe_unlink
 from pipx.venv import Venv, VenvContainer
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from filelock import BaseFileLock
 
@@ -178,8 +190,19 @@ def reinstall(  # ruff:ignore[too-many-arguments]  # reinstall rebuilds a venv f
     venv_dir = venv_dir.with_name(canonicalize_name(venv_dir.name))
 
     try:  # ruff:ignore[too-many-statements-in-try-clause]  # the whole rebuild must share one handler so any failure restores the backup
-        # install main package first
-        installed = install(
+        batched = (
+            {}
+            if venv.pipx_metadata.main_package.lock_file is not None
+            else _batched_injections(
+                venv.pipx_metadata.injected_packages,
+                lambda injected_package: _require_injected_url(injected_package, venv.name),
+                main_pip_args=venv.pipx_metadata.main_package.pip_args,
+                main_cooldown_days=venv.pipx_metadata.main_package.cooldown_days,
+            )
+        )
+        # install main package first, with every injected package that can share its install
+        install_main = partial(
+            install,
             venv_dir,
             [venv.main_package_name],
             [package_or_url],
@@ -205,6 +228,12 @@ def reinstall(  # ruff:ignore[too-many-arguments]  # reinstall rebuilds a venv f
             venv_lock=venv_lock,
             emit_output=False,
         )
+        installed = install_main(injected_requirements=tuple(batched.values()))
+        if installed.errors and batched:
+            # a conflicting or unresolvable injected package must not sink the main package, inject each one alone
+            messages.append(OutputMessage(_unbatched_message(batched, venv.name), stream=OutputStream.STDERR))
+            batched = {}
+            installed = install_main()
         # install does not raise when it does not render, so restore the backup on a failed result too
         _raise_first_error(installed.errors)
         messages.extend(installed.messages)
@@ -224,6 +253,7 @@ def reinstall(  # ruff:ignore[too-many-arguments]  # reinstall rebuilds a venv f
                 backend=backend or venv.pipx_metadata.backend,
                 env_backend=env_backend,
                 cooldown_days=injected_package.cooldown_days,
+                already_installed=injected_name in batched,
             )
 
         new_resource_paths = _get_expected_reinstall_resource_paths(
@@ -255,43 +285,54 @@ def reinstall_all(  # ruff:ignore[too-many-arguments]  # reinstall-all forwards
     python_flag_passed: bool = False,
     backend: str | None = None,
     env_backend: str | None = None,
+    jobs: int = 1,
 ) -> OperationResult[ReinstallData]:
-    errors: list[OperationError] = []
-    reinstalled: list[_ReinstalledEnvironment] = []
-    messages: list[OutputMessage] = []
-
-    # iterate on all packages and reinstall them
-    # for the first one, we also trigger
-    # a reinstall of shared libs beforehand
-    first_reinstall = True
-    for venv_dir in venv_container.iter_venv_dirs():
-        if venv_dir.name in skip:
-            continue
-        try:
-            with venv_container.venv_lock(venv_dir) as venv_lock:
-                outcome = reinstall(
-                    venv_dir=venv_dir,
-                    local_bin_dir=local_bin_dir,
-                    local_man_dir=local_man_dir,
-                    python=python,
-                    verbose=verbose,
-                    force_reinstall_shared_libs=first_reinstall,
-                    python_flag_passed=python_flag_passed,
-                    backend=backend,
-                    env_backend=env_backend,
-                    venv_lock=venv_lock,
-                )
-        except PipxError as error_raised:
-            errors.append(
-                OperationError(
-                    code="environment_reinstall_failed", message=str(error_raised), environment=venv_dir.name
+    venv_dirs: Final[tuple[Path, ...]] = tuple(
+        venv_dir for venv_dir in venv_container.iter_venv_dirs() if venv_dir.name not in skip
+    )
+    reinstall_one: Final[Callable[..., _EnvironmentReinstall]] = partial(
+        _reinstall_environment,
+        venv_container,
+        local_bin_dir=local_bin_dir,
+        local_man_dir=local_man_dir,
+        python=python,
+        verbose=verbose,
+        python_flag_passed=python_flag_passed,
+        backend=backend,
+        env_backend=env_backend,
+    )
+    outcomes: list[_EnvironmentReinstall] = []
+    if jobs > 1 and len(venv_dirs) > 1:
+        _refresh_shared_libs(venv_container, venv_dirs, verbose=verbose, backend=backend, env_backend=env_backend)
+        with animations_paused(), ThreadPoolExecutor(max_workers=min(jobs, len(venv_dirs))) as executor:
+            futures: Final[dict[Future[_EnvironmentReinstall], str]] = {
+                # a copy of this thread's context per task carries --skip-maintenance into the workers
+                executor.submit(copy_context().run, reinstall_one, venv_dir, force_reinstall_shared_libs=False): (
+                    venv_dir.name
                 )
-            )
-            messages.append(OutputMessage(str(error_raised), stream=OutputStream.STDERR, level=OutputLevel.ERROR))
-        else:
-            first_reinstall = False
-            reinstalled.append(_ReinstalledEnvironment(venv_dir.name))
-            messages.extend(outcome.messages)
+                for venv_dir in venv_dirs
+            }
+            for future in as_completed(futures):
+                # the report below waits for every environment, so say which ones are done as they finish
+                progress = "reinstalled" if future.result().error is None else "failed to reinstall"
+                render_messages((OutputMessage(f"{progress} {futures[future]}", stream=OutputStream.STDERR),), quiet=0)
+            # collect in submission order so the report matches a serial run whatever finished first
+            outcomes.extend(future.result() for future in futures)
+    else:
+        # iterate on all packages and reinstall them
+        # until one succeeds, we also trigger
+        # a reinstall of shared libs beforehand
+        first_reinstall = True
+        for venv_dir in venv_dirs:
+            outcome = reinstall_one(venv_dir, force_reinstall_shared_libs=first_reinstall)
+            first_reinstall = first_reinstall and outcome.error is not None
+            outcomes.append(outcome)
+
+    errors: Final[list[OperationError]] = [outcome.error for outcome in outcomes if outcome.error is not None]
+    reinstalled: Final[list[_ReinstalledEnvironment]] = [
+        _ReinstalledEnvironment(outcome.environment) for outcome in outcomes if outcome.error is None
+    ]
+    messages: Final[list[OutputMessage]] = [message for outcome in outcomes for message in outcome.messages]
     if not reinstalled:
         messages.append(OutputMessage(f"No packages reinstalled after running 'pipx reinstall-all' {sleep}"))
     return OperationResult(
@@ -304,6 +345,75 @@ def reinstall_all(  # ruff:ignore[too-many-arguments]  # reinstall-all forwards
     )
 
 
+def _refresh_shared_libs(
+    venv_container: VenvContainer,
+    venv_dirs: Sequence[Path],
+    *,
+    verbose: bool,
+    backend: str | None,
+    env_backend: str | None,
+) -> None:
+    # the serial loop forces this refresh on its first reinstall; concurrent workers instead share one done up front
+    for venv_dir in venv_dirs:
+        with venv_container.venv_lock(venv_dir):
+            venv = Venv(venv_dir, verbose=verbose, backend=backend, env_backend=env_backend)
+            if not venv.uses_shared_libs:
+                continue
+            try:
+                venv.check_upgrade_shared_libs(
+                    pip_args=venv.pipx_metadata.main_package.pip_args, verbose=verbose, force_upgrade=True
+                )
+            except PipxError:
+                # each environment retries the repair and reports its own failure
+                _LOGGER.info("Could not refresh the shared libraries before reinstalling", exc_info=True)
+            return
+
+
+def _reinstall_environment(  # ruff:ignore[too-many-arguments]  # forwards the shared reinstall-all context to each worker
+    venv_container: VenvContainer,
+    venv_dir: Path,
+    *,
+    local_bin_dir: Path,
+    local_man_dir: Path,
+    python: str,
+    verbose: bool,
+    force_reinstall_shared_libs: bool,
+    python_flag_passed: bool,
+    backend: str | None,
+    env_backend: str | None,
+) -> _EnvironmentReinstall:
+    try:
+        with venv_container.venv_lock(venv_dir) as venv_lock:
+            outcome = reinstall(
+                venv_dir=venv_dir,
+                local_bin_dir=local_bin_dir,
+                local_man_dir=local_man_dir,
+                python=python,
+                verbose=verbose,
+                force_reinstall_shared_libs=force_reinstall_shared_libs,
+                python_flag_passed=python_flag_passed,
+                backend=backend,
+                env_backend=env_backend,
+                venv_lock=venv_lock,
+            )
+    except PipxError as error_raised:
+        return _EnvironmentReinstall(
+            venv_dir.name,
+            messages=(OutputMessage(str(error_raised), stream=OutputStream.STDERR, level=OutputLevel.ERROR),),
+            error=OperationError(
+                code="environment_reinstall_failed", message=str(error_raised), environment=venv_dir.name
+            ),
+        )
+    return _EnvironmentReinstall(venv_dir.name, messages=outcome.messages)
+
+
+@dataclass(frozen=True)
+class _EnvironmentReinstall:
+    environment: str
+    messages: tuple[OutputMessage, ...]
+    error: OperationError | None = None
+
+
 @dataclass(frozen=True)
 class _ReinstalledEnvironment:
     environment: str
@@ -96,6 +96,8 @@ def _reset_targets() -> tuple[Path, ...]:
             paths.ctx.venvs,
             paths.ctx.shared_libs,
             paths.ctx.venv_cache,
+            paths.ctx.lookup_cache,
+            paths.ctx.venv_templates,
             paths.ctx.standalone_python_cachedir,
             paths.ctx.logs,
             paths.ctx.trash,
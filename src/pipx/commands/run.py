@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import datetime
 import hashlib
+import json
 import logging
 import urllib.parse
 import urllib.request
@@ -13,7 +13,6 @@ from typing import TYPE_CHECKING, Final, NoReturn
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
-from filelock import Timeout
 from packaging.requirements import InvalidRequirement, Requirement
 from packaging.specifiers import SpecifierSet
 from packaging.utils import canonicalize_name
@@ -22,8 +21,9 @@ from pipx import paths
 from pipx.backends import UV, resolve_backend_name
 from pipx.commands.common import package_name_from_spec
 from pipx.commands.inject import inject_dep
+from pipx.commands.run_cache import evict_run_cache, is_expired, mark_expired, mark_used, remove_if_expired
 from pipx.commands.run_uv import run_script_via_uv_run, run_via_uv_tool_run
-from pipx.constants import TEMP_VENV_EXPIRATION_THRESHOLD_DAYS, WINDOWS, FetchPythonOptions
+from pipx.constants import WINDOWS, FetchPythonOptions
 from pipx.emojis import hazard
 from pipx.requires_python import interpreter_for, unsatisfied_by_interpreter
 from pipx.script import ScriptMetadata, read_script_metadata
@@ -32,6 +32,7 @@ from pipx.util import (
     exec_app,
     get_pypackage_bin_path,
     pipx_wrap,
+    replace_json,
     rmdir,
     run_pypackage_bin,
 )
@@ -39,7 +40,7 @@ from pipx.venv import Venv, VenvContainer
 
 _LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
 
-_VENV_EXPIRED_FILENAME: Final[str] = "pipx_expired_venv"
+LAUNCH_RECORD_FILENAME: Final[str] = "pipx_launch.json"
 _VCS_SCHEMES: Final[frozenset[str]] = frozenset({"bzr", "git", "hg", "svn"})
 
 _APP_NOT_FOUND_ERROR_MESSAGE: Final[str] = """\
@@ -191,8 +192,9 @@ def run_script(  # ruff:ignore[too-many-arguments]  # mirrors the flat `pipx run
                 # Package installation failed, so mark the cache as expired.
                 # This ensures an attempt is made to re-install requirements
                 # when `pipx run` is next executed, rather than just failing.
-                (venv_dir / _VENV_EXPIRED_FILENAME).touch()
+                mark_expired(venv_dir)
                 raise
+        mark_used(venv_dir)
         _exec_script(venv.python_path, content, app_args, python_args)
 
 
@@ -255,6 +257,8 @@ def run_package(  # ruff:ignore[too-many-arguments]  # mirrors the flat `pipx ru
         )
 
     app, app_filename = _app_names(app)
+    # an inferred app name is only known once the venv is open, so the record stays filed under the requested one
+    launch_key: Final[str] = app
 
     pypackage_bin_path = get_pypackage_bin_path(app)
     if pypackage_bin_path.exists():
@@ -281,6 +285,10 @@ def run_package(  # ruff:ignore[too-many-arguments]  # mirrors the flat `pipx ru
         resolved_backend or "pip",
         cooldown_days=cooldown_days,
     )
+    if use_cache and not refresh and not python_args and (launch := _read_launch_record(venv_dir, launch_key)):
+        _LOGGER.info("Reusing cached venv %s", venv_dir)
+        mark_used(venv_dir)
+        exec_app([*launch, *app_args])
 
     with _locked_venv_cache(venv_dir):
         venv = Venv(venv_dir, backend=backend, env_backend=env_backend)
@@ -324,7 +332,51 @@ def run_package(  # ruff:ignore[too-many-arguments]  # mirrors the flat `pipx ru
                     env_backend=env_backend,
                     cooldown_days=cooldown_days,
                 )
-        venv.run_app(app, app_filename, app_args, python_args=python_args)
+        command: Final[list[str]] = venv.app_command(app, app_filename, python_args=python_args)
+        if use_cache and not python_args:
+            _write_launch_record(venv_dir, launch_key, command)
+        mark_used(venv_dir)
+        exec_app([*command, *app_args])
+
+
+def _read_launch_record(venv_dir: Path, app: str) -> list[str] | None:
+    """The command a prepared cache venv recorded for ``app``, if the venv has not expired and the program still exists.
+
+    This lets a warm ``pipx run`` exec without taking the cache lock, sweeping other venvs or inspecting the venv.
+    """
+    try:
+        record = json.loads((venv_dir / LAUNCH_RECORD_FILENAME).read_text(encoding="utf-8"))
+        if is_expired(venv_dir):
+            # an expired venv is left for the slow path to remove and rebuild
+            return None
+    except (OSError, ValueError):
+        return None
+    launches = record.get("launches") if isinstance(record, dict) else None
+    command = launches.get(app) if isinstance(launches, dict) else None
+    if not isinstance(command, list) or not command or not all(isinstance(part, str) for part in command):
+        return None
+    if not Path(command[0]).is_file():
+        return None
+    return command
+
+
+def _write_launch_record(venv_dir: Path, app: str, command: list[str]) -> None:
+    record_path: Final[Path] = venv_dir / LAUNCH_RECORD_FILENAME
+    try:
+        record = json.loads(record_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        record = {}
+    launches = record.get("launches") if isinstance(record, dict) else None
+    if not isinstance(launches, dict):
+        launches = {}
+    if launches.get(app) == command:
+        return
+    launches[app] = command
+    try:
+        replace_json({"launches": launches}, record_path)
+    except OSError as exc:
+        # the record only shortens the next run, which falls back to opening the venv without it
+        _LOGGER.debug("Unable to write %s: %s", record_path, exc)
 
 
 def _app_names(app: str) -> tuple[str, str]:
@@ -509,8 +561,8 @@ def _prepare_venv(  # ruff:ignore[too-many-arguments]  # mirrors the flat run/in
             )
 
     if not use_cache:
-        # Let future _remove_all_expired_venvs know to remove this
-        (venv_dir / _VENV_EXPIRED_FILENAME).touch()
+        # Let future runs know to remove this
+        mark_expired(venv_dir)
 
     return venv, app, app_filename
 
@@ -546,33 +598,12 @@ def _get_temporary_venv_path(  # ruff:ignore[too-many-arguments]  # all inputs f
     return Path(paths.ctx.venv_cache) / venv_folder_name
 
 
-def _is_temporary_venv_expired(venv_dir: Path) -> bool:
-    created_time_sec = venv_dir.stat().st_ctime
-    current_time_sec = datetime.datetime.now(tz=datetime.timezone.utc).timestamp()
-    age = current_time_sec - created_time_sec
-    expiration_threshold_sec = 60 * 60 * 24 * TEMP_VENV_EXPIRATION_THRESHOLD_DAYS
-    return age > expiration_threshold_sec or (venv_dir / _VENV_EXPIRED_FILENAME).exists()
-
-
 @contextmanager
 def _locked_venv_cache(venv_dir: Path) -> Iterator[None]:
     venv_container: Final[VenvContainer] = VenvContainer(paths.ctx.venv_cache)
-    for cached_venv_dir in sorted(venv_container.iter_venv_dirs()):
-        if cached_venv_dir == venv_dir:
-            continue
-        # Purging expired venvs is opportunistic housekeeping, so skip any a concurrent run holds rather than block on
-        # it; on Windows an in-use cache would keep the lock held for the whole install and stall every other run.
-        lock = venv_container.venv_lock(cached_venv_dir)
-        try:
-            lock.acquire(timeout=0)
-        except Timeout:
-            continue
-        try:
-            _remove_expired_venv(cached_venv_dir)
-        finally:
-            lock.release()
+    evict_run_cache(venv_container, keep=venv_dir)
     with venv_container.venv_lock(venv_dir):
-        _remove_expired_venv(venv_dir)
+        remove_if_expired(venv_dir)
         yield
 
 
@@ -586,12 +617,6 @@ def _prepare_venv_cache(venv: Venv, bin_path: Path | None, *, use_cache: bool, r
         rmdir(venv_dir)
 
 
-def _remove_expired_venv(venv_dir: Path) -> None:
-    if venv_dir.is_dir() and _is_temporary_venv_expired(venv_dir):
-        _LOGGER.info("Removing expired venv %s", venv_dir)
-        rmdir(venv_dir)
-
-
 _URL_TIMEOUT: Final[int] = 30
 # bound the download so a stalled or oversized script cannot hang pipx or exhaust memory
 _MAX_SCRIPT_BYTES: Final[int] = 10 * 1024 * 1024
@@ -618,6 +643,7 @@ def _http_get_request(url: str) -> str:
 
 
 __all__ = [
+    "LAUNCH_RECORD_FILENAME",
     "maybe_script_content",
     "run",
     "run_package",
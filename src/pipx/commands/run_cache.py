@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import logging
+import os
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from filelock import FileLock, Timeout
+
+from pipx.constants import TEMP_VENV_EXPIRATION_THRESHOLD_DAYS
+from pipx.util import replace_json, rmdir
+
+if TYPE_CHECKING:
+    from pipx.venv import VenvContainer
+
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+RUN_CACHE_MAX_SIZE: Final[str] = "PIPX_RUN_CACHE_MAX_SIZE"
+RUN_CACHE_MAX_ENTRIES: Final[str] = "PIPX_RUN_CACHE_MAX_ENTRIES"
+RUN_CACHE_INDEX_FILENAME: Final[str] = "pipx_run_cache.json"
+LAST_USED_FILENAME: Final[str] = "pipx_last_used"
+EVICTION_INTERVAL_SEC: Final[int] = 60 * 60
+_EXPIRED_FILENAME: Final[str] = "pipx_expired_venv"
+_EXPIRATION_THRESHOLD_SEC: Final[int] = 60 * 60 * 24 * TEMP_VENV_EXPIRATION_THRESHOLD_DAYS
+_RUN_CACHE_INDEX_VERSION: Final[int] = 1
+
+
+@dataclass(frozen=True)
+class _CachedVenv:
+    path: Path
+    last_used: float
+    size: int
+
+
+def mark_used(venv_dir: Path) -> None:
+    """Record that a cached venv was just used, which keeps it from expiring or being evicted first."""
+    stamp: Final[Path] = venv_dir / LAST_USED_FILENAME
+    now: Final[float] = _now()
+    try:
+        stamp.touch()
+        os.utime(stamp, (now, now))
+    except OSError as exc:
+        # without the stamp the venv ages from its creation, as it did before last use was tracked
+        _LOGGER.debug("Unable to update %s: %s", stamp, exc)
+
+
+def mark_expired(venv_dir: Path) -> None:
+    """Have the next run (or sweep) remove a cached venv regardless of when it was last used."""
+    (venv_dir / _EXPIRED_FILENAME).touch()
+
+
+def is_expired(venv_dir: Path) -> bool:
+    return _now() - last_used(venv_dir) > _EXPIRATION_THRESHOLD_SEC or (venv_dir / _EXPIRED_FILENAME).exists()
+
+
+def last_used(venv_dir: Path) -> float:
+    try:
+        return (venv_dir / LAST_USED_FILENAME).stat().st_mtime
+    except OSError:
+        return venv_dir.stat().st_ctime
+
+
+def remove_if_expired(venv_dir: Path) -> bool:
+    if venv_dir.is_dir() and is_expired(venv_dir):
+        _LOGGER.info("Removing expired venv %s", venv_dir)
+        rmdir(venv_dir)
+        return True
+    return False
+
+
+def evict_run_cache(venv_container: VenvContainer, keep: Path) -> None:
+    """Remove expired cached venvs, then the least recently used ones until the cache fits its quota.
+
+    The sweep runs at most once per ``EVICTION_INTERVAL_SEC`` for all pipx processes sharing the cache, and skips venvs
+    another run holds. ``keep`` is the venv the caller is about to use, which counts towards the quota but is never
+    removed.
+    """
+    if not venv_container.root.is_dir():
+        return
+    index_path: Final[Path] = venv_container.root / RUN_CACHE_INDEX_FILENAME
+    now: Final[float] = _now()
+    if 0 <= now - _read_index(index_path)[0] < EVICTION_INTERVAL_SEC:
+        return
+    lock: Final[FileLock] = FileLock(venv_container.root / f".{RUN_CACHE_INDEX_FILENAME}.lock")
+    try:
+        lock.acquire(timeout=0)
+    except Timeout:
+        return
+    try:
+        # another run may have swept between the unlocked check and taking the lock
+        evicted_at, sizes = _read_index(index_path)
+        if 0 <= now - evicted_at < EVICTION_INTERVAL_SEC:
+            return
+        cached: Final[list[_CachedVenv]] = []
+        for venv_dir in sorted(venv_container.iter_venv_dirs()):
+            entry = _cached_venv(keep, sizes) if venv_dir == keep else _sweep_venv(venv_container, venv_dir, sizes)
+            if entry is not None:
+                cached.append(entry)
+        _evict_over_quota(venv_container, keep, cached)
+        _write_index(
+            index_path,
+            now,
+            {
+                entry.path.name: sizes[entry.path.name]
+                for entry in cached
+                if entry.path.name in sizes and entry.path.is_dir()
+            },
+        )
+    finally:
+        lock.release()
+
+
+def _sweep_venv(
+    venv_container: VenvContainer, venv_dir: Path, sizes: dict[str, tuple[float, int]]
+) -> _CachedVenv | None:
+    # Purging expired venvs is opportunistic housekeeping, so skip any a concurrent run holds rather than block on
+    # it; on Windows an in-use cache would keep the lock held for the whole install and stall every other run.
+    lock = venv_container.venv_lock(venv_dir)
+    try:
+        lock.acquire(timeout=0)
+    except Timeout:
+        return None
+    try:
+        if remove_if_expired(venv_dir):
+            return None
+        return _cached_venv(venv_dir, sizes)
+    finally:
+        lock.release()
+
+
+def _cached_venv(venv_dir: Path, sizes: dict[str, tuple[float, int]]) -> _CachedVenv:
+    try:
+        created: float = venv_dir.stat().st_ctime
+    except OSError:
+        # ``keep`` may not have been built yet
+        return _CachedVenv(venv_dir, _now(), 0)
+    recorded = sizes.get(venv_dir.name)
+    if recorded is None or recorded[0] != created:
+        # walking a venv is the expensive part of the sweep, so sizes are remembered until the venv is rebuilt
+        sizes[venv_dir.name] = recorded = (created, _tree_size(venv_dir))
+    return _CachedVenv(venv_dir, last_used(venv_dir), recorded[1])
+
+
+def _evict_over_quota(venv_container: VenvContainer, keep: Path, cached: list[_CachedVenv]) -> None:
+    max_size: Final[int | None] = _quota(RUN_CACHE_MAX_SIZE)
+    max_entries: Final[int | None] = _quota(RUN_CACHE_MAX_ENTRIES)
+    if max_size is None and max_entries is None:
+        return
+    total_size: int = sum(entry.size for entry in cached)
+    # ``keep`` is about to exist whether or not it has been built yet
+    total_entries: int = len(cached) + (keep not in {entry.path for entry in cached})
+    for entry in sorted(cached, key=lambda entry: entry.last_used):
+        if (max_size is None or total_size <= max_size) and (max_entries is None or total_entries <= max_entries):
+            return
+        if entry.path == keep:
+            continue
+        lock = venv_container.venv_lock(entry.path)
+        try:
+            lock.acquire(timeout=0)
+        except Timeout:
+            continue
+        try:
+            _LOGGER.info("Removing least recently used venv %s", entry.path)
+            rmdir(entry.path)
+        finally:
+            lock.release()
+        total_size -= entry.size
+        total_entries -= 1
+
+
+def _quota(variable: str) -> int | None:
+    raw: Final[str] = os.getenv(variable, "").strip()
+    if not raw:
+        return None
+    try:
+        return max(int(raw), 0)
+    except ValueError:
+        _LOGGER.warning("Ignoring %s=%r; expected a whole number.", variable, raw)
+        return None
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _, filenames in os.walk(path):
+        for filename in filenames:
+            with suppress(OSError):
+                total += Path(root, filename).lstat().st_size
+    return total
+
+
+def _read_index(index_path: Path) -> tuple[float, dict[str, tuple[float, int]]]:
+    """When the cache was last swept and the remembered size of each venv, keyed by the venv's ctime."""
+    try:
+        with index_path.open("rb") as index_fh:
+            payload = json.load(index_fh)
+    except (OSError, ValueError):
+        return 0.0, {}
+    if not isinstance(payload, dict) or payload.get("version") != _RUN_CACHE_INDEX_VERSION:
+        return 0.0, {}
+    evicted_at = payload.get("evicted_at")
+    entries = payload.get("entries")
+    if not isinstance(evicted_at, int | float) or not isinstance(entries, dict):
+        return 0.0, {}
+    return float(evicted_at), {
+        name: (entry["ctime"], entry["size"])
+        for name, entry in entries.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("ctime"), int | float)
+        and isinstance(entry.get("size"), int)
+    }
+
+
+def _write_index(index_path: Path, evicted_at: float, sizes: dict[str, tuple[float, int]]) -> None:
+    entries: Final[dict[str, dict[str, Any]]] = {
+        name: {"ctime": created, "size": size} for name, (created, size) in sizes.items()
+    }
+    try:
+        replace_json({"version": _RUN_CACHE_INDEX_VERSION, "evicted_at": evicted_at, "entries": entries}, index_path)
+    except OSError as exc:
+        # without the index the next run sweeps again and re-measures every venv
+        _LOGGER.debug("Unable to write %s: %s", index_path, exc)
+
+
+def _now() -> float:
+    return dt.datetime.now(tz=dt.timezone.utc).timestamp()
+
+
+__all__ = [
+    "EVICTION_INTERVAL_SEC",
+    "LAST_USED_FILENAME",
+    "RUN_CACHE_INDEX_FILENAME",
+    "RUN_CACHE_MAX_ENTRIES",
+    "RUN_CACHE_MAX_SIZE",
+    "evict_run_cache",
+    "is_expired",
+    "last_used",
+    "mark_expired",
+    "mark_used",
+    "remove_if_expired",
+]
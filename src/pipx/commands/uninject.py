@@ -26,12 +26,10 @@ from pipx.emojis import stars
 from pipx.result import OperationError, OperationResult, OutputLevel, OutputMessage, OutputStream
 from pipx.util import pipx_wrap, safe_unlink
 from pipx.venv import Venv
-from pipx.venv_inspect import fetch_info_in_venv, get_distributions_by_name, get_required_dependency_names
 
 if TYPE_CHECKING:
-    from importlib import metadata
-
     from pipx.pipx_metadata_file import PackageInfo
+    from pipx.venv_inspect import DependencyGraph
 
 logger = logging.getLogger(__name__)
 
@@ -131,18 +129,20 @@ def uninject_dep(
     new_resource_paths = get_include_resource_paths(package_name, venv, local_bin_dir, local_man_dir)
 
     if not leave_deps:
-        orig_not_required_packages = venv.list_installed_packages(not_required=True)
+        # one read of the installed metadata answers what is required both before and after the uninstall
+        graph: Final[DependencyGraph] = venv.dependency_graph()
+        orig_not_required_packages = graph.not_required()
         logger.info("Original not required packages: %s", orig_not_required_packages)
 
     venv.uninstall_package(package=package_name, was_injected=True)
 
     if not leave_deps:
-        new_not_required_packages = venv.list_installed_packages(not_required=True)
+        new_not_required_packages = graph.not_required(excluding={package_name})
         logger.info("New not required packages: %s", new_not_required_packages)
 
         deps_of_uninstalled = new_not_required_packages - orig_not_required_packages
         if deps_of_uninstalled:
-            remaining_deps = _get_remaining_dependencies(venv, package_name)
+            remaining_deps = _get_remaining_dependencies(venv, graph, package_name)
             deps_of_uninstalled -= remaining_deps
             logger.info("Dependencies of uninstalled package: %s", deps_of_uninstalled)
 
@@ -234,38 +234,13 @@ def get_include_resource_paths(package_name: str, venv: Venv, local_bin_dir: Pat
     return need_to_remove
 
 
-def _get_remaining_dependencies(venv: Venv, excluded_package: str) -> set[str]:
-    venv_sys_path, venv_env, _ = fetch_info_in_venv(venv.python_path)
-    distributions = get_distributions_by_name(venv_sys_path)
-
-    remaining_deps: set[str] = set()
-    remaining_packages: list[str] = [
+def _get_remaining_dependencies(venv: Venv, graph: DependencyGraph, excluded_package: str) -> set[str]:
+    remaining_packages: Final[list[str]] = [
         name
         for name in [venv.pipx_metadata.main_package.package, *list(venv.pipx_metadata.injected_packages)]
         if name is not None and name != excluded_package
     ]
-    for pkg_name in remaining_packages:
-        remaining_deps |= _collect_transitive_deps(pkg_name, distributions, venv_env)
-
-    return remaining_deps
-
-
-def _collect_transitive_deps(
-    package_name: str,
-    distributions: dict[str, metadata.Distribution],
-    env: dict[str, str],
-    visited: set[str] | None = None,
-) -> set[str]:
-    if visited is None:
-        visited = set()
-    canonical = canonicalize_name(package_name)
-    if canonical in visited:
-        return visited
-    visited.add(canonical)
-    if dist := distributions.get(canonical):
-        for dep_name in get_required_dependency_names(dist, env):
-            _collect_transitive_deps(dep_name, distributions, env, visited)
-    return visited
+    return graph.reachable(remaining_packages, excluding={excluded_package})
 
 
 __all__ = [
@@ -29,6 +29,7 @@ from pipx.constants import (
 from pipx.emojis import hazard, sleep, stars
 from pipx.pipx_metadata_file import PackageInfo
 from pipx.result import OperationData, OperationError, OperationResult, OutputMessage
+from pipx.trace import span
 from pipx.util import rmdir, safe_unlink
 from pipx.venv import Venv, VenvContainer
 
@@ -104,8 +105,9 @@ def uninstall(
             package_infos,
         )
 
-    for path in resource_paths:
-        _remove_resource(path)
+    with span("unexpose", "expose", package=venv.name):
+        for path in resource_paths:
+            _remove_resource(path)
 
     package_info = next(
         (package_info for package_info in package_infos or () if package_info.package == venv.main_package_name),
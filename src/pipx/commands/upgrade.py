@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from enum import Enum
+from functools import partial
 from typing import TYPE_CHECKING, Final
 
-from pipx import commands, paths
+from pipx import paths
+from pipx.animate import animations_paused
 from pipx.colors import bold, red
 from pipx.commands.common import expose_package_resources, locked_package_message, validate_expected_apps
+from pipx.commands.install import install as install_package
 from pipx.commands.outdated import inspect_outdated
 from pipx.commands.transaction import preserve_venv
 from pipx.constants import ExitCode
@@ -15,11 +19,11 @@ from pipx.emojis import sleep
 from pipx.package_specifier import parse_specifier_for_upgrade
 from pipx.result import OperationData, OperationError, OperationResult, OutputLevel, OutputMessage, OutputStream
 from pipx.shared_libs import shared_libs
-from pipx.util import PipxError, pipx_wrap
+from pipx.util import PipxError, map_in_context, pipx_wrap
 from pipx.venv import Venv, VenvContainer
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Sequence
+    from collections.abc import Callable, Collection, Sequence
     from pathlib import Path
 
     from filelock import BaseFileLock
@@ -93,6 +97,8 @@ def upgrade_all(  # ruff:ignore[too-many-arguments]  # mirrors the CLI's flat up
     backend: str | None = None,
     env_backend: str | None = None,
     cooldown_days: int | None = None,
+    jobs: int = 1,
+    refresh: bool = False,
 ) -> OperationResult[UpgradeData]:
     outdated: Final[OutdatedData] = inspect_outdated(
         venv_container,
@@ -102,6 +108,8 @@ def upgrade_all(  # ruff:ignore[too-many-arguments]  # mirrors the CLI's flat up
         skip=skip,
         backend=backend,
         env_backend=env_backend,
+        cooldown_days=cooldown_days,
+        refresh=refresh,
     )
     candidates: Final[set[tuple[str, str]]] = {
         (package.environment, package.package) for package in outdated.packages
@@ -114,50 +122,34 @@ def upgrade_all(  # ruff:ignore[too-many-arguments]  # mirrors the CLI's flat up
     for failure in outdated.failures:
         check_failures.setdefault(failure.environment, []).append(failure.error)
 
-    failures: Final[list[FailedUpgrade]] = []
-    messages: Final[list[OutputMessage]] = []
-    results: Final[list[PackageUpgradeResult]] = []
-    skipped: Final[list[SkippedUpgrade]] = []
-
-    for venv_dir in venv_container.iter_venv_dirs():
-        if venv_dir.name in skip:
-            skipped.append(SkippedUpgrade(venv_dir.name, "requested"))
-            continue
-        with venv_container.venv_lock(venv_dir) as venv_lock:
-            venv: Venv = Venv(venv_dir, verbose=verbose, backend=backend, env_backend=env_backend)
-            if "--editable" in venv.pipx_metadata.main_package.pip_args:
-                skipped.append(SkippedUpgrade(venv_dir.name, "editable"))
-                continue
-            try:  # ruff:ignore[too-many-statements-in-try-clause]  # one PipxError handler must cover the whole per-venv upgrade
-                _validate_venv_for_upgrade(venv_dir, venv)
-                _raise_check_failures(venv, check_failures)
-                packages_to_upgrade: set[str] = {
-                    package_name
-                    for package_name, package in venv.package_metadata.items()
-                    if (package_name == venv.main_package_name or include_injected)
-                    and (venv.name, f"{package_name}{package.suffix}") in candidates
-                }
-                package_results: tuple[PackageUpgradeResult, ...] = _upgrade_venv(
-                    venv_dir,
-                    pip_args,
-                    verbose=verbose,
-                    include_injected=include_injected,
-                    force=force,
-                    python_flag_passed=python_flag_passed,
-                    backend=backend,
-                    env_backend=env_backend,
-                    venv=venv,
-                    packages_to_upgrade=packages_to_upgrade,
-                    venv_lock=venv_lock,
-                    cooldown_days=cooldown_days,
-                    extra_messages=messages,
-                )
-                results.extend(package_results)
-                for result in package_results:
-                    messages.extend(_package_messages(result, upgrading_all=True))
-            except PipxError as error:
-                failures.append(FailedUpgrade(venv_dir.name, str(error)))
-                messages.append(OutputMessage(str(error), stream=OutputStream.STDERR, level=OutputLevel.ERROR))
+    upgrade_one: Final[Callable[[Path], _VenvUpgrade]] = partial(
+        _upgrade_all_venv,
+        venv_container,
+        candidates=candidates,
+        check_failures=check_failures,
+        skip=skip,
+        verbose=verbose,
+        pip_args=pip_args,
+        include_injected=include_injected,
+        force=force,
+        python_flag_passed=python_flag_passed,
+        backend=backend,
+        env_backend=env_backend,
+        cooldown_days=cooldown_days,
+    )
+    venv_dirs: Final[tuple[Path, ...]] = tuple(venv_container.iter_venv_dirs())
+    outcomes: tuple[_VenvUpgrade, ...]
+    if jobs > 1 and len(venv_dirs) > 1:
+        # executor.map yields in submission order, so the report matches a serial run whatever finishes first
+        with animations_paused(), ThreadPoolExecutor(max_workers=min(jobs, len(venv_dirs))) as executor:
+            outcomes = tuple(map_in_context(executor, upgrade_one, venv_dirs))
+    else:
+        outcomes = tuple(map(upgrade_one, venv_dirs))
+
+    failures: Final[list[FailedUpgrade]] = [outcome.failure for outcome in outcomes if outcome.failure is not None]
+    messages: Final[list[OutputMessage]] = [message for outcome in outcomes for message in outcome.messages]
+    results: Final[list[PackageUpgradeResult]] = [result for outcome in outcomes for result in outcome.results]
+    skipped: Final[list[SkippedUpgrade]] = [outcome.skipped for outcome in outcomes if outcome.skipped is not None]
     if not any(result.status is UpgradeStatus.UPGRADED for result in results):
         messages.append(OutputMessage(f"No packages upgraded after running 'pipx upgrade-all' {sleep}"))
     if failures:
@@ -180,6 +172,60 @@ def upgrade_all(  # ruff:ignore[too-many-arguments]  # mirrors the CLI's flat up
     )
 
 
+def _upgrade_all_venv(  # ruff:ignore[too-many-arguments]  # forwards the shared upgrade-all context to each worker
+    venv_container: VenvContainer,
+    venv_dir: Path,
+    *,
+    candidates: set[tuple[str, str]],
+    check_failures: dict[str, list[str]],
+    skip: Sequence[str],
+    verbose: bool,
+    pip_args: list[str],
+    include_injected: bool,
+    force: bool,
+    python_flag_passed: bool,
+    backend: str | None,
+    env_backend: str | None,
+    cooldown_days: int | None,
+) -> _VenvUpgrade:
+    if venv_dir.name in skip:
+        return _VenvUpgrade(skipped=SkippedUpgrade(venv_dir.name, "requested"))
+    messages: Final[list[OutputMessage]] = []
+    with venv_container.venv_lock(venv_dir) as venv_lock:
+        venv: Final[Venv] = Venv(venv_dir, verbose=verbose, backend=backend, env_backend=env_backend)
+        if "--editable" in venv.pipx_metadata.main_package.pip_args:
+            return _VenvUpgrade(skipped=SkippedUpgrade(venv_dir.name, "editable"))
+        try:
+            _validate_venv_for_upgrade(venv_dir, venv)
+            _raise_check_failures(venv, check_failures)
+            packages_to_upgrade: Final[set[str]] = {
+                package_name
+                for package_name, package in venv.package_metadata.items()
+                if (package_name == venv.main_package_name or include_injected)
+                and (venv.name, f"{package_name}{package.suffix}") in candidates
+            }
+            package_results: Final[tuple[PackageUpgradeResult, ...]] = _upgrade_venv(
+                venv_dir,
+                pip_args,
+                verbose=verbose,
+                include_injected=include_injected,
+                force=force,
+                python_flag_passed=python_flag_passed,
+                backend=backend,
+                env_backend=env_backend,
+                venv=venv,
+                packages_to_upgrade=packages_to_upgrade,
+                venv_lock=venv_lock,
+                cooldown_days=cooldown_days,
+                extra_messages=messages,
+            )
+        except PipxError as error:
+            messages.append(OutputMessage(str(error), stream=OutputStream.STDERR, level=OutputLevel.ERROR))
+            return _VenvUpgrade(messages=tuple(messages), failure=FailedUpgrade(venv_dir.name, str(error)))
+    messages.extend(message for result in package_results for message in _package_messages(result, upgrading_all=True))
+    return _VenvUpgrade(results=package_results, messages=tuple(messages))
+
+
 def _raise_check_failures(venv: Venv, check_failures: dict[str, list[str]]) -> None:
     # index-check failures block an unlocked upgrade; raise so the enclosing handler records the environment
     if venv.pipx_metadata.main_package.lock_file is None and (errors := check_failures.get(venv.name)):
@@ -222,7 +268,7 @@ def _upgrade_venv(  # ruff:ignore[too-many-arguments]  # upgrade forwards the fu
 ) -> tuple[PackageUpgradeResult, ...]:
     if not venv_dir.is_dir():
         if install:
-            installed = commands.install(
+            installed = install_package(
                 venv_dir=None,
                 venv_args=venv_args or [],
                 package_names=None,
@@ -531,6 +577,14 @@ class FailedUpgrade:
     error: str
 
 
+@dataclass(frozen=True)
+class _VenvUpgrade:
+    results: tuple[PackageUpgradeResult, ...] = ()
+    messages: tuple[OutputMessage, ...] = ()
+    skipped: SkippedUpgrade | None = None
+    failure: FailedUpgrade | None = None
+
+
 @dataclass(frozen=True)
 class UpgradeData(OperationData):
     packages: tuple[PackageUpgradeResult, ...]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import shutil
@@ -7,20 +8,25 @@ import subprocess
 import sys
 from functools import cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Final
 
 from packaging import version
 
+from pipx import paths
 from pipx.constants import WINDOWS, FetchPythonOptions
 from pipx.self_install import get_environment_value
-from pipx.standalone_python import download_python_build_standalone
-from pipx.util import PipxError
+from pipx.util import PipxError, replace_json, run_subprocess
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     DEFAULT_PYTHON: str
 
+INTERPRETER_CACHE_FILENAME: Final[str] = "interpreter_cache.json"
+_INTERPRETER_CACHE_VERSION: Final[int] = 1
+
 
 def has_venv() -> bool:
     try:
@@ -82,7 +88,7 @@ def find_unix_command_python(python_version: str) -> str | None:
     # Python command could be `python3` or `python3.x` without micro version component
     python_command = f"python{'.'.join(python_version.split('.')[:2])}"
 
-    python_path = shutil.which(python_command)
+    python_path = _which(python_command)
     if not python_path:
         logger.info("Command `%s` was not found on the system", python_command)
         return None
@@ -100,6 +106,9 @@ def find_unix_command_python(python_version: str) -> str | None:
 
 
 def _fetch_standalone_interpreter(python_version: str) -> str:
+    # the downloader pulls in tarfile and urllib, which every other pipx call would pay for at startup
+    from pipx.standalone_python import download_python_build_standalone  # ruff:ignore[import-outside-top-level]  # see above
+
     try:
         return download_python_build_standalone(python_version)
     except PipxError as e:
@@ -116,7 +125,7 @@ def find_python_interpreter(python_version: str, fetch_python: FetchPythonOption
             raise PipxError(msg)
         return _fetch_standalone_interpreter(python_version)
 
-    if Path(python_version).is_file() or shutil.which(python_version):
+    if Path(python_version).is_file() or _which(python_version):
         return python_version
 
     if not WINDOWS:
@@ -157,15 +166,21 @@ def find_py_launcher_python(python_version: str | None = None) -> str | None:
                 "Removing `python` from the start of the version, as pylauncher just expects the semantic version"
             )
             python_semver = python_semver.lstrip("python")
-        py = subprocess.run(
-            [py, f"-{python_semver}", "-c", "import sys; print(sys.executable)"],
-            capture_output=True,
-            text=True,
-            check=True,
-        ).stdout.strip()
+        launcher: Final[str] = py
+        py = _remembered("py", python_semver, lambda: _launch_py(launcher, python_semver))
     return py
 
 
+def _launch_py(py: str, python_semver: str) -> tuple[str, str]:
+    executable: Final[str] = subprocess.run(
+        [py, f"-{python_semver}", "-c", "import sys; print(sys.executable)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    return executable, executable
+
+
 def _find_default_windows_python() -> str:
     if has_venv():
         return sys.executable
@@ -203,13 +218,96 @@ def _get_sys_executable() -> str:
 def _resolve_python(python: str) -> str:
     if (path := Path(python)).is_file():
         return str(path.resolve())
-    if found := shutil.which(python):
+    if found := _which(python):
         return found
     if not WINDOWS and (found := find_unix_command_python(python)):
         return found
     raise InterpreterResolutionError(source="PIPX_DEFAULT_PYTHON", version=python)
 
 
+def interpreter_version(interpreter: str) -> str | None:
+    """The ``major.minor.micro`` version of ``interpreter``, or ``None`` when it doesn't run."""
+    return _remembered("version", interpreter, lambda: _probe_version(interpreter))
+
+
+def _probe_version(interpreter: str) -> tuple[str, str] | None:
+    process: Final[subprocess.CompletedProcess[str]] = run_subprocess(
+        [interpreter, "-c", "import sys; print('.'.join(str(part) for part in sys.version_info[:3]))"],
+        capture_stderr=False,
+        log_stdout=False,
+    )
+    if process.returncode != 0 or not (python_version := process.stdout.strip()):
+        return None
+    return shutil.which(interpreter) or interpreter, python_version
+
+
+def _which(command: str) -> str | None:
+    return _remembered("which", command, lambda: (found, found) if (found := shutil.which(command)) else None)
+
+
+def _remembered(kind: str, request: str, lookup: Callable[[], tuple[str, str] | None]) -> str | None:
+    """The answer ``lookup`` found for ``request`` in an earlier run, or a fresh one, which is then remembered.
+
+    ``lookup`` returns the executable its answer depends on along with the answer. An answer is reused while ``PATH``
+    is unchanged and that executable is still the same file, with the same inode and modification time. Nothing is
+    remembered when ``lookup`` finds nothing, so a newly installed interpreter is picked up on the next run.
+    """
+    cache_file: Final[Path] = paths.ctx.lookup_cache / INTERPRETER_CACHE_FILENAME
+    key: Final[str] = json.dumps([kind, request])
+    search_path: Final[str] = os.environ.get("PATH", "")
+    entries: Final[dict[str, dict[str, Any]]] = _read_interpreter_cache(cache_file)
+    if (
+        (entry := entries.get(key)) is not None
+        and entry["search_path"] == search_path
+        and entry["identity"] == _identity(entry["executable"])
+    ):
+        return str(entry["answer"])
+    if (found := lookup()) is None:
+        return None
+    executable, answer = found
+    if (identity := _identity(executable)) is not None:
+        entries[key] = {"search_path": search_path, "executable": executable, "identity": identity, "answer": answer}
+        _write_interpreter_cache(cache_file, entries)
+    return answer
+
+
+def _identity(executable: str) -> list[int] | None:
+    try:
+        executable_stat = Path(executable).stat()
+    except OSError:
+        return None
+    return [executable_stat.st_dev, executable_stat.st_ino, executable_stat.st_mtime_ns]
+
+
+def _read_interpreter_cache(cache_file: Path) -> dict[str, dict[str, Any]]:
+    """Entries of the interpreter cache, empty when it is missing, unreadable, or from another pipx."""
+    try:
+        with cache_file.open("rb") as cache_fh:
+            payload = json.load(cache_fh)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != _INTERPRETER_CACHE_VERSION:
+        return {}
+    entries = payload.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {
+        key: entry
+        for key, entry in entries.items()
+        if isinstance(entry, dict)
+        and all(isinstance(entry.get(name), str) for name in ("search_path", "executable", "answer"))
+        and isinstance(entry.get("identity"), list)
+    }
+
+
+def _write_interpreter_cache(cache_file: Path, entries: dict[str, dict[str, Any]]) -> None:
+    try:
+        replace_json({"version": _INTERPRETER_CACHE_VERSION, "entries": entries}, cache_file)
+    except OSError as exc:
+        # the cache only saves searching PATH and starting interpreters, so the next run simply does that again
+        logger.debug("Unable to write %s: %s", cache_file, exc)
+
+
 def get_default_python_spec() -> str:
     return get_environment_value("PIPX_DEFAULT_PYTHON") or sys.executable
 
@@ -230,6 +328,7 @@ def __getattr__(name: str) -> object:
 
 __all__ = [
     "DEFAULT_PYTHON",
+    "INTERPRETER_CACHE_FILENAME",
     "InterpreterResolutionError",
     "find_py_launcher_python",
     "find_python_interpreter",
@@ -237,4 +336,5 @@ __all__ = [
     "get_default_python",
     "get_default_python_spec",
     "has_venv",
+    "interpreter_version",
 ]
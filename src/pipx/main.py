@@ -21,11 +21,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final, NoReturn, cast
 
-import argcomplete
 import platformdirs
 from packaging.utils import canonicalize_name
 
-from pipx import commands, constants, paths
+from pipx import constants, paths
 from pipx.animate import hide_cursor, show_cursor
 from pipx.backends import KNOWN_BACKENDS, UV, env_default_backend, get_backend, resolve_backend_name
 from pipx.colors import bold, green
@@ -52,12 +51,14 @@ from pipx.interpreter import (
 from pipx.package_specifier import valid_pypi_name
 from pipx.result import OperationError, OperationResult, OutputFormat, error_envelope, render_result
 from pipx.shared_libs import skip_shared_libs_maintenance
+from pipx.trace import finish_trace, span, start_trace
 from pipx.util import PipxError, mkdir, pipx_wrap, rmdir
-from pipx.venv import VenvContainer
 from pipx.version import version as __version__
 
 if TYPE_CHECKING:
+    from pipx import commands
     from pipx.commands.upgrade import UpgradeData
+    from pipx.venv import VenvContainer
 
 logger = logging.getLogger(__name__)
 
@@ -185,12 +186,18 @@ class LineWrapRawTextHelpFormatter(argparse.RawDescriptionHelpFormatter):
 
 
 class InstalledVenvsCompleter:
-    def __init__(self, venv_container: VenvContainer) -> None:
-        self._venv_container: Final[VenvContainer] = venv_container
+    def __init__(self, venv_container: VenvContainer | None = None) -> None:
+        # without a container the installed venvs are looked up on first completion, so building the parser skips
+        # importing pipx.venv
+        self._venv_container: VenvContainer | None = venv_container
         self._packages: list[str] | None = None
 
     def use(self, prefix: str, **_kwargs: argparse.Action | argparse.ArgumentParser | argparse.Namespace) -> list[str]:
         if self._packages is None:
+            if self._venv_container is None:
+                from pipx.venv import VenvContainer
+
+                self._venv_container = VenvContainer(paths.ctx.venvs)
             self._packages = [path.name for path in sorted(self._venv_container.iter_venv_dirs())]
         canonical_prefix = canonicalize_name(prefix)
         return [
@@ -226,6 +233,27 @@ def _non_negative_int(value: str) -> int:
     return result
 
 
+def _positive_int(value: str) -> int:
+    msg = "--jobs must be a positive integer"
+    try:
+        result: Final[int] = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(msg) from exc
+    if result < 1:
+        raise argparse.ArgumentTypeError(msg)
+    return result
+
+
+def _add_jobs_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help="Work on up to N environments at the same time (default: 1)",
+    )
+
+
 def get_runpip_args(pip_args: list[str]) -> list[str]:
     if len(pip_args) != 1:
         return pip_args
@@ -297,6 +325,9 @@ def _validate_fetch_python() -> None:
 
 
 def run_pipx_command(args: argparse.Namespace) -> ExitCode:
+    from pipx.pipx_metadata_file import save_written_metadata
+    from pipx.venv import VenvContainer
+
     if "package" in args:
         package_is_url(args.package)
         package_is_path(args.package)
@@ -352,6 +383,9 @@ def run_pipx_command(args: argparse.Namespace) -> ExitCode:
                 )
                 return ExitCode(1)
             raise
+        finally:
+            # one index update for every venv the command wrote, however many that was
+            save_written_metadata(paths.ctx.venvs)
         if isinstance(result, OperationResult):
             return render_result(result, output=output, quiet=getattr(args, "quiet", 0))
         return result
@@ -593,7 +627,9 @@ def _add_install(subparsers: argparse._SubParsersAction, shared_parser: argparse
 
 
 def _cmd_install(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.InstallData]:
-    return commands.install(
+    from pipx.commands.install import install
+
+    return install(
         None,
         None,
         args.package_spec,
@@ -637,6 +673,7 @@ def _add_install_all(subparsers: argparse._SubParsersAction, shared_parser: argp
         action="store_true",
         help="Modify existing virtual environment and files in PIPX_BIN_DIR and PIPX_MAN_DIR",
     )
+    _add_jobs_option(p)
     add_python_options(p)
     add_pip_venv_args(p)
     add_backend_arg(p)
@@ -644,7 +681,9 @@ def _add_install_all(subparsers: argparse._SubParsersAction, shared_parser: argp
 
 
 def _cmd_install_all(args: argparse.Namespace, ctx: DispatchContext) -> ExitCode:
-    return commands.install_all(
+    from pipx.commands.install import install_all
+
+    return install_all(
         args.spec_metadata_file,
         paths.ctx.bin_dir,
         paths.ctx.man_dir,
@@ -656,6 +695,7 @@ def _cmd_install_all(args: argparse.Namespace, ctx: DispatchContext) -> ExitCode
         backend=ctx.backend,
         env_backend=ctx.env_backend,
         cooldown_days=ctx.cooldown_days,
+        jobs=args.jobs,
     )
 
 
@@ -690,6 +730,7 @@ def _add_manifest(
     )
     sync_parser.add_argument("manifest", type=Path, help="Path to the tool manifest.")
     sync_parser.add_argument("--prune", action="store_true", help="Uninstall environments absent from the manifest.")
+    _add_jobs_option(sync_parser)
     add_backend_arg(sync_parser)
     _add_output_option(sync_parser)
     sync_parser.set_defaults(func=_cmd_sync)
@@ -698,12 +739,16 @@ def _add_manifest(
 
 
 def _cmd_lock(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.ManifestData]:
+    from pipx.commands.manifest import lock_manifest
+
     del ctx
-    return commands.lock_manifest(args.manifest)
+    return lock_manifest(args.manifest)
 
 
 def _cmd_sync(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.ManifestData]:
-    return commands.sync_manifest(
+    from pipx.commands.manifest import sync_manifest
+
+    return sync_manifest(
         args.manifest,
         ctx.venv_container,
         paths.ctx.bin_dir,
@@ -713,6 +758,7 @@ def _cmd_sync(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult
         prune=args.prune,
         backend=ctx.backend,
         env_backend=ctx.env_backend,
+        jobs=args.jobs,
     )
 
 
@@ -774,9 +820,11 @@ def _add_inject(
 
 
 def _cmd_inject(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.InjectionData]:
+    from pipx.commands.inject import inject
+
     venv_dir = _venv_dir(args, ctx)
     with ctx.venv_container.venv_lock(venv_dir):
-        return commands.inject(
+        return inject(
             venv_dir,
             args.dependencies,
             args.requirements,
@@ -825,9 +873,11 @@ def _add_uninject(
 
 
 def _cmd_uninject(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.InjectionData]:
+    from pipx.commands.uninject import uninject
+
     venv_dir = _venv_dir(args, ctx)
     with ctx.venv_container.venv_lock(venv_dir):
-        return commands.uninject(
+        return uninject(
             venv_dir,
             args.dependencies,
             local_bin_dir=paths.ctx.bin_dir,
@@ -854,9 +904,11 @@ def _add_expose(
 
 
 def _cmd_expose(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.ExposureData]:
+    from pipx.commands.expose import expose
+
     venv_dir = _venv_dir(args, ctx)
     with ctx.venv_container.venv_lock(venv_dir):
-        return commands.expose(venv_dir, paths.ctx.bin_dir, paths.ctx.man_dir, verbose=ctx.verbose)
+        return expose(venv_dir, paths.ctx.bin_dir, paths.ctx.man_dir, verbose=ctx.verbose)
 
 
 def _add_unexpose(
@@ -876,9 +928,11 @@ def _add_unexpose(
 
 
 def _cmd_unexpose(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.ExposureData]:
+    from pipx.commands.expose import unexpose
+
     venv_dir = _venv_dir(args, ctx)
     with ctx.venv_container.venv_lock(venv_dir):
-        return commands.unexpose(venv_dir, paths.ctx.bin_dir, paths.ctx.man_dir, verbose=ctx.verbose)
+        return unexpose(venv_dir, paths.ctx.bin_dir, paths.ctx.man_dir, verbose=ctx.verbose)
 
 
 def _add_pin(subparsers: argparse._SubParsersAction, shared_parser: argparse.ArgumentParser) -> None:
@@ -908,9 +962,11 @@ def _add_pin(subparsers: argparse._SubParsersAction, shared_parser: argparse.Arg
 
 
 def _cmd_pin(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.PinData]:
+    from pipx.commands.pin import pin
+
     venv_dir = _venv_dir(args, ctx)
     with ctx.venv_container.venv_lock(venv_dir):
-        return commands.pin(venv_dir, ctx.skip_list, verbose=ctx.verbose, injected_only=args.injected_only)
+        return pin(venv_dir, ctx.skip_list, verbose=ctx.verbose, injected_only=args.injected_only)
 
 
 def _add_unpin(subparsers: argparse._SubParsersAction, shared_parser: argparse.ArgumentParser) -> None:
@@ -926,9 +982,11 @@ def _add_unpin(subparsers: argparse._SubParsersAction, shared_parser: argparse.A
 
 
 def _cmd_unpin(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.PinData]:
+    from pipx.commands.pin import unpin
+
     venv_dir = _venv_dir(args, ctx)
     with ctx.venv_container.venv_lock(venv_dir):
-        return commands.unpin(venv_dir, verbose=ctx.verbose)
+        return unpin(venv_dir, verbose=ctx.verbose)
 
 
 def _add_upgrade(
@@ -969,7 +1027,9 @@ def _add_upgrade(
 
 
 def _cmd_upgrade(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[UpgradeData]:
-    return commands.upgrade(
+    from pipx.commands.upgrade import upgrade
+
+    return upgrade(
         _venv_dirs(args, ctx),
         ctx.python,
         ctx.pip_args,
@@ -1006,6 +1066,12 @@ def _add_upgrade_all(subparsers: argparse._SubParsersAction, shared_parser: argp
         action="store_true",
         help="Modify existing virtual environment and files in PIPX_BIN_DIR and PIPX_MAN_DIR",
     )
+    p.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ask the package index for the latest versions instead of reusing recent answers",
+    )
+    _add_jobs_option(p)
     add_pip_venv_args(p)
     add_backend_arg(p)
     _add_output_option(p)
@@ -1013,7 +1079,9 @@ def _add_upgrade_all(subparsers: argparse._SubParsersAction, shared_parser: argp
 
 
 def _cmd_upgrade_all(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[UpgradeData]:
-    return commands.upgrade_all(
+    from pipx.commands.upgrade import upgrade_all
+
+    return upgrade_all(
         ctx.venv_container,
         verbose=ctx.verbose,
         include_injected=args.include_injected,
@@ -1024,6 +1092,8 @@ def _cmd_upgrade_all(args: argparse.Namespace, ctx: DispatchContext) -> Operatio
         backend=ctx.backend,
         env_backend=ctx.env_backend,
         cooldown_days=ctx.cooldown_days,
+        jobs=args.jobs,
+        refresh=args.refresh,
     )
 
 
@@ -1043,8 +1113,10 @@ def _add_upgrade_shared(subparsers: argparse._SubParsersAction, shared_parser: a
 
 
 def _cmd_upgrade_shared(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.SharedData]:
+    from pipx.commands.upgrade import upgrade_shared
+
     del args
-    return commands.upgrade_shared(ctx.pip_args, verbose=ctx.verbose)
+    return upgrade_shared(ctx.pip_args, verbose=ctx.verbose)
 
 
 def _add_uninstall(
@@ -1066,9 +1138,11 @@ def _add_uninstall(
 
 
 def _cmd_uninstall(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.UninstallData]:
+    from pipx.commands.uninstall import uninstall
+
     venv_dir = _venv_dir(args, ctx)
     with ctx.venv_container.venv_lock(venv_dir):
-        return commands.uninstall(venv_dir, paths.ctx.bin_dir, paths.ctx.man_dir, verbose=ctx.verbose)
+        return uninstall(venv_dir, paths.ctx.bin_dir, paths.ctx.man_dir, verbose=ctx.verbose)
 
 
 def _add_uninstall_all(subparsers: argparse._SubParsersAction, shared_parser: argparse.ArgumentParser) -> None:
@@ -1083,8 +1157,10 @@ def _add_uninstall_all(subparsers: argparse._SubParsersAction, shared_parser: ar
 
 
 def _cmd_uninstall_all(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.UninstallData]:
+    from pipx.commands.uninstall import uninstall_all
+
     del args
-    return commands.uninstall_all(ctx.venv_container, paths.ctx.bin_dir, paths.ctx.man_dir, verbose=ctx.verbose)
+    return uninstall_all(ctx.venv_container, paths.ctx.bin_dir, paths.ctx.man_dir, verbose=ctx.verbose)
 
 
 def _add_reset(subparsers: argparse._SubParsersAction, shared_parser: argparse.ArgumentParser) -> None:
@@ -1104,10 +1180,12 @@ def _add_reset(subparsers: argparse._SubParsersAction, shared_parser: argparse.A
 
 
 def _cmd_reset(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.ResetData]:
+    from pipx.commands.reset import reset
+
     if not args.dry_run and not args.yes and not _confirmed_reset():
         msg = "Reset cancelled."
         raise PipxError(msg)
-    return commands.reset(
+    return reset(
         ctx.venv_container,
         paths.ctx.bin_dir,
         paths.ctx.man_dir,
@@ -1154,9 +1232,11 @@ def _add_reinstall(
 
 
 def _cmd_reinstall(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.ReinstallData]:
+    from pipx.commands.reinstall import reinstall
+
     venv_dir = _venv_dir(args, ctx)
     with ctx.venv_container.venv_lock(venv_dir) as venv_lock:
-        return commands.reinstall(
+        return reinstall(
             venv_dir=venv_dir,
             local_bin_dir=paths.ctx.bin_dir,
             local_man_dir=paths.ctx.man_dir,
@@ -1189,14 +1269,16 @@ def _add_reinstall_all(subparsers: argparse._SubParsersAction, shared_parser: ar
     )
     add_python_options(p)
     p.add_argument("--skip", nargs="+", default=[], help="skip these packages")
+    _add_jobs_option(p)
     add_backend_arg(p)
     _add_output_option(p)
     p.set_defaults(func=_cmd_reinstall_all)
 
 
 def _cmd_reinstall_all(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.ReinstallData]:
-    del args
-    return commands.reinstall_all(
+    from pipx.commands.reinstall import reinstall_all
+
+    return reinstall_all(
         ctx.venv_container,
         paths.ctx.bin_dir,
         paths.ctx.man_dir,
@@ -1206,6 +1288,7 @@ def _cmd_reinstall_all(args: argparse.Namespace, ctx: DispatchContext) -> Operat
         python_flag_passed=ctx.python_flag_passed,
         backend=ctx.backend,
         env_backend=ctx.env_backend,
+        jobs=args.jobs,
     )
 
 
@@ -1226,7 +1309,9 @@ def _add_health(
 
 
 def _cmd_health(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.HealthData]:
-    return commands.health(ctx.venv_container, _selected_venv_dirs(args, ctx))
+    from pipx.commands.health import health
+
+    return health(ctx.venv_container, _selected_venv_dirs(args, ctx))
 
 
 def _add_repair(
@@ -1248,7 +1333,9 @@ def _add_repair(
 
 
 def _cmd_repair(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.RepairData]:
-    return commands.repair(
+    from pipx.commands.health import repair
+
+    return repair(
         ctx.venv_container,
         _selected_venv_dirs(args, ctx),
         paths.ctx.bin_dir,
@@ -1261,6 +1348,31 @@ def _cmd_repair(args: argparse.Namespace, ctx: DispatchContext) -> OperationResu
     )
 
 
+def _add_dedupe(
+    subparsers: argparse._SubParsersAction,
+    venv_completer: VenvCompleter,
+    shared_parser: argparse.ArgumentParser,
+) -> None:
+    parser = subparsers.add_parser(
+        "dedupe",
+        help="Hardlink identical installed files across package environments",
+        description=(
+            "Replace byte-identical files that installed packages share across environments with hardlinks to one "
+            "copy. Repeat runs only hash files that changed since the last one."
+        ),
+        parents=[shared_parser],
+    )
+    parser.add_argument("packages", nargs="*", help="Installed packages to deduplicate").completer = venv_completer
+    _add_output_option(parser)
+    parser.set_defaults(func=_cmd_dedupe)
+
+
+def _cmd_dedupe(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.DedupeData]:
+    from pipx.commands.dedupe import dedupe
+
+    return dedupe(ctx.venv_container, _selected_venv_dirs(args, ctx))
+
+
 def _selected_venv_dirs(args: argparse.Namespace, ctx: DispatchContext) -> tuple[Path, ...]:
     if args.packages:
         # spellings such as "black" and "Black" resolve to one venv, so drop the repeats
@@ -1285,6 +1397,11 @@ def _add_list(
         help="Show packages injected into the main app's environment",
     )
     p.add_argument("--outdated", action="store_true", help="List packages with an available upgrade.")
+    p.add_argument(
+        "--refresh",
+        action="store_true",
+        help="With --outdated, ask the package index again instead of reusing recent answers.",
+    )
     g = p.add_mutually_exclusive_group()
     g.add_argument("--short", action="store_true", help="List packages only.")
     g.add_argument(
@@ -1301,17 +1418,25 @@ def _add_list(
 
 
 def _cmd_list(args: argparse.Namespace, ctx: DispatchContext) -> ExitCode | OperationResult[commands.OutdatedData]:
+    from pipx.commands.list_packages import list_packages
+    from pipx.commands.outdated import list_outdated
+
     venv_dirs: Final[tuple[Path, ...]] = _installed_venv_dirs(args, ctx)
     if args.outdated:
         if args.short or args.pinned:
             msg = "--outdated cannot be combined with --short or --pinned."
             raise PipxError(msg)
-        return commands.list_outdated(ctx.venv_container, venv_dirs, include_injected=args.include_injected)
+        return list_outdated(
+            ctx.venv_container, venv_dirs, include_injected=args.include_injected, refresh=args.refresh
+        )
+    if args.refresh:
+        msg = "--refresh requires --outdated."
+        raise PipxError(msg)
     output: Final[OutputFormat] = _output_format(args)
     if output is OutputFormat.JSON and (args.short or args.pinned):
         msg = "--output json cannot be combined with --short or --pinned."
         raise PipxError(msg)
-    return commands.list_packages(
+    return list_packages(
         ctx.venv_container,
         venv_dirs,
         include_injected=args.include_injected,
@@ -1374,20 +1499,26 @@ def _add_interpreter(
 
 
 def _cmd_interpreter_list(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.InterpreterData]:
+    from pipx.commands.interpreter import list_interpreters
+
     del args
-    return commands.list_interpreters(ctx.venv_container)
+    return list_interpreters(ctx.venv_container)
 
 
 def _cmd_interpreter_prune(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.InterpreterData]:
+    from pipx.commands.interpreter import prune_interpreters
+
     del args
-    return commands.prune_interpreters(ctx.venv_container)
+    return prune_interpreters(ctx.venv_container)
 
 
 def _cmd_interpreter_upgrade(
     args: argparse.Namespace, ctx: DispatchContext
 ) -> OperationResult[commands.InterpreterData]:
+    from pipx.commands.interpreter import upgrade_interpreters
+
     del args
-    return commands.upgrade_interpreters(ctx.venv_container, verbose=ctx.verbose)
+    return upgrade_interpreters(ctx.venv_container, verbose=ctx.verbose)
 
 
 def _add_cache(
@@ -1425,13 +1556,19 @@ def _add_cache(
 
 
 def _cmd_cache_dir(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.CacheData]:
+    from pipx.commands.cache import print_cache_dir
+    from pipx.venv import VenvContainer
+
     del args, ctx
-    return commands.print_cache_dir(VenvContainer(paths.ctx.venv_cache))
+    return print_cache_dir(VenvContainer(paths.ctx.venv_cache))
 
 
 def _cmd_cache_purge(args: argparse.Namespace, ctx: DispatchContext) -> OperationResult[commands.CacheData]:
+    from pipx.commands.cache import purge_cache
+    from pipx.venv import VenvContainer
+
     del args, ctx
-    return commands.purge_cache(VenvContainer(paths.ctx.venv_cache))
+    return purge_cache(VenvContainer(paths.ctx.venv_cache))
 
 
 def _add_run(subparsers: argparse._SubParsersAction, shared_parser: argparse.ArgumentParser) -> None:
@@ -1515,7 +1652,9 @@ def _add_run(subparsers: argparse._SubParsersAction, shared_parser: argparse.Arg
 
 
 def _cmd_run(args: argparse.Namespace, ctx: DispatchContext) -> NoReturn:
-    commands.run(
+    from pipx.commands.run import run
+
+    run(
         args.app_with_args[0],
         ctx.spec,
         args.with_,
@@ -1564,9 +1703,11 @@ def _add_execute(
 
 
 def _cmd_execute(args: argparse.Namespace, ctx: DispatchContext) -> NoReturn:
+    from pipx.commands.execute import execute
+
     venv_dir: Final[Path] = _venv_dir(args, ctx)
     with ctx.venv_container.venv_lock(venv_dir):
-        commands.execute(args.package, venv_dir, args.app, args.app_args)
+        execute(args.package, venv_dir, args.app, args.app_args)
 
 
 def _add_runpip(
@@ -1594,9 +1735,11 @@ def _add_runpip(
 
 
 def _cmd_runpip(args: argparse.Namespace, ctx: DispatchContext) -> ExitCode:
+    from pipx.commands.run_pip import run_pip
+
     venv_dir = _venv_dir(args, ctx)
     with ctx.venv_container.venv_lock(venv_dir):
-        return commands.run_pip(args.package, venv_dir, get_runpip_args(args.pipargs), verbose=ctx.verbose)
+        return run_pip(args.package, venv_dir, get_runpip_args(args.pipargs), verbose=ctx.verbose)
 
 
 def _add_ensurepath(subparsers: argparse._SubParsersAction, shared_parser: argparse.ArgumentParser) -> None:
@@ -1643,9 +1786,11 @@ def _add_ensurepath(subparsers: argparse._SubParsersAction, shared_parser: argpa
 
 
 def _cmd_ensurepath(args: argparse.Namespace, ctx: DispatchContext) -> ExitCode:
+    from pipx.commands.ensure_path import ensure_pipx_paths
+
     del ctx
     try:
-        return commands.ensure_pipx_paths(
+        return ensure_pipx_paths(
             prepend=args.prepend,
             force=args.force,
             all_shells=args.all_shells,
@@ -1685,8 +1830,10 @@ def _add_environment(subparsers: argparse._SubParsersAction, shared_parser: argp
 
 
 def _cmd_environment(args: argparse.Namespace, ctx: DispatchContext) -> ExitCode:
+    from pipx.commands.environment import environment
+
     del ctx
-    return commands.environment(value=args.value)
+    return environment(value=args.value)
 
 
 def _venv_dir(args: argparse.Namespace, ctx: DispatchContext) -> Path:
@@ -1714,9 +1861,7 @@ def _make_print_help(
 
 
 def get_command_parser() -> tuple[argparse.ArgumentParser, dict[str, argparse.ArgumentParser]]:
-    venv_container = VenvContainer(paths.ctx.venvs)
-
-    completer_venvs = InstalledVenvsCompleter(venv_container)
+    completer_venvs = InstalledVenvsCompleter()
 
     shared_parser = argparse.ArgumentParser(add_help=False)
 
@@ -1784,6 +1929,7 @@ def get_command_parser() -> tuple[argparse.ArgumentParser, dict[str, argparse.Ar
     _add_reinstall_all(subparsers, shared_parser)
     _add_health(subparsers, completer_venvs.use, shared_parser)
     _add_repair(subparsers, completer_venvs.use, shared_parser)
+    _add_dedupe(subparsers, completer_venvs.use, shared_parser)
     _add_list(subparsers, completer_venvs.use, shared_parser)
     subparsers_with_subcommands["interpreter"] = _add_interpreter(subparsers, shared_parser)
     subparsers_with_subcommands["cache"] = _add_cache(subparsers, shared_parser)
@@ -2007,7 +2153,11 @@ def parse_pipx_args(parser: argparse.ArgumentParser, args: list[str]) -> argpars
 
 def _dispatch(argv: list[str]) -> ExitCode:
     parser, _ = get_command_parser()
-    argcomplete.autocomplete(parser, always_complete_options=False)
+    if "_ARGCOMPLETE" in os.environ:
+        # argcomplete is only needed when the shell asks for completions, which it signals through this variable
+        import argcomplete
+
+        argcomplete.autocomplete(parser, always_complete_options=False)
     parsed_pipx_args = parse_pipx_args(parser, argv)
     _validate_fetch_python()
     setup(parsed_pipx_args)
@@ -2022,7 +2172,9 @@ def cli() -> ExitCode:
     """Entry point from command line"""
     try:
         hide_cursor()
-        return _dispatch(sys.argv[1:])
+        start_trace()
+        with span("pipx", "command", argv=sys.argv[1:]):
+            return _dispatch(sys.argv[1:])
     except PipxError as e:
         print(str(e), file=sys.stderr)  # ruff:ignore[print]  # user-facing CLI output
         logger.debug("PipxError: %s", e, exc_info=True)
@@ -2034,6 +2186,7 @@ def cli() -> ExitCode:
         raise
     finally:
         logger.debug("pipx finished.")
+        finish_trace()
         show_cursor()
 
 
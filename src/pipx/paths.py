@@ -76,6 +76,17 @@ class _PathContext:
     def venv_cache(self) -> Path:
         return self.home / ".cache" if self._base_home else self._default_cache
 
+    @property
+    def lookup_cache(self) -> Path:
+        # what pipx remembers about interpreters, uv and package indexes, kept out of venv_cache, whose entries pipx
+        # run treats as its own venvs and evicts
+        return self.home / "lookups"
+
+    @property
+    def venv_templates(self) -> Path:
+        # clones are copied from here, so it stays on the filesystem of the venvs
+        return self.home / "templates"
+
     @property
     def trash(self) -> Path:
         # renaming into the trash has to stay on one filesystem, so it follows the venvs under the home
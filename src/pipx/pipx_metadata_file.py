@@ -5,17 +5,26 @@ import logging
 from contextlib import suppress
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Any, Final, TypedDict, cast
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Final, TypedDict, cast
 
 from pipx.backends._base import KNOWN_BACKENDS
 from pipx.emojis import hazard
-from pipx.util import PipxError, pipx_wrap
+from pipx.trace import TracedFileLock
+from pipx.util import PipxError, pipx_wrap, replace_json
+
+if TYPE_CHECKING:
+    import os
 
 _LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
 
 
 PIPX_INFO_FILENAME: Final[str] = "pipx_metadata.json"
+VENV_INDEX_FILENAME: Final[str] = ".pipx_venv_index.json"
+_VENV_INDEX_VERSION: Final[str] = "1"
+# index entries for the metadata this process wrote, by container, until save_written_metadata folds them in
+_WRITTEN_METADATA: Final[dict[Path, dict[str, _RawVenvIndexEntry]]] = {}
+_WRITTEN_METADATA_LOCK: Final[Lock] = Lock()
 
 
 class _RawPackageInfo(TypedDict, total=False):
@@ -62,10 +71,22 @@ class _RawMetadata(TypedDict, total=False):
     injected_packages: dict[str, _RawPackageInfo]
     backend: str
     exposure_enabled: bool
+    manifest_digest: str | None
     pipx_metadata_version: str
     pinned: bool
 
 
+class _RawVenvIndexEntry(TypedDict):
+    # ``(st_mtime_ns, st_size, st_ino)`` of the ``pipx_metadata.json`` the entry mirrors
+    stamp: list[int]
+    metadata: _RawMetadata
+
+
+class _RawVenvIndex(TypedDict):
+    pipx_venv_index_version: str
+    venvs: dict[str, _RawVenvIndexEntry]
+
+
 class _RawSpecVenvEntry(TypedDict):
     metadata: _RawMetadata
 
@@ -199,7 +220,7 @@ class PipxMetadata:
     # V0.4 -> Add source interpreter
     # V0.5 -> Add pinned
     # V0.6 -> Add backend (pip|uv)
-    __METADATA_VERSION__: Final[str] = "0.12"
+    __METADATA_VERSION__: Final[str] = "0.13"
 
     def __init__(self, venv_dir: Path, *, read: bool = True) -> None:
         self.venv_dir = venv_dir
@@ -232,6 +253,8 @@ class PipxMetadata:
         self.injected_packages: dict[str, PackageInfo] = {}
         self.backend: str = "pip"
         self.exposure_enabled: bool = True
+        # Set by ``pipx manifest sync`` for locked tools; a matching digest lets the next sync skip the backend.
+        self.manifest_digest: str | None = None
         # ``None`` until ``read()`` succeeds; lets callers tell a fresh
         # instance from one with authoritative on-disk values.
         self.read_metadata_version: str | None = None
@@ -251,12 +274,13 @@ class PipxMetadata:
             "injected_packages": {name: asdict(data) for (name, data) in self.injected_packages.items()},
             "backend": self.backend,
             "exposure_enabled": self.exposure_enabled,
+            "manifest_digest": self.manifest_digest,
             "pipx_metadata_version": self.__METADATA_VERSION__,
         }
 
     def _convert_legacy_metadata(self, metadata_dict: _RawMetadata) -> _RawMetadata:
         version = metadata_dict["pipx_metadata_version"]
-        if version in {self.__METADATA_VERSION__, "0.11", "0.10", "0.9", "0.8", "0.7", "0.6", "0.5"}:
+        if version in {self.__METADATA_VERSION__, "0.12", "0.11", "0.10", "0.9", "0.8", "0.7", "0.6", "0.5"}:
             pass
         elif version == "0.4":
             metadata_dict["pinned"] = False
@@ -314,6 +338,7 @@ class PipxMetadata:
             recorded_backend = "pip"
         self.backend = recorded_backend
         self.exposure_enabled = input_dict["exposure_enabled"]
+        self.manifest_digest = input_dict.get("manifest_digest")
         self.read_metadata_version = input_dict.get("pipx_metadata_version")
 
     def _validate_before_write(self) -> None:
@@ -328,25 +353,11 @@ class PipxMetadata:
 
     def write(self) -> None:
         self._validate_before_write()
-        temporary_path: Path | None = None
+        payload: Final[_RawMetadata] = cast("_RawMetadata", self.to_dict())
         try:
-            with NamedTemporaryFile(
-                "w",
-                encoding="utf-8",
-                dir=self.venv_dir,
-                prefix=f".{PIPX_INFO_FILENAME}.",
-                suffix=".tmp",
-                delete=False,
-            ) as pipx_metadata_fh:
-                temporary_path = Path(pipx_metadata_fh.name)
-                json.dump(
-                    self.to_dict(),
-                    pipx_metadata_fh,
-                    indent=4,
-                    sort_keys=True,
-                    cls=JsonEncoderHandlesPath,
-                )
-            temporary_path.replace(self.venv_dir / PIPX_INFO_FILENAME)
+            written = replace_json(
+                payload, self.venv_dir / PIPX_INFO_FILENAME, indent=4, encoder=JsonEncoderHandlesPath
+            )
         except OSError:
             _LOGGER.warning(
                 pipx_wrap(
@@ -359,10 +370,12 @@ class PipxMetadata:
                     subsequent_indent=" " * 4,
                 )
             )
-        finally:
-            if temporary_path is not None:
-                with suppress(OSError):
-                    temporary_path.unlink()
+            return
+        with _WRITTEN_METADATA_LOCK:
+            _WRITTEN_METADATA.setdefault(self.venv_dir.parent, {})[self.venv_dir.name] = {
+                "stamp": _stamp(written),
+                "metadata": payload,
+            }
 
     def read(self, *, verbose: bool = False) -> None:
         try:
@@ -385,6 +398,93 @@ class PipxMetadata:
             return
 
 
+class PipxMetadataIndex:
+    """The ``pipx_metadata.json`` of every venv in a container, mirrored into one file next to them.
+
+    Every metadata write of a pipx command reaches the index once the command is done, through
+    :func:`save_written_metadata`, and ``pipx list`` fills in the venvs it had to read itself. Each entry carries the
+    stat stamp of the file it copies, so a venv whose metadata changed since it was indexed, by another pipx or by hand,
+    is read from its own file again instead of being served stale.
+    """
+
+    def __init__(self, venvs_root: Path) -> None:
+        self.path = venvs_root / VENV_INDEX_FILENAME
+        self._entries: dict[str, _RawVenvIndexEntry] = self._read()
+        self._dirty = False
+
+    def _read(self) -> dict[str, _RawVenvIndexEntry]:
+        try:
+            with self.path.open("rb") as index_fh:
+                payload: _RawVenvIndex = json.load(index_fh, object_hook=_json_decoder_object_hook)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("pipx_venv_index_version") != _VENV_INDEX_VERSION:
+            return {}
+        venvs = payload.get("venvs")
+        return venvs if isinstance(venvs, dict) else {}
+
+    def metadata(self, venv_dir: Path) -> PipxMetadata:
+        """Return the metadata of ``venv_dir``, from the index while its entry is current and from disk otherwise."""
+        try:
+            stamp: Final[list[int]] = _stamp((venv_dir / PIPX_INFO_FILENAME).stat())
+        except OSError:
+            self._dirty |= self._entries.pop(venv_dir.name, None) is not None
+            return PipxMetadata(venv_dir)
+        if (entry := self._entries.get(venv_dir.name)) is not None and entry.get("stamp") == stamp:
+            metadata = PipxMetadata(venv_dir, read=False)
+            with suppress(AttributeError, KeyError, PipxError, TypeError, ValueError):
+                metadata.from_dict(entry["metadata"])
+                return metadata
+        metadata = PipxMetadata(venv_dir)
+        if metadata.read_metadata_version is None:
+            self._dirty |= self._entries.pop(venv_dir.name, None) is not None
+        else:
+            self.record(venv_dir.name, {"stamp": stamp, "metadata": cast("_RawMetadata", metadata.to_dict())})
+        return metadata
+
+    def record(self, venv_name: str, entry: _RawVenvIndexEntry) -> None:
+        self._entries[venv_name] = entry
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        venvs_root: Final[Path] = self.path.parent
+        try:
+            with TracedFileLock(self.path.with_name(f"{self.path.name}.lock")):
+                # keep what another pipx indexed since this one read the file; stamps catch any entry that went stale
+                entries = {**self._read(), **self._entries}
+                payload: _RawVenvIndex = {
+                    "pipx_venv_index_version": _VENV_INDEX_VERSION,
+                    "venvs": {name: entry for name, entry in entries.items() if (venvs_root / name).is_dir()},
+                }
+                replace_json(payload, self.path, encoder=JsonEncoderHandlesPath)
+        except OSError as error:
+            # a read-only container still lists from the venvs themselves
+            _LOGGER.debug("Unable to write %s: %s", self.path, error)
+        self._dirty = False
+
+
+def save_written_metadata(venvs_root: Path) -> None:
+    """Fold the metadata this process wrote under ``venvs_root`` into that container's index.
+
+    Writes into any other container, such as the ``pipx run`` cache, are dropped; nothing lists those.
+    """
+    with _WRITTEN_METADATA_LOCK:
+        written: Final[dict[str, _RawVenvIndexEntry]] = _WRITTEN_METADATA.pop(venvs_root, {})
+        _WRITTEN_METADATA.clear()
+    if not written:
+        return
+    venv_index: Final[PipxMetadataIndex] = PipxMetadataIndex(venvs_root)
+    for venv_name, entry in written.items():
+        venv_index.record(venv_name, entry)
+    venv_index.save()
+
+
+def _stamp(stat: os.stat_result) -> list[int]:
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
 def load_spec_file(path: Path) -> _RawSpecFile:
     # Round-trips Path values through :class:`JsonEncoderHandlesPath`'s hook.
     with Path(path).open(encoding="utf-8") as handle:
@@ -394,8 +494,11 @@ def load_spec_file(path: Path) -> _RawSpecFile:
 
 __all__ = [
     "PIPX_INFO_FILENAME",
+    "VENV_INDEX_FILENAME",
     "JsonEncoderHandlesPath",
     "PackageInfo",
     "PipxMetadata",
+    "PipxMetadataIndex",
     "load_spec_file",
+    "save_written_metadata",
 ]
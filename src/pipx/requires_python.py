@@ -7,8 +7,8 @@ from typing import TYPE_CHECKING, Final
 from packaging.specifiers import InvalidSpecifier, SpecifierSet
 
 from pipx.constants import MINIMUM_PYTHON_VERSION, FetchPythonOptions
-from pipx.interpreter import InterpreterResolutionError, find_python_interpreter
-from pipx.util import PipxError, run_subprocess
+from pipx.interpreter import InterpreterResolutionError, find_python_interpreter, interpreter_version
+from pipx.util import PipxError
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -99,12 +99,7 @@ def _minor_overlaps(constraint: SpecifierSet, minor: str) -> bool:
 
 
 def _interpreter_version(interpreter: str) -> str | None:
-    process = run_subprocess(
-        [interpreter, "-c", "import sys; print('.'.join(str(part) for part in sys.version_info[:3]))"],
-        capture_stderr=False,
-        log_stdout=False,
-    )
-    return process.stdout.strip() or None if process.returncode == 0 else None
+    return interpreter_version(interpreter)
 
 
 def _candidate_versions() -> Iterator[str]:
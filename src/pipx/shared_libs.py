@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
+import json
 import logging
 import os
 import time
@@ -8,31 +10,37 @@ from configparser import ConfigParser
 from configparser import Error as ConfigParserError
 from contextlib import contextmanager
 from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Final
 
-from filelock import BaseFileLock, FileLock
-
 from pipx import paths
 from pipx.animate import animate
 from pipx.constants import WINDOWS
 from pipx.emojis import strtobool
 from pipx.interpreter import get_default_python
+from pipx.trace import TracedFileLock
 from pipx.util import (
-    get_site_packages,
+    PipxError,
     get_venv_paths,
+    replace_json,
     run_subprocess,
     subprocess_post_check,
 )
+from pipx.venv_inspect import VenvProbe, probe_venv
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
+
+    from filelock import BaseFileLock
 
 logger = logging.getLogger(__name__)
 
 
 SHARED_LIBS_MAX_AGE_SEC: Final[float] = datetime.timedelta(days=30).total_seconds()
 DISABLE_SHARED_LIBS_AUTO_UPGRADE: Final[str] = "PIPX_DISABLE_SHARED_LIBS_AUTO_UPGRADE"
+SHARED_LIBS_STAMP_FILENAME: Final[str] = "pipx_shared_libs_stamp.json"
+_SHARED_LIBS_STAMP_VERSION: Final[int] = 1
 _SKIP_MAINTENANCE: Final[ContextVar[bool]] = ContextVar("skip_maintenance", default=False)
 
 
@@ -83,9 +91,22 @@ def _venv_python_is_valid(python_path: Path) -> bool:
     return True
 
 
+@dataclass(frozen=True)
+class _Stamp:
+    """What the shared venv looked like when its pip last imported, which holds while nothing below changes."""
+
+    python: str
+    # device, inode, and mtime of the interpreter the venv's python resolves to
+    identity: tuple[int, int, int]
+    pip_version: str
+    pip_record: str
+    site_packages: tuple[str, ...]
+
+
 class _SharedLibs:
     def __init__(self) -> None:
-        self._site_packages: dict[Path, list[Path]] = {}
+        self._probes: dict[Path, VenvProbe] = {}
+        self._stamps: dict[Path, _Stamp] = {}
         self._is_valid: bool | None = None
         self.has_been_updated_this_run = False
         self.has_been_logged_this_run = False
@@ -113,12 +134,22 @@ class _SharedLibs:
     def pip_path(self) -> Path:
         return self.bin_path / ("pip" if not WINDOWS else "pip.exe")
 
+    @property
+    def stamp_path(self) -> Path:
+        return self.root / SHARED_LIBS_STAMP_FILENAME
+
     @property
     def site_packages(self) -> list[Path]:
-        if self.python_path not in self._site_packages:
-            self._site_packages[self.python_path] = get_site_packages(self.python_path)
+        if (stamp := self._stamps.get(self.python_path)) is not None:
+            return [Path(path) for path in stamp.site_packages]
+        return self._probe().site_packages
 
-        return self._site_packages[self.python_path]
+    def _probe(self, *, check_pip: bool = False) -> VenvProbe:
+        # one round-trip answers both the validity check and the site-packages lookup for the same interpreter
+        cached = self._probes.get(self.python_path)
+        if cached is None or (check_pip and cached.pip_importable is None):
+            cached = self._probes[self.python_path] = probe_venv(self.python_path, check_pip=check_pip)
+        return cached
 
     def create(self, pip_args: list[str], *, verbose: bool = False, reinstall_pip: bool | None = None) -> None:
         with self._maintenance_lock():
@@ -126,7 +157,7 @@ class _SharedLibs:
 
     def _maintenance_lock(self) -> BaseFileLock:
         self.root.parent.mkdir(parents=True, exist_ok=True)
-        return FileLock(self.root.with_name(f".{self.root.name}.lock"))
+        return TracedFileLock(self.root.with_name(f".{self.root.name}.lock"))
 
     def _create(self, pip_args: list[str], *, verbose: bool, reinstall_pip: bool | None = None) -> None:
         if not self.is_valid:
@@ -136,6 +167,8 @@ class _SharedLibs:
                 )
             subprocess_post_check(create_process)
             self._is_valid = None
+            self._probes.pop(self.python_path, None)
+            self._stamps.pop(self.python_path, None)
 
             should_reinstall_pip = not shared_libs_auto_upgrade_disabled() if reinstall_pip is None else reinstall_pip
             if should_reinstall_pip:
@@ -150,6 +183,7 @@ class _SharedLibs:
                 [self.python_path, "-m", "pip", "--no-input", "uninstall", "-y", "setuptools"],
                 capture_stderr=False,
             )
+            self._write_stamp(reprobe=True)
 
     @property
     def is_valid(self) -> bool:
@@ -158,17 +192,98 @@ class _SharedLibs:
                 self.python_path.is_file()
                 and _venv_python_is_valid(self.python_path)
                 and self.pip_path.is_file()
-                and run_subprocess(
-                    [self.python_path, "-c", "from pip._internal.cli.main import main"],
-                    log_cmd_str="<checking pip's availability>",
-                    log_stdout=False,
-                    log_stderr=False,
-                ).returncode
-                == 0
+                and (self._stamp_matches() or self._pip_importable())
             )
 
         return self._is_valid
 
+    def _stamp_matches(self) -> bool:
+        """Whether the venv is unchanged since pip last imported in it, judged without starting its interpreter."""
+        stamp: Final[_Stamp | None] = self._read_stamp()
+        if stamp is None or self._observe(stamp.site_packages) != stamp:
+            return False
+        self._stamps[self.python_path] = stamp
+        return True
+
+    def _observe(self, site_packages: Iterable[str]) -> _Stamp | None:
+        site_packages = tuple(site_packages)
+        records: Final[list[Path]] = [
+            dist_info / "RECORD" for directory in site_packages for dist_info in Path(directory).glob("pip-*.dist-info")
+        ]
+        if len(records) != 1:
+            return None
+        try:
+            python_stat = self.python_path.stat()
+            pip_record = hashlib.sha256(records[0].read_bytes()).hexdigest()
+        except OSError:
+            return None
+        return _Stamp(
+            python=str(self.python_path),
+            identity=(python_stat.st_dev, python_stat.st_ino, python_stat.st_mtime_ns),
+            pip_version=records[0].parent.name.removeprefix("pip-").removesuffix(".dist-info"),
+            pip_record=pip_record,
+            site_packages=site_packages,
+        )
+
+    def _read_stamp(self) -> _Stamp | None:
+        try:
+            with self.stamp_path.open("rb") as stamp_fh:
+                payload = json.load(stamp_fh)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != _SHARED_LIBS_STAMP_VERSION:
+            return None
+        try:
+            device, inode, mtime = payload["identity"]
+            return _Stamp(
+                python=payload["python"],
+                identity=(device, inode, mtime),
+                pip_version=payload["pip_version"],
+                pip_record=payload["pip_record"],
+                site_packages=tuple(payload["site_packages"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            # a stamp of the wrong shape never matches what is observed, so the venv is checked the slow way
+            return None
+
+    def _write_stamp(self, *, reprobe: bool = False) -> None:
+        """Record the venv as it is now, once pip was seen working in it, so later runs can skip the import check.
+
+        Pass ``reprobe`` after changing the venv's packages, so pip is imported again rather than trusted from a probe
+        taken before the change.
+        """
+        self._stamps.pop(self.python_path, None)
+        if reprobe:
+            self._probes.pop(self.python_path, None)
+        try:
+            probe = self._probe(check_pip=True)
+        except PipxError as exc:
+            logger.debug("Unable to stamp %s: %s", self.root, exc)
+            return
+        stamp: Final[_Stamp | None] = (
+            self._observe(str(path) for path in probe.site_packages) if probe.pip_importable else None
+        )
+        try:
+            if stamp is None:
+                self.stamp_path.unlink(missing_ok=True)
+            else:
+                replace_json({"version": _SHARED_LIBS_STAMP_VERSION, **asdict(stamp)}, self.stamp_path)
+        except OSError as exc:
+            # without the stamp the next run checks the venv by starting its interpreter
+            logger.debug("Unable to write %s: %s", self.stamp_path, exc)
+            return
+        if stamp is not None:
+            self._stamps[self.python_path] = stamp
+
+    def _pip_importable(self) -> bool:
+        try:
+            importable = bool(self._probe(check_pip=True).pip_importable)
+        except PipxError:
+            return False
+        if importable:
+            self._write_stamp()
+        return importable
+
     @property
     def needs_upgrade(self) -> bool:
         if self.has_been_updated_this_run:
@@ -230,6 +345,8 @@ class _SharedLibs:
             logger.exception("Failed to upgrade shared libraries", exc_info=not raises)
             if raises:
                 raise
+        else:
+            self._write_stamp(reprobe=True)
 
 
 shared_libs = _SharedLibs()
@@ -238,6 +355,7 @@ shared_libs = _SharedLibs()
 __all__ = [
     "DISABLE_SHARED_LIBS_AUTO_UPGRADE",
     "SHARED_LIBS_MAX_AGE_SEC",
+    "SHARED_LIBS_STAMP_FILENAME",
     "shared_libs",
     "shared_libs_auto_upgrade_disabled",
     "skip_shared_libs_maintenance",
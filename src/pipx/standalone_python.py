@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime
 import hashlib
 import http.client
+import io
 import json
 import logging
 import os
@@ -11,17 +12,27 @@ import re
 import shutil
 import tarfile
 import tempfile
+import threading
 import time
 import urllib.error
-from functools import partial
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from http import HTTPStatus
+from itertools import pairwise, starmap
 from pathlib import Path, PurePosixPath
-from typing import Any, Final, TypedDict, cast
+from typing import TYPE_CHECKING, Any, Final, TypedDict, cast
 from urllib.request import Request, urlopen
 
 from pipx import constants, paths
 from pipx.animate import animate
-from pipx.util import PipxError
+from pipx.trace import span, traced
+from pipx.util import PipxError, replace_json
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from _typeshed import WriteableBuffer
 
 _LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
 
@@ -59,6 +70,13 @@ _INDEX_MAX_AGE: Final[datetime.timedelta] = datetime.timedelta(days=30)
 _RELEASE_ENTRY_LEN: Final[int] = 2
 _FETCH_ATTEMPTS: Final[int] = 3
 _FETCH_BACKOFF_SECONDS: Final[float] = 0.5
+# a build archive is ~32MB, which a few connections to GitHub's release CDN fetch in parallel much faster than one
+_DOWNLOAD_CONNECTIONS: Final[int] = 4
+_MIN_DOWNLOAD_CHUNK_SIZE: Final[int] = 4 * 1024 * 1024
+# read in 32KB chunks to avoid ballooning memory usage
+_READ_SIZE: Final[int] = 32768
+# how far the download may run ahead of the extraction before it waits for it
+_UNPACK_BUFFER_SIZE: Final[int] = 1024 * 1024
 # GitHub's release CDN answers with transient 5xx (and 429 under rate limiting) often enough that a single failure
 # should not abort a download; these statuses are safe to retry, unlike a 404 for a genuinely missing build.
 _RETRYABLE_HTTP_STATUS: Final[frozenset[int]] = frozenset({429, 500, 502, 503, 504})
@@ -74,7 +92,18 @@ _TRANSIENT_NETWORK_ERRORS: Final[tuple[type[Exception], ...]] = (
 
 class _PythonIndex(TypedDict):
     fetched: float
+    # only this machine's builds, one per version and newest first
+    releases: list[tuple[str, str]]
+    suffixes: list[str]
+    etag: str | None
+    last_modified: str | None
+
+
+@dataclass(frozen=True)
+class _Release:
     releases: list[tuple[str, str]]
+    etag: str | None
+    last_modified: str | None
 
 
 def download_python_build_standalone(python_version: str, *, override: bool = False) -> str:
@@ -101,17 +130,14 @@ def download_python_build_standalone(python_version: str, *, override: bool = Fa
     full_version, (download_link, digest) = resolve_python_version(python_version)
 
     with tempfile.TemporaryDirectory() as tempdir:
-        archive = Path(tempdir) / f"python-{full_version}.tar.gz"
         download_dir = Path(tempdir) / "download"
 
-        # download the python build gz
-        _download(full_version, download_link, archive)
-
-        # unpack the python build
-        _unpack(full_version, archive, download_dir, digest)
+        # unpack the python build gz while it downloads, checking its digest as it arrives
+        _download(full_version, download_link, download_dir, digest)
 
         # the python installation we want is nested in the tarball under a directory named 'python'; only after it is
-        # fully extracted do we swap it into place, so a failed download or unpack never destroys a working interpreter
+        # fully extracted and its digest matches do we swap it into place, so a failed download or unpack never
+        # destroys a working interpreter
         _install_atomically(download_dir / "python", install_dir)
 
     return str(installed_python)
@@ -140,37 +166,314 @@ def _install_atomically(source: Path, install_dir: Path) -> None:
         shutil.rmtree(backup_dir, ignore_errors=True)
 
 
-def _download(full_version: str, download_link: str, archive: Path) -> None:
-    with animate(f"Downloading python {full_version} build", do_animation=True):
+def _download(full_version: str, download_link: str, download_dir: Path, expected_checksum: str) -> None:
+    """Download the build and extract it into ``download_dir`` as its bytes arrive, with no archive on disk."""
+    stream: Final[_ArchiveStream] = _ArchiveStream()
+    with (
+        animate(f"Downloading python {full_version} build", do_animation=True),
+        ThreadPoolExecutor(max_workers=1) as unpacker,
+    ):
+        unpacked: Final[Future[None]] = unpacker.submit(_unpack, full_version, stream, download_dir)
+        # past the last member (or a broken one) the rest of the archive is still hashed, just no longer buffered
+        unpacked.add_done_callback(lambda _: stream.abandon())
         try:
-            _download_resuming(download_link, archive)
+            checksum = _download_resuming(download_link, download_dir.parent, stream.feed)
         except _TRANSIENT_NETWORK_ERRORS as e:
             msg = f"Unable to download python {full_version} build."
             raise PipxError(msg) from e
+        finally:
+            stream.finish()
+    # a tampered archive can still extract cleanly, so nothing it produced is used until its digest matches
+    if checksum != expected_checksum:
+        msg = f"Checksum mismatch for python {full_version} build. Expected {expected_checksum}, got {checksum}."
+        raise PipxError(msg)
+    unpacked.result()
+
+
+class _ArchiveStream(io.RawIOBase):
+    """The archive's bytes in order, handed from the download to the extraction while they arrive."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pending: Final[deque[bytes]] = deque()
+        self._pending_size = 0
+        self._consumed = 0
+        self._finished = False
+        self._abandoned = False
+        self._condition: Final[threading.Condition] = threading.Condition()
+
+    def readable(self) -> bool:  # ruff:ignore[no-self-use]  # io.RawIOBase's read() only works on a readable stream
+        return True
+
+    def readinto(self, buffer: WriteableBuffer) -> int:
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending or self._finished)
+            if not self._pending:
+                return 0
+            head = self._pending[0]
+            view = memoryview(buffer)
+            size = min(view.nbytes, len(head) - self._consumed)
+            view[:size] = head[self._consumed : self._consumed + size]
+            self._consumed += size
+            if self._consumed == len(head):
+                self._pending.popleft()
+                self._consumed = 0
+            self._pending_size -= size
+            self._condition.notify_all()
+            return size
+
+    def feed(self, data: bytes) -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending_size < _UNPACK_BUFFER_SIZE or self._abandoned)
+            # an empty read would look like the end of the archive
+            if self._abandoned or not data:
+                return
+            self._pending.append(data)
+            self._pending_size += len(data)
+            self._condition.notify_all()
+
+    def finish(self) -> None:
+        """Mark the end of the archive, after which reads drain what is left and then return nothing."""
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+
+    def abandon(self) -> None:
+        """Drop whatever is buffered and everything fed from now on, once the extraction stops reading."""
+        with self._condition:
+            self._abandoned = True
+            self._pending.clear()
+            self._pending_size = 0
+            self._condition.notify_all()
+
+
+@dataclass
+class _Chunk:
+    start: int
+    # exclusive, and unknown while a server that can't say how long the archive is streams it whole
+    end: int | None
+    written: int = 0
+
+    @property
+    def offset(self) -> int:
+        return self.start + self.written
+
+    @property
+    def complete(self) -> bool:
+        return self.end is not None and self.offset >= self.end
+
+
+@dataclass(frozen=True)
+class _Buffered:
+    """Bytes a chunk wrote to its part file before the chunks ahead of it caught up."""
+
+    part: Path
+    start: int
+    size: int
+
+
+class _Download:
+    """An archive fetched by one or more ranged requests at once, and handed on in order while its bytes arrive.
+
+    Bytes that arrive ahead of the ones before them wait in a part file of their chunk until those catch up.
+    """
+
+    def __init__(self, parts_dir: Path, sink: Callable[[bytes], None]) -> None:
+        self.parts_dir: Final[Path] = parts_dir
+        self.chunks: Final[list[_Chunk]] = [_Chunk(0, None)]
+        self.failed: Final[threading.Event] = threading.Event()
+        self._sink: Final[Callable[[bytes], None]] = sink
+        self._digest = hashlib.sha256()
+        # how far the archive is queued to be handed on, and what is queued, in order
+        self._claimed = 0
+        self._outbox: Final[deque[bytes | _Buffered]] = deque()
+        self._queued_size = 0
+        self._lock: Final[threading.Lock] = threading.Lock()
+        # the sink blocks while the extraction catches up, so it is fed outside the lock, by one thread at a time
+        self._handing_on: Final[threading.Lock] = threading.Lock()
+
+    def split(self, size: int) -> list[_Chunk]:
+        """Cut the archive into chunks for parallel requests, the first of which the opening request carries on."""
+        count: Final[int] = max(1, min(_DOWNLOAD_CONNECTIONS, size // _MIN_DOWNLOAD_CHUNK_SIZE))
+        bounds: Final[list[int]] = [size * index // count for index in range(count + 1)]
+        self.chunks[0].end = bounds[1]
+        self.chunks.extend(starmap(_Chunk, pairwise(bounds[1:])))
+        return self.chunks[1:]
+
+    def record(self, chunk: _Chunk, data: bytes) -> None:
+        with self._lock:
+            if chunk.offset == self._claimed:
+                self._outbox.append(data)
+                self._queued_size += len(data)
+                self._claimed += len(data)
+            else:
+                with self._part(chunk).open("ab") as part_fh:
+                    part_fh.write(data)
+            chunk.written += len(data)
+            self._catch_up()
+        self._hand_on()
 
+    def fetch(self, url: str, chunk: _Chunk, on_size: Callable[[int, str], None] | None = None) -> None:
+        try:
+            _fetch_chunk(self, url, chunk, on_size)
+        except BaseException:
+            # the other connections stop at their next read rather than finish a download that already failed
+            self.failed.set()
+            raise
+
+    def checksum(self) -> str:
+        return f"sha256:{self._digest.hexdigest()}"
+
+    def _catch_up(self) -> None:
+        # once the chunk at the front is done, whatever the next ones buffered is queued to be read back
+        for chunk in self.chunks:
+            if chunk.start > self._claimed:
+                return
+            if chunk.offset > self._claimed:
+                self._outbox.append(
+                    _Buffered(self._part(chunk), self._claimed - chunk.start, chunk.offset - self._claimed)
+                )
+                # from here on the chunk's bytes are queued as they arrive
+                self._claimed = chunk.offset
+            if not chunk.complete:
+                return
 
-def _download_resuming(url: str, archive: Path) -> None:
-    archive.touch()
+    def _hand_on(self) -> None:
+        # whoever finds the queue non-empty after the feeding thread let go takes over, so nothing is left behind; a
+        # connection that got a whole unpacking buffer ahead waits for its turn rather than queue more in memory
+        while self._outbox:
+            if not self._handing_on.acquire(blocking=self._queued_size >= _UNPACK_BUFFER_SIZE):
+                return
+            try:
+                while (queued := self._next_queued()) is not None:
+                    self._hand_on_queued(queued)
+            finally:
+                self._handing_on.release()
+
+    def _next_queued(self) -> bytes | _Buffered | None:
+        with self._lock:
+            if not self._outbox:
+                return None
+            queued: Final[bytes | _Buffered] = self._outbox.popleft()
+            if isinstance(queued, bytes):
+                self._queued_size -= len(queued)
+            return queued
+
+    def _hand_on_queued(self, queued: bytes | _Buffered) -> None:
+        if isinstance(queued, bytes):
+            self._deliver(queued)
+            return
+        with queued.part.open("rb") as part_fh:
+            part_fh.seek(queued.start)
+            remaining = queued.size
+            while remaining and (caught_up := part_fh.read(min(_READ_SIZE, remaining))):
+                self._deliver(caught_up)
+                remaining -= len(caught_up)
+        queued.part.unlink()
+
+    def _deliver(self, data: bytes) -> None:
+        self._digest.update(data)
+        self._sink(data)
+
+    def _part(self, chunk: _Chunk) -> Path:
+        return self.parts_dir / f".part-{chunk.start}"
+
+
+def _download_resuming(url: str, parts_dir: Path, sink: Callable[[bytes], None]) -> str:
+    """Download ``url``, hand its bytes to ``sink`` in order, and return its ``sha256:`` checksum.
+
+    When the server accepts ranges and the archive is large enough, it arrives over several connections at once, and
+    ``parts_dir`` holds what the later ones fetch until the earlier ones catch up. Each chunk resumes from its own last
+    byte after a dropped connection.
+    """
+    download: Final[_Download] = _Download(parts_dir, sink)
+    with ThreadPoolExecutor(max_workers=_DOWNLOAD_CONNECTIONS - 1) as executor:
+        tails: Final[list[Future[None]]] = []
+
+        def split(size: int, location: str) -> None:
+            tails.extend(executor.submit(download.fetch, location, chunk) for chunk in download.split(size))
+
+        download.fetch(url, download.chunks[0], on_size=split)
+        for tail in tails:
+            tail.result()
+    return download.checksum()
+
+
+def _fetch_chunk(
+    download: _Download,
+    url: str,
+    chunk: _Chunk,
+    on_size: Callable[[int, str], None] | None,
+) -> None:
     attempt = 0
-    while True:
-        attempt += 1
-        with archive.open("r+b") as file_handle:
-            written = file_handle.seek(0, os.SEEK_END)
-            # url comes from the pinned GitHub release index; a build archive is ~32MB, so on a dropped connection ask
-            # the CDN to continue from the bytes already on disk instead of downloading everything again
-            request = Request(url, headers={"Range": f"bytes={written}-"} if written else {})  # ruff:ignore[suspicious-url-open-usage]
+    with span("download", "network", url=url, start=chunk.start):
+        while not chunk.complete and not download.failed.is_set():
+            attempt += 1
             try:
-                with urlopen(request, timeout=_URL_OPEN_TIMEOUT) as response:  # ruff:ignore[suspicious-url-open-usage]
-                    if written and response.status != HTTPStatus.PARTIAL_CONTENT:
-                        # the server ignored the range request and answered with the whole file
-                        file_handle.seek(0)
-                        file_handle.truncate()
-                    # read in 32KB chunks to avoid ballooning memory usage
-                    file_handle.writelines(iter(partial(response.read, 32768), b""))
+                _fetch_once(download, url, chunk, on_size)
             except _TRANSIENT_NETWORK_ERRORS as error:
                 _backoff_or_raise(error, attempt, url)
-            else:
-                return
+
+
+def _fetch_once(
+    download: _Download,
+    url: str,
+    chunk: _Chunk,
+    on_size: Callable[[int, str], None] | None,
+) -> None:
+    # url comes from the pinned GitHub release index
+    request = Request(url, headers=_range_headers(chunk))  # ruff:ignore[suspicious-url-open-usage]
+    with urlopen(request, timeout=_URL_OPEN_TIMEOUT) as response:  # ruff:ignore[suspicious-url-open-usage]
+        # only a download that has received nothing yet can still be split up
+        if (
+            on_size is not None
+            and not chunk.written
+            and len(download.chunks) == 1
+            and (size := _ranged_size(response)) is not None
+        ):
+            on_size(size, response.geturl())
+        _read_response(download, chunk, response)
+    if not chunk.complete and chunk.end is not None and not download.failed.is_set():
+        # the server closed the connection cleanly before the chunk's last byte
+        received = b""
+        raise http.client.IncompleteRead(received, chunk.end - chunk.offset)
+
+
+def _range_headers(chunk: _Chunk) -> dict[str, str]:
+    if not chunk.offset and chunk.end is None:
+        return {}
+    # on a dropped connection ask the CDN to continue from the bytes already received instead of starting over
+    return {"Range": f"bytes={chunk.offset}-{'' if chunk.end is None else chunk.end - 1}"}
+
+
+def _ranged_size(response: http.client.HTTPResponse) -> int | None:
+    """The archive size, when the opening response is the whole archive from a server that also serves ranges."""
+    headers = getattr(response, "headers", None)
+    if getattr(response, "status", None) != HTTPStatus.OK or headers is None:
+        return None
+    length = headers.get("Content-Length")
+    if headers.get("Accept-Ranges") != "bytes" or not isinstance(length, str) or not length.isdigit():
+        return None
+    return int(length)
+
+
+def _read_response(download: _Download, chunk: _Chunk, response: http.client.HTTPResponse) -> None:
+    # a server that ignores the range answers with the whole archive, so skip what was already received
+    skip = chunk.offset if getattr(response, "status", None) != HTTPStatus.PARTIAL_CONTENT else 0
+    while not download.failed.is_set():
+        data = response.read(_READ_SIZE)
+        if not data:
+            if chunk.end is None:
+                chunk.end = chunk.offset
+            return
+        if skip:
+            skipped = min(skip, len(data))
+            data, skip = data[skipped:], skip - skipped
+        if chunk.end is not None:
+            data = data[: chunk.end - chunk.offset]
+        download.record(chunk, data)
+        if chunk.complete:
+            return
 
 
 def _backoff_or_raise(error: Exception, attempt: int, url: str) -> None:
@@ -181,37 +484,23 @@ def _backoff_or_raise(error: Exception, attempt: int, url: str) -> None:
     time.sleep(_FETCH_BACKOFF_SECONDS * 2 ** (attempt - 1))
 
 
-def _unpack(full_version: str, archive: Path, download_dir: Path, expected_checksum: str) -> None:
-    with animate(f"Unpacking python {full_version} build", do_animation=True):
-        # Calculate checksum efficiently
-        sha256_hash = hashlib.sha256()
-        with Path(archive).open("rb") as python_zip:
-            # Read in chunks to avoid loading the whole file into memory
-            for chunk in iter(lambda: python_zip.read(32768), b""):
-                sha256_hash.update(chunk)
-
-        checksum = "sha256:" + sha256_hash.hexdigest()
-
-        # Validate checksum
-        if checksum != expected_checksum:
-            msg = f"Checksum mismatch for python {full_version} build. Expected {expected_checksum}, got {checksum}."
-            raise PipxError(msg)
-
-        try:
-            with tarfile.open(archive, mode="r:gz") as tar:
-                if hasattr(tarfile, "data_filter"):
-                    tar.extractall(download_dir, filter="data")
-                else:
-                    # Python 3.10.0-3.10.11 predate tarfile's data filter, so validate and extract by hand
-                    _extract_safely(tar, download_dir)
-        except tarfile.TarError as error:
-            msg = f"Unable to unpack python {full_version} build."
-            raise PipxError(msg) from error
+def _unpack(full_version: str, stream: _ArchiveStream, download_dir: Path) -> None:
+    try:
+        # a stream-mode archive is read front to back once, so each member is extracted as soon as its bytes arrive
+        with tarfile.open(fileobj=stream, mode="r|gz") as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(download_dir, filter="data")
+            else:
+                # Python 3.10.0-3.10.11 predate tarfile's data filter, so validate and extract by hand
+                _extract_safely(tar, download_dir)
+    except tarfile.TarError as error:
+        msg = f"Unable to unpack python {full_version} build."
+        raise PipxError(msg) from error
 
 
 def _extract_safely(tar: tarfile.TarFile, dest: Path) -> None:
     root: Final[Path] = dest.resolve()
-    for member in tar.getmembers():
+    for member in tar:
         if member.isdev():
             continue  # the data filter drops device, block, and fifo entries
         _reject_escape(member, root)
@@ -261,10 +550,13 @@ def _is_valid_python_index(index: object) -> bool:
 
     fetched = index.get("fetched")
     releases = index.get("releases")
-    if not isinstance(fetched, int | float) or not isinstance(releases, list):
+    suffixes = index.get("suffixes", [])
+    if not isinstance(fetched, int | float) or not isinstance(releases, list) or not isinstance(suffixes, list):
+        return False
+    if not all(isinstance(index.get(key), str | None) for key in ("etag", "last_modified")):
         return False
 
-    return all(
+    return all(isinstance(suffix, str) for suffix in suffixes) and all(
         isinstance(release, (list, tuple))
         and len(release) == _RELEASE_ENTRY_LEN
         and all(isinstance(value, str) for value in release)
@@ -274,49 +566,113 @@ def _is_valid_python_index(index: object) -> bool:
 
 def get_or_update_index(*, use_cache: bool = True) -> _PythonIndex:
     """Get or update the index of available python builds from
-    the python-build-standalone repository."""
+    the python-build-standalone repository.
+
+    Only builds for this machine are kept, newest first. Once the index is 30 days old, or when ``use_cache`` is
+    false, GitHub is asked whether its release changed, and only a changed release is downloaded again."""
+    suffixes: Final[list[str]] = _machine_suffixes()
     index_file = paths.ctx.standalone_python_cachedir / "index.json"
-    index: _PythonIndex | dict[str, object] = {}
-    if use_cache and index_file.exists():
-        loaded = json.loads(index_file.read_text())
-        # Refresh legacy URL-only indexes, and update current indexes after 30 days.
-        if _is_valid_python_index(loaded):
-            fetched = datetime.datetime.fromtimestamp(loaded["fetched"], tz=datetime.timezone.utc)
-            if datetime.datetime.now(tz=datetime.timezone.utc) - fetched <= _INDEX_MAX_AGE:
-                index = cast("_PythonIndex", loaded)
-    if not index:
-        releases = get_latest_python_releases()
-        index = {"fetched": datetime.datetime.now(tz=datetime.timezone.utc).timestamp(), "releases": releases}
-        # update index
-        index_file.write_text(json.dumps(index))
-    return cast("_PythonIndex", index)
+    now: Final[float] = datetime.datetime.now(tz=datetime.timezone.utc).timestamp()
+    cached: Final[_PythonIndex | None] = _read_index(index_file, suffixes)
+    if use_cache and cached is not None and now - cached["fetched"] <= _INDEX_MAX_AGE.total_seconds():
+        return cached
+
+    release: Final[_Release | None] = _fetch_latest_release(_revalidation_headers(cached))
+    index: _PythonIndex
+    if release is None and cached is not None:
+        index = cached.copy()
+        index["fetched"] = now
+    else:
+        latest = release or _Release([], None, None)
+        index = {
+            "fetched": now,
+            "releases": _sorted_releases(latest.releases, suffixes),
+            "suffixes": suffixes,
+            "etag": latest.etag,
+            "last_modified": latest.last_modified,
+        }
+    # update index
+    replace_json(index, index_file)
+    return index
+
+
+def _read_index(index_file: Path, suffixes: list[str]) -> _PythonIndex | None:
+    try:
+        loaded = json.loads(index_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    # Refresh legacy URL-only indexes.
+    if not _is_valid_python_index(loaded):
+        return None
+    if "suffixes" not in loaded:
+        # an index from before pruning lists every platform's builds, so this machine's are picked out of it once
+        index: _PythonIndex = {
+            "fetched": loaded["fetched"],
+            "releases": _sorted_releases([(link, digest) for link, digest in loaded["releases"]], suffixes),
+            "suffixes": suffixes,
+            "etag": None,
+            "last_modified": None,
+        }
+        replace_json(index, index_file)
+        return index
+    # a home directory shared with another kind of machine holds that machine's builds
+    if loaded["suffixes"] != suffixes:
+        return None
+    return cast("_PythonIndex", loaded)
+
+
+def _revalidation_headers(cached: _PythonIndex | None) -> dict[str, str]:
+    headers: Final[dict[str, str]] = {}
+    if cached is not None and cached["etag"] is not None:
+        headers["If-None-Match"] = cached["etag"]
+    if cached is not None and cached["last_modified"] is not None:
+        headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
 
 
 def get_latest_python_releases() -> list[tuple[str, str]]:
     """Returns the list of python download links from the latest github release."""
+    release: Final[_Release | None] = _fetch_latest_release({})
+    # without a validator to match, GitHub always answers with the release itself
+    return [] if release is None else release.releases
+
+
+def _fetch_latest_release(headers: dict[str, str]) -> _Release | None:
+    """The latest release, or ``None`` when it still matches the validators in ``headers``."""
     try:
-        release_data = _fetch_release_data()
+        return _fetch_release_data(headers)
     except _TRANSIENT_NETWORK_ERRORS as e:
         msg = f"Unable to fetch python-build-standalone release data (from {GITHUB_API_URL})."
         raise PipxError(msg) from e
 
-    return [(asset["browser_download_url"], asset["digest"]) for asset in release_data["assets"]]
 
-
-def _fetch_release_data() -> dict[str, list[dict[str, str]]]:
+@traced("network")
+def _fetch_release_data(headers: dict[str, str]) -> _Release | None:
+    request: Final[Request] = Request(GITHUB_API_URL, headers=headers)
     attempt = 0
     while True:
         attempt += 1
         try:
             # the index body is small, so unlike the archive download a retry re-fetches it whole
-            with urlopen(GITHUB_API_URL, timeout=_URL_OPEN_TIMEOUT) as response:
-                return cast("dict[str, list[dict[str, str]]]", json.load(response))
+            with urlopen(request, timeout=_URL_OPEN_TIMEOUT) as response:  # ruff:ignore[suspicious-url-open-usage]
+                release_data = cast("dict[str, list[dict[str, str]]]", json.load(response))
+                response_headers = getattr(response, "headers", None) or {}
+                return _Release(
+                    [(asset["browser_download_url"], asset["digest"]) for asset in release_data["assets"]],
+                    response_headers.get("ETag"),
+                    response_headers.get("Last-Modified"),
+                )
+        except urllib.error.HTTPError as error:
+            # a conditional request for a release that hasn't changed is answered without a body
+            if error.code == HTTPStatus.NOT_MODIFIED:
+                return None
+            _backoff_or_raise(error, attempt, GITHUB_API_URL)
         except _TRANSIENT_NETWORK_ERRORS as error:
             _backoff_or_raise(error, attempt, GITHUB_API_URL)
 
 
-def list_pythons(*, use_cache: bool = True) -> dict[str, tuple[str, str]]:
-    """Returns available python versions for your machine and their download links."""
+def _machine_suffixes() -> list[str]:
+    """The download link suffixes of this machine's builds, in order of preference."""
     system, machine = platform.system(), platform.machine()
     try:
         download_link_suffixes = MACHINE_SUFFIX[system][machine]
@@ -333,39 +689,44 @@ def list_pythons(*, use_cache: bool = True) -> dict[str, tuple[str, str]]:
         except KeyError as error:
             msg = f"No standalone Python builds are available for {system} on {machine} with {libc_version}."
             raise PipxError(msg) from error
+    return list(download_link_suffixes)
 
-    python_releases = get_or_update_index(use_cache=use_cache)["releases"]
 
-    available_python_links = [
-        (link, digest)
-        # Suffixes are in order of preference.
-        for download_link_suffix in download_link_suffixes
-        for link, digest in python_releases
-        if link.endswith(download_link_suffix)
-    ]
+def list_pythons(*, use_cache: bool = True) -> dict[str, tuple[str, str]]:
+    """Returns available python versions for your machine and their download links, newest first."""
+    suffixes: Final[list[str]] = _machine_suffixes()
+    return _pythons(get_or_update_index(use_cache=use_cache)["releases"], suffixes)
 
-    python_versions: dict[str, tuple[str, str]] = {}
-    for link, digest in available_python_links:
+
+def _pythons(releases: list[tuple[str, str]], suffixes: list[str]) -> dict[str, tuple[str, str]]:
+    """The most preferred build of each version among ``releases``, in the order the versions first appear."""
+    ranked: Final[dict[str, tuple[int, str, str]]] = {}
+    for link, digest in releases:
+        # Suffixes are in order of preference.
+        rank = next((rank for rank, suffix in enumerate(suffixes) if link.endswith(suffix)), None)
+        if rank is None:
+            continue
         match = PYTHON_VERSION_REGEX.search(link)
         if match is None:
             msg = f"Could not parse a Python version from {link!r}."
             raise PipxError(msg)
         python_version = match[1]
-        # Don't override already found versions, they are in order of preference
-        if python_version in python_versions:
-            continue
+        if python_version not in ranked or rank < ranked[python_version][0]:
+            ranked[python_version] = rank, link, digest
+    return {python_version: (link, digest) for python_version, (_, link, digest) in ranked.items()}
 
-        python_versions[python_version] = link, digest
 
-    return {
-        version: python_versions[version]
+def _sorted_releases(releases: list[tuple[str, str]], suffixes: list[str]) -> list[tuple[str, str]]:
+    pythons: Final[dict[str, tuple[str, str]]] = _pythons(releases, suffixes)
+    return [
+        pythons[version]
         for version in sorted(
-            python_versions,
+            pythons,
             # sort by semver
             key=lambda version: [int(k) for k in version.split(".")],
             reverse=True,
         )
-    }
+    ]
 
 
 def resolve_python_version(requested_version: str) -> tuple[str, tuple[str, str]]:
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import functools
+import itertools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, NamedTuple, ParamSpec, TypeVar
+
+from filelock import AcquireReturnProxy, FileLock
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterator
+
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+PIPX_TRACE: Final[str] = "PIPX_TRACE"
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+class _OpenSpan(NamedTuple):
+    name: str
+    category: str
+    start_ns: int
+    args: dict[str, object]
+    tid: int
+    thread_name: str
+
+
+class _Trace:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._pid: Final[int] = os.getpid()
+        self._origin_ns: Final[int] = time.perf_counter_ns()
+        self._events: list[dict[str, object]] = []
+        self._threads: dict[int, str] = {}
+        self._open: dict[int, _OpenSpan] = {}
+        self._tokens: Final[Iterator[int]] = itertools.count()
+        self._lock: Final[threading.Lock] = threading.Lock()
+
+    def now(self) -> int:
+        return time.perf_counter_ns() - self._origin_ns
+
+    def enter(self, name: str, category: str, args: dict[str, object]) -> int:
+        opened: Final[_OpenSpan] = _OpenSpan(
+            name, category, self.now(), args, threading.get_native_id(), threading.current_thread().name
+        )
+        with self._lock:
+            token: Final[int] = next(self._tokens)
+            self._open[token] = opened
+        return token
+
+    def leave(self, token: int) -> None:
+        end_ns: Final[int] = self.now()
+        with self._lock:
+            # a span still open when the trace was closed has been recorded already
+            if (opened := self._open.pop(token, None)) is not None:
+                self._record(opened, end_ns)
+
+    def close(self) -> None:
+        """End every span still open, such as the command's own when ``exec_app`` replaces the process."""
+        end_ns: Final[int] = self.now()
+        with self._lock:
+            for opened in self._open.values():
+                self._record(opened, end_ns)
+            self._open.clear()
+
+    def _record(self, opened: _OpenSpan, end_ns: int) -> None:
+        self._events.append({
+            "name": opened.name,
+            "cat": opened.category,
+            "ph": "X",
+            # the format counts in microseconds, which keeps sub-millisecond spans such as a cache hit visible
+            "ts": opened.start_ns / 1000,
+            "dur": (end_ns - opened.start_ns) / 1000,
+            "pid": self._pid,
+            "tid": opened.tid,
+            "args": opened.args,
+        })
+        self._threads.setdefault(opened.tid, opened.thread_name)
+
+    def _metadata(self, kind: str, name: str, *, tid: int | None = None) -> dict[str, object]:
+        event: Final[dict[str, object]] = {"name": kind, "ph": "M", "pid": self._pid, "args": {"name": name}}
+        if tid is not None:
+            event["tid"] = tid
+        return event
+
+    def write(self) -> None:
+        from pipx.util import replace_json  # ruff:ignore[import-outside-top-level]  # pipx.util imports this module
+
+        with self._lock:
+            # metadata events label the process and the download threads in the viewer
+            events: Final[list[dict[str, object]]] = [self._metadata("process_name", "pipx")]
+            events.extend(self._metadata("thread_name", name, tid=tid) for tid, name in self._threads.items())
+            events.extend(self._events)
+        replace_json({"traceEvents": events, "displayTimeUnit": "ms"}, self.path)
+
+
+class _Tracer:
+    # one trace per pipx invocation, shared by the download threads standalone_python starts
+    active: _Trace | None = None
+
+
+_TRACER: Final[_Tracer] = _Tracer()
+
+
+def start_trace() -> None:
+    """Begin collecting spans when ``PIPX_TRACE`` names a file to write them to.
+
+    Every :func:`span` entered until :func:`finish_trace` becomes a complete event in the Trace Event Format, which
+    ``chrome://tracing`` and https://ui.perfetto.dev open directly.
+    """
+    value: Final[str] = os.getenv(PIPX_TRACE, "")
+    _TRACER.active = _Trace(Path(value).expanduser().absolute()) if value else None
+
+
+def finish_trace() -> None:
+    """Write the spans collected since :func:`start_trace` and stop collecting."""
+    trace: Final[_Trace | None] = _TRACER.active
+    _TRACER.active = None
+    if trace is None:
+        return
+    trace.close()
+    try:
+        trace.write()
+    except OSError as exc:
+        _LOGGER.warning("Unable to write the %s trace to %s: %s", PIPX_TRACE, trace.path, exc)
+        return
+    _LOGGER.debug("Wrote trace to %s", trace.path)
+
+
+@contextmanager
+def span(name: str, category: str, **args: object) -> Generator[None, None, None]:
+    """Time the enclosed block as one event of the active trace; without one it costs an attribute lookup."""
+    trace: Final[_Trace | None] = _TRACER.active
+    if trace is None:
+        yield
+        return
+    token: Final[int] = trace.enter(name, category, args)
+    try:
+        yield
+    finally:
+        trace.leave(token)
+
+
+def traced(category: str) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Time every call of the decorated function as a span named after it."""
+
+    def decorator(func: Callable[_P, _R]) -> Callable[_P, _R]:
+        name: Final[str] = getattr(func, "__qualname__", repr(func))
+
+        @functools.wraps(func)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            with span(name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TracedFileLock(FileLock):
+    """A :class:`~filelock.FileLock` whose acquisition is a span, so time spent waiting on another pipx shows up."""
+
+    def acquire(self, *args: Any, **kwargs: Any) -> AcquireReturnProxy:  # ruff:ignore[any-type]  # forwards whichever options the installed filelock takes
+        if self.is_locked:
+            # re-entering a lock this process already holds never waits
+            return super().acquire(*args, **kwargs)
+        with span("acquire lock", "lock", path=self.lock_file):
+            return super().acquire(*args, **kwargs)
+
+
+__all__ = [
+    "PIPX_TRACE",
+    "TracedFileLock",
+    "finish_trace",
+    "span",
+    "start_trace",
+    "traced",
+]
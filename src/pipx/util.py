@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import codecs
 import errno
+import json
 import logging
 import os
 import random
@@ -10,27 +11,33 @@ import shutil
 import string
 import subprocess
 import sys
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from contextvars import Context, copy_context
 from dataclasses import dataclass
-from itertools import chain
+from itertools import chain, repeat
 from pathlib import Path
 from re import Pattern
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
 from typing import (
     TYPE_CHECKING,
     Any,
     Final,
     NoReturn,
     TextIO,
+    TypeVar,
 )
 
 from pipx import paths
 from pipx.animate import show_cursor
 from pipx.constants import MINGW, WINDOWS
+from pipx.trace import finish_trace, span
 from pipx.wrap import pipx_wrap
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from concurrent.futures import Executor
 
 if not WINDOWS:
     import fcntl
@@ -40,6 +47,17 @@ if not WINDOWS:
 
 _LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
 _SUBPROCESS_STREAM_READ_SIZE: Final[int] = 8 * 1024
+# a streamed run keeps its full output on disk once it outgrows this, and only its last lines in memory
+_STREAM_TRANSCRIPT_SPOOL_SIZE: Final[int] = 1024 * 1024
+_STREAM_TAIL_LINES: Final[int] = 200
+# a progress bar redraws one line with carriage returns and may never end it, so that line is cut to its latest part
+_STREAM_MAX_LINE_LENGTH: Final[int] = 64 * 1024
+_MAX_RELEVANT_ERRORS: Final[int] = 10
+# a verbose build can repeat a matching line without end, so each category keeps only its latest lines
+_RELEVANT_LINES_PER_CATEGORY: Final[int] = 100
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
 
 
 class PipxError(Exception):
@@ -57,6 +75,138 @@ class RelevantSearch:
     category: str
 
 
+# In order of most useful to least useful
+_RELEVANT_SEARCHES: Final[tuple[RelevantSearch, ...]] = (
+    RelevantSearch(re.compile(r"not (?:be )?found", re.IGNORECASE), "not_found"),
+    RelevantSearch(re.compile(r"no such", re.IGNORECASE), "no_such"),
+    RelevantSearch(re.compile(r"(Exception|Error):\s*\S+"), "exception_error"),
+    RelevantSearch(re.compile(r"fatal error", re.IGNORECASE), "fatal_error"),
+    RelevantSearch(re.compile(r"conflict", re.IGNORECASE), "conflict_"),
+    RelevantSearch(
+        re.compile(
+            r"error:"
+            r"(?!.+Command errored out)"
+            r"(?!.+failed building wheel for)"
+            r"(?!.+could not build wheels? for)"
+            r"(?!.+failed to build one or more wheels)"
+            r".+[^:]$",
+            re.IGNORECASE,
+        ),
+        "error_",
+    ),
+)
+_FAILED_BUILD_STDOUT_RE: Final[Pattern[str]] = re.compile(r"Failed to build\s+(\S.+)$")
+_COLLECTING_RE: Final[Pattern[str]] = re.compile(r"^\s*Collecting\s+(\S+)")
+_FAILED_BUILD_STDERR_RE: Final[Pattern[str]] = re.compile(r"Failed to build\s+(?!one or more packages)(\S+)")
+
+
+class PipOutputAnalysis:
+    """Clues to why a pip install failed, gathered one output line at a time.
+
+    Only the latest lines matching each relevant search are kept, so the analysis of a long verbose build stays small.
+    """
+
+    def __init__(self) -> None:
+        self.failed_build_stdout: list[str] = []
+        self.failed_build_stderr: set[str] = set()
+        self.last_collecting_dep: str | None = None
+        # per category, each saved line and its position in the output, oldest first
+        self._relevant: Final[dict[str, dict[str, int]]] = {search.category: {} for search in _RELEVANT_SEARCHES}
+        self._position = 0
+
+    def feed_stdout(self, line: str) -> None:
+        # for any useful information in stdout, `pip install` must be run without the -q option
+        if failed_match := _FAILED_BUILD_STDOUT_RE.search(line):
+            self.failed_build_stdout = failed_match.group(1).strip().split()
+        if collecting_match := _COLLECTING_RE.search(line):
+            self.last_collecting_dep = collecting_match.group(1)
+
+    def feed_stderr(self, line: str) -> None:
+        if failed_build_match := _FAILED_BUILD_STDERR_RE.search(line):
+            self.failed_build_stderr.add(failed_build_match.group(1))
+        for relevant_search in _RELEVANT_SEARCHES:
+            if relevant_search.pattern.search(line):
+                saved = self._relevant[relevant_search.category]
+                if (stripped := line.strip()) not in saved:
+                    saved[stripped] = self._position
+                    self._position += 1
+                    if len(saved) > _RELEVANT_LINES_PER_CATEGORY:
+                        del saved[next(iter(saved))]
+                break
+
+    def report(self) -> None:
+        _log_failed_builds(self.failed_build_stdout, self.failed_build_stderr, self.last_collecting_dep)
+        print_categories = [search.category for search in _RELEVANT_SEARCHES]
+        while len(print_categories) > 1 and (
+            sum(len(self._relevant[category]) for category in print_categories) > _MAX_RELEVANT_ERRORS
+        ):
+            print_categories.pop(-1)
+        relevants_saved: Final[list[tuple[int, str]]] = sorted(
+            (position, line) for category in print_categories for line, position in self._relevant[category].items()
+        )
+        if any(self._relevant.values()):
+            print("\nSome possibly relevant errors from pip install:", file=sys.stderr)  # ruff:ignore[print]  # user-facing CLI output
+            for _, line in relevants_saved:
+                print(f"    {line}", file=sys.stderr)  # ruff:ignore[print]  # user-facing CLI output
+
+
+class StreamedProcess(subprocess.CompletedProcess[str]):
+    """A finished subprocess whose output was streamed to the terminal as it ran.
+
+    ``stdout`` and ``stderr`` hold only the last lines of each stream; the full text stays readable from
+    ``transcripts`` and the pip failure analysis was done while it streamed.
+    """
+
+    def __init__(
+        self,
+        args: list[str],
+        returncode: int,
+        captures: dict[str, _StreamCapture],
+        pip_output: PipOutputAnalysis,
+    ) -> None:
+        super().__init__(
+            args,
+            returncode,
+            captures["stdout"].finish() if "stdout" in captures else None,
+            captures["stderr"].finish() if "stderr" in captures else None,
+        )
+        self.transcripts: Final[dict[str, SpooledTemporaryFile[str]]] = {
+            name: capture.transcript for name, capture in captures.items()
+        }
+        self.pip_output: Final[PipOutputAnalysis] = pip_output
+
+    def close(self) -> None:
+        """Remove the transcripts, once the error log that copies them has been written."""
+        for transcript in self.transcripts.values():
+            transcript.close()
+
+
+class _StreamCapture:
+    def __init__(self, on_line: Callable[[str], None]) -> None:
+        # the transcript outlives the run, for the error log, and is removed by StreamedProcess.close
+        self.transcript: Final[SpooledTemporaryFile[str]] = SpooledTemporaryFile(  # ruff:ignore[open-file-with-context-handler]  # closed with the process result
+            max_size=_STREAM_TRANSCRIPT_SPOOL_SIZE, mode="w+", encoding="utf-8", newline=""
+        )
+        self._tail: Final[deque[str]] = deque(maxlen=_STREAM_TAIL_LINES)
+        self._on_line = on_line
+        self._pending = ""
+
+    def write(self, chunk: str) -> None:
+        self.transcript.write(chunk)
+        *lines, pending = (self._pending + chunk).split("\n")
+        for line in lines:
+            self._on_line(line)
+            self._tail.append(f"{line}\n")
+        self._pending = pending[-_STREAM_MAX_LINE_LENGTH:]
+
+    def finish(self) -> str:
+        if self._pending:
+            self._on_line(self._pending)
+            self._tail.append(self._pending)
+            self._pending = ""
+        return "".join(self._tail)
+
+
 def _get_trash_file(path: Path) -> Path:
     if not paths.ctx.trash.is_dir():
         paths.ctx.trash.mkdir(exist_ok=True)
@@ -110,6 +260,47 @@ def safe_unlink(file: Path) -> None:
         file.rename(_get_trash_file(file))
 
 
+def replace_json(
+    payload: object, target: Path, *, indent: int | None = None, encoder: type[json.JSONEncoder] | None = None
+) -> os.stat_result:
+    """Write ``payload`` as JSON beside ``target`` and rename it over ``target``.
+
+    Readers, other pipx processes included, see either the old file or the new one, never a partial write. Returns the
+    written file's stat, taken before the rename so a writer that replaces ``target`` afterwards is not mistaken for
+    this one.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path: Path | None = None
+    try:
+        with NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=target.parent,
+            prefix=f".{target.name.lstrip('.')}.",
+            suffix=".tmp",
+            delete=False,
+        ) as json_fh:
+            temporary_path = Path(json_fh.name)
+            json.dump(payload, json_fh, indent=indent, sort_keys=True, cls=encoder)
+        written: Final[os.stat_result] = temporary_path.stat()
+        temporary_path.replace(target)
+    finally:
+        if temporary_path is not None:
+            with suppress(OSError):
+                temporary_path.unlink()
+    return written
+
+
+def map_in_context(executor: Executor, func: Callable[[_T], _R], items: Iterable[_T]) -> Iterator[_R]:
+    """``executor.map`` whose calls see the caller's context variables, such as ``--skip-maintenance``.
+
+    Worker threads start from an empty context, so every call runs in a copy of the caller's taken up front; a context
+    can only be entered by one thread at a time, hence one copy per call.
+    """
+    items = tuple(items)
+    return executor.map(Context.run, [copy_context() for _ in items], repeat(func), items)
+
+
 def get_pypackage_bin_path(binary_name: str) -> Path:
     return (
         Path("__pypackages__")
@@ -148,25 +339,6 @@ else:
         return bin_path, python_path, man_path
 
 
-def get_site_packages(python: Path) -> list[Path]:
-    """Return the interpreter's purelib first, then its platlib when that is a second directory."""
-    output = run_subprocess(
-        [
-            python,
-            "-c",
-            "import sysconfig; print(sysconfig.get_path('purelib')); print(sysconfig.get_path('platlib'))",
-        ],
-        capture_stderr=False,
-    ).stdout
-    purelib, _, platlib = output.strip().partition("\n")
-
-    purelib_path = Path(purelib)
-    # some Linux layouts symlink lib64 to lib, so compare the resolved targets rather than the scheme strings
-    if (platlib_path := Path(platlib)).resolve() == purelib_path.resolve():
-        return [purelib_path]
-    return [purelib_path, platlib_path]
-
-
 def _fix_subprocess_env(env: dict[str, str], *, force_utf8: bool = True) -> dict[str, str]:
     # Remove PYTHONPATH because some platforms (macOS with Homebrew) add pipx
     #   directories to it, and can make it appear to venvs as though pipx
@@ -202,7 +374,8 @@ def run_subprocess(  # ruff:ignore[too-many-arguments]  # thin wrapper over subp
 ) -> subprocess.CompletedProcess[str]:
     """Run a command as a subprocess, capturing stderr and stdout.
 
-    ``env_overrides`` keys map to a string (set/replace) or ``None`` (delete).
+    ``env_overrides`` keys map to a string (set/replace) or ``None`` (delete). With ``stream_output`` the result is a
+    :class:`StreamedProcess`, whose captured output is only the tail of what the terminal already showed.
     """
     env = dict(os.environ)
     env = _fix_subprocess_env(env)
@@ -227,30 +400,32 @@ def run_subprocess(  # ruff:ignore[too-many-arguments]  # thin wrapper over subp
     if len(cmd_str_list) > 0 and "python" in Path(cmd_str_list[0]).name.lower():
         env.setdefault("PYTHONSAFEPATH", "1")
 
-    if stream_output:
-        # Windows has no pseudo-terminal to hand the child, so it reads a pipe and rich, which pip draws its bar with,
-        # takes TTY_COMPATIBLE for the terminal we forward the output to and COLUMNS for a width it cannot measure.
-        if sys.stdout.isatty():
-            env.setdefault("TTY_COMPATIBLE", "1")
-            env.setdefault("COLUMNS", str(shutil.get_terminal_size().columns))
-        completed_process = _run_streaming_subprocess(
-            cmd_str_list,
-            capture_stdout=capture_stdout,
-            capture_stderr=capture_stderr,
-            cwd=run_dir,
-            env=env,
-        )
-    else:
-        completed_process = subprocess.run(
-            cmd_str_list,
-            env=env,
-            stdout=subprocess.PIPE if capture_stdout else None,
-            stderr=subprocess.PIPE if capture_stderr else None,
-            encoding="utf-8",
-            text=True,
-            check=False,
-            cwd=run_dir,
-        )
+    with span("run_subprocess", "subprocess", cmd=log_cmd_str):
+        if stream_output:
+            # Windows has no pseudo-terminal to hand the child, so it reads a pipe and rich, which pip draws its bar
+            # with, takes TTY_COMPATIBLE for the terminal we forward the output to and COLUMNS for a width it cannot
+            # measure.
+            if sys.stdout.isatty():
+                env.setdefault("TTY_COMPATIBLE", "1")
+                env.setdefault("COLUMNS", str(shutil.get_terminal_size().columns))
+            completed_process = _run_streaming_subprocess(
+                cmd_str_list,
+                capture_stdout=capture_stdout,
+                capture_stderr=capture_stderr,
+                cwd=run_dir,
+                env=env,
+            )
+        else:
+            completed_process = subprocess.run(
+                cmd_str_list,
+                env=env,
+                stdout=subprocess.PIPE if capture_stdout else None,
+                stderr=subprocess.PIPE if capture_stderr else None,
+                encoding="utf-8",
+                text=True,
+                check=False,
+                cwd=run_dir,
+            )
 
     if capture_stdout and log_stdout and not stream_output:
         _LOGGER.debug(f"stdout: {completed_process.stdout}".rstrip())
@@ -269,8 +444,7 @@ def _run_streaming_subprocess(
     cwd: str | None,
     env: dict[str, str],
 ) -> subprocess.CompletedProcess[str]:
-    stdout_chunks: Final[list[str]] = []
-    stderr_chunks: Final[list[str]] = []
+    pip_output: Final[PipOutputAnalysis] = PipOutputAnalysis()
     channels: Final[dict[str, _StreamChannel]] = {
         name: _open_stream_channel(destination)
         for name, destination, capture in (
@@ -279,6 +453,11 @@ def _run_streaming_subprocess(
         )
         if capture
     }
+    captures: Final[dict[str, _StreamCapture]] = {
+        name: _StreamCapture(on_line)
+        for name, on_line in (("stdout", pip_output.feed_stdout), ("stderr", pip_output.feed_stderr))
+        if name in channels
+    }
     try:
         with (
             subprocess.Popen(
@@ -293,24 +472,21 @@ def _run_streaming_subprocess(
             for channel in channels.values():
                 channel.close_child()
             for future in [
-                executor.submit(_tee_subprocess_output, channels[name].reader, destination, chunks)
-                for name, destination, chunks in (
-                    ("stdout", sys.stdout, stdout_chunks),
-                    ("stderr", sys.stderr, stderr_chunks),
-                )
+                executor.submit(_tee_subprocess_output, channels[name].reader, destination, captures[name])
+                for name, destination in (("stdout", sys.stdout), ("stderr", sys.stderr))
                 if name in channels
             ]:
                 future.result()
             returncode: Final[int] = process.wait()
+    except BaseException:
+        # no process result carries the transcripts out to be closed
+        for capture in captures.values():
+            capture.transcript.close()
+        raise
     finally:
         for channel in channels.values():
             channel.close()
-    return subprocess.CompletedProcess(
-        cmd,
-        returncode,
-        "".join(stdout_chunks) if capture_stdout else None,
-        "".join(stderr_chunks) if capture_stderr else None,
-    )
+    return StreamedProcess(cmd, returncode, captures, pip_output)
 
 
 @dataclass
@@ -357,7 +533,7 @@ def _read_stream(source: int) -> bytes:
         raise
 
 
-def _tee_subprocess_output(source: int, destination: TextIO, chunks: list[str]) -> None:
+def _tee_subprocess_output(source: int, destination: TextIO, capture: _StreamCapture) -> None:
     write_error: OSError | UnicodeError | None = None
     pending_carriage_return: bool = False
     for decoded in chain(
@@ -374,7 +550,7 @@ def _tee_subprocess_output(source: int, destination: TextIO, chunks: list[str])
             chunk = chunk.replace("\r\n", "\n")
         if not chunk:
             continue
-        chunks.append(chunk)
+        capture.write(chunk)
         if write_error is None:
             try:
                 destination.write(chunk)
@@ -432,70 +608,12 @@ def analyze_pip_output(pip_stdout: str, pip_stderr: str) -> None:
             error: can't copy 'lib\ansible\module_utils\ansible_release.py': doesn't exist ...
             build\test1.c(4): error C2146: syntax error: missing ';' before identifier 'x'
     """
-    max_relevant_errors = 10
-
-    failed_build_stdout: list[str] = []
-    last_collecting_dep: str | None = None
-    # for any useful information in stdout, `pip install` must be run without
-    #   the -q option
+    pip_output: Final[PipOutputAnalysis] = PipOutputAnalysis()
     for line in pip_stdout.split("\n"):
-        failed_match = re.search(r"Failed to build\s+(\S.+)$", line)
-        collecting_match = re.search(r"^\s*Collecting\s+(\S+)", line)
-        if failed_match:
-            failed_build_stdout = failed_match.group(1).strip().split()
-        if collecting_match:
-            last_collecting_dep = collecting_match.group(1)
-
-    # In order of most useful to least useful
-    relevant_searches = [
-        RelevantSearch(re.compile(r"not (?:be )?found", re.IGNORECASE), "not_found"),
-        RelevantSearch(re.compile(r"no such", re.IGNORECASE), "no_such"),
-        RelevantSearch(re.compile(r"(Exception|Error):\s*\S+"), "exception_error"),
-        RelevantSearch(re.compile(r"fatal error", re.IGNORECASE), "fatal_error"),
-        RelevantSearch(re.compile(r"conflict", re.IGNORECASE), "conflict_"),
-        RelevantSearch(
-            re.compile(
-                r"error:"
-                r"(?!.+Command errored out)"
-                r"(?!.+failed building wheel for)"
-                r"(?!.+could not build wheels? for)"
-                r"(?!.+failed to build one or more wheels)"
-                r".+[^:]$",
-                re.IGNORECASE,
-            ),
-            "error_",
-        ),
-    ]
-
-    failed_stderr_patt = re.compile(r"Failed to build\s+(?!one or more packages)(\S+)")
-
-    relevants_saved = []
-    failed_build_stderr = set()
+        pip_output.feed_stdout(line)
     for line in pip_stderr.split("\n"):
-        failed_build_match = failed_stderr_patt.search(line)
-        if failed_build_match:
-            failed_build_stderr.add(failed_build_match.group(1))
-
-        for relevant_search in relevant_searches:
-            if relevant_search.pattern.search(line):
-                relevants_saved.append((line.strip(), relevant_search.category))
-                break
-
-    _log_failed_builds(failed_build_stdout, failed_build_stderr, last_collecting_dep)
-
-    relevants_saved = dedup_ordered(relevants_saved)
-
-    if relevants_saved:
-        print("\nSome possibly relevant errors from pip install:", file=sys.stderr)  # ruff:ignore[print]  # user-facing CLI output
-
-        print_categories = [x.category for x in relevant_searches]
-        relevants_saved_filtered = relevants_saved.copy()
-        while (len(print_categories) > 1) and (len(relevants_saved_filtered) > max_relevant_errors):
-            print_categories.pop(-1)
-            relevants_saved_filtered = [x for x in relevants_saved if x[1] in print_categories]
-
-        for relevant_saved in relevants_saved_filtered:
-            print(f"    {relevant_saved[0]}", file=sys.stderr)  # ruff:ignore[print]  # user-facing CLI output
+        pip_output.feed_stderr(line)
+    pip_output.report()
 
 
 def _log_failed_builds(
@@ -539,18 +657,28 @@ def subprocess_post_check_handle_pip_error(
     with error_file.open("a", encoding="utf-8") as error_fh:
         print(f"{upper_label} STDOUT", file=error_fh)
         print("----------", file=error_fh)
-        if completed_process.stdout is not None:
-            print(completed_process.stdout, file=error_fh, end="")
+        _copy_output(completed_process, "stdout", error_fh)
         print(f"\n{upper_label} STDERR", file=error_fh)
         print("----------", file=error_fh)
-        if completed_process.stderr is not None:
-            print(completed_process.stderr, file=error_fh, end="")
+        _copy_output(completed_process, "stderr", error_fh)
 
     _LOGGER.error(
         "Fatal error from %s prevented installation. Full %s output in file:\n    %s", tool_name, tool_name, error_file
     )
     if tool_name == "pip":
-        analyze_pip_output(completed_process.stdout, completed_process.stderr)
+        if isinstance(completed_process, StreamedProcess):
+            completed_process.pip_output.report()
+        else:
+            analyze_pip_output(completed_process.stdout, completed_process.stderr)
+
+
+def _copy_output(completed_process: subprocess.CompletedProcess[str], name: str, destination: TextIO) -> None:
+    if isinstance(completed_process, StreamedProcess) and name in completed_process.transcripts:
+        transcript = completed_process.transcripts[name]
+        transcript.seek(0)
+        shutil.copyfileobj(transcript, destination)
+    elif (output := getattr(completed_process, name)) is not None:
+        print(output, file=destination, end="")
 
 
 def exec_app(
@@ -575,6 +703,8 @@ def exec_app(
 
     # make sure we show cursor again before handing over control
     show_cursor()
+    # the process is replaced below, so the trace is written while pipx still can
+    finish_trace()
 
     _LOGGER.info("exec_app: %s", " ".join(str(c) for c in cmd))
 
@@ -594,18 +724,21 @@ def is_paths_relative(path: Path, parent: Path) -> bool:
 
 
 __all__ = [
+    "PipOutputAnalysis",
     "PipxError",
     "RelevantSearch",
+    "StreamedProcess",
     "analyze_pip_output",
     "dedup_ordered",
     "exec_app",
     "full_package_description",
     "get_pypackage_bin_path",
-    "get_site_packages",
     "get_venv_paths",
     "is_paths_relative",
+    "map_in_context",
     "mkdir",
     "pipx_wrap",
+    "replace_json",
     "rmdir",
     "run_pypackage_bin",
     "run_subprocess",
@@ -5,14 +5,14 @@ import shutil
 import time
 from importlib.metadata import Distribution, EntryPoint
 from pathlib import Path
+from threading import Lock
 from typing import TYPE_CHECKING, Final, NoReturn
 
-from filelock import BaseFileLock, FileLock
-
 if TYPE_CHECKING:
     from collections.abc import Generator, Iterable, Iterator, Sequence
     from subprocess import CompletedProcess
 
+    from filelock import BaseFileLock
     from packaging.specifiers import SpecifierSet
 
 from packaging.utils import canonicalize_name
@@ -46,26 +46,20 @@ from pipx.shared_libs import (
     shared_libs,
     shared_libs_auto_upgrade_disabled,
 )
+from pipx.trace import TracedFileLock
 from pipx.util import (
     PipxError,
     exec_app,
     full_package_description,
-    get_site_packages,
     get_venv_paths,
     pipx_wrap,
     rmdir,
-    run_subprocess,
     subprocess_post_check,
 )
-from pipx.venv_inspect import VenvMetadata, inspect_venv
+from pipx.venv_inspect import DependencyGraph, VenvMetadata, VenvProbe, inspect_venv, probe_venv
 
 _LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
-_REQUIRES_PYTHON_SCRIPT: Final[str] = (
-    "import sys;"
-    "from importlib.metadata import distribution;"
-    "print(distribution(sys.argv[1]).metadata['Requires-Python'] or '');"
-    "print('.'.join(str(part) for part in sys.version_info[:3]))"
-)
+_SHARED_LIBS_MAINTENANCE: Final[Lock] = Lock()
 _BACKEND_METADATA_VERSION: Final[Version] = Version("0.6")
 
 # Keyed on full path so global vs user-local venvs with the same name don't
@@ -130,6 +124,10 @@ class VenvContainer:
     def __str__(self) -> str:
         return str(self._root)
 
+    @property
+    def root(self) -> Path:
+        return self._root
+
     def iter_venv_dirs(self) -> Generator[Path, None, None]:
         """Iterate venv directories in this container."""
         if not self._root.is_dir():
@@ -165,13 +163,13 @@ class VenvContainer:
 
     def venv_lock(self, venv_dir: Path) -> BaseFileLock:
         self._root.mkdir(parents=True, exist_ok=True)
-        return FileLock(self._root / f".{canonicalize_name(venv_dir.name)}.lock")
+        return TracedFileLock(self._root / f".{canonicalize_name(venv_dir.name)}.lock")
 
 
 class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx-managed virtual environment; splitting would scatter its state
     """Abstraction for a virtual environment with various useful methods for pipx"""
 
-    def __init__(
+    def __init__(  # ruff:ignore[too-many-arguments]  # keyword-only construction options for one venv
         self,
         path: Path,
         *,
@@ -179,11 +177,12 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
         python: str | None = None,
         backend: str | None = None,
         env_backend: str | None = None,
+        pipx_metadata: PipxMetadata | None = None,
     ) -> None:
         self.root = path
         self.python = python or get_default_python()
         self.bin_path, self.python_path, self.man_path = get_venv_paths(self.root)
-        self.pipx_metadata = PipxMetadata(venv_dir=path)
+        self.pipx_metadata = pipx_metadata if pipx_metadata is not None else PipxMetadata(venv_dir=path)
         self.verbose = verbose
         # a terminal lets pip and uv draw their own download bar, which stands in for the spinner
         self.show_progress = not verbose and STDERR_IS_TTY
@@ -200,7 +199,7 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
             env_backend=env_backend,
         )
         self._backend: Backend | None = None
-        self._site_packages: list[Path] | None = None
+        self._probe: VenvProbe | None = None
         self._uses_shared_libs_cache: bool | None = None
 
     @property
@@ -227,30 +226,32 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
         or retrieved from the metadata of a previous installation)
         """
         if self._existing and self.uses_shared_libs:
-            if shared_libs.is_valid:
-                if force_upgrade:
-                    shared_libs.upgrade(verbose=verbose, pip_args=pip_args)
-                elif shared_libs_auto_upgrade_disabled():
-                    _LOGGER.info(
-                        "Skipping shared libs auto-upgrade because %s is set.", DISABLE_SHARED_LIBS_AUTO_UPGRADE
-                    )
-                elif shared_libs.needs_upgrade:
-                    shared_libs.upgrade(verbose=verbose, pip_args=pip_args)
-            else:
-                shared_libs.create(verbose=verbose, pip_args=pip_args)
-
-            if not shared_libs.is_valid:
-                raise PipxError(
-                    pipx_wrap(
-                        f"""
-                        Error: pipx's shared venv {shared_libs.root} is invalid
-                        and needs re-installation. To fix this, install or
-                        reinstall a package. For example:
-                        """
+            # concurrent workers share one shared-libs environment; the first to get here repairs or refreshes it
+            with _SHARED_LIBS_MAINTENANCE:
+                if shared_libs.is_valid:
+                    if force_upgrade:
+                        shared_libs.upgrade(verbose=verbose, pip_args=pip_args)
+                    elif shared_libs_auto_upgrade_disabled():
+                        _LOGGER.info(
+                            "Skipping shared libs auto-upgrade because %s is set.", DISABLE_SHARED_LIBS_AUTO_UPGRADE
+                        )
+                    elif shared_libs.needs_upgrade:
+                        shared_libs.upgrade(verbose=verbose, pip_args=pip_args)
+                else:
+                    shared_libs.create(verbose=verbose, pip_args=pip_args)
+
+                if not shared_libs.is_valid:
+                    raise PipxError(
+                        pipx_wrap(
+                            f"""
+                            Error: pipx's shared venv {shared_libs.root} is invalid
+                            and needs re-installation. To fix this, install or
+                            reinstall a package. For example:
+                            """
+                        )
+                        + f"\n  pipx install {self.root.name} --force",
+                        wrap_message=False,
                     )
-                    + f"\n  pipx install {self.root.name} --force",
-                    wrap_message=False,
-                )
 
     @property
     def name(self) -> str:
@@ -298,15 +299,13 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
         uv installs a package onto an interpreter its Requires-Python rules out, so pipx reads the metadata rather
         than trust the backend to refuse.
         """
-        process = run_subprocess(
-            [self.python_path, "-c", _REQUIRES_PYTHON_SCRIPT, package_name],
-            capture_stderr=False,
-            log_stdout=False,
-        )
-        if process.returncode:
+        try:
+            # refresh the memoized probe: the interpreter facts stay put, and the package has only just been installed
+            self._probe = probe_venv(self.python_path, distributions=(package_name,))
+        except PipxError:
             return None
-        requires_python, _, python_version = process.stdout.strip().partition("\n")
-        return unsatisfied_constraint(requires_python, python_version)
+        requires_python = self._probe.requires_python.get(canonicalize_name(package_name))
+        return unsatisfied_constraint(requires_python, self._probe.python_version)
 
     def create_venv(self, venv_args: list[str], pip_args: list[str], *, override_shared: bool = False) -> None:
         """
@@ -323,7 +322,7 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
             include_pip=override_shared,
             verbose=self.verbose,
         )
-        self._site_packages = None
+        self._probe = None
 
         self.pipx_metadata.venv_args = venv_args
         # Persist the chosen backend on disk only when actually creating the venv.
@@ -398,7 +397,15 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
         lock_file: Path | None = None,
         pinned: bool = False,
         cooldown_days: int | None = None,
+        with_requirements: Sequence[str] = (),
+        already_installed: bool = False,
     ) -> None:
+        """Install a package and record it in the venv's metadata.
+
+        Without a lock file, ``with_requirements`` go into the same backend call, so the installer resolves them
+        together with the package once; they are not recorded here. ``already_installed`` marks a package that went in
+        that way alongside another, which only has its metadata recorded.
+        """
         # package_name in package specifier can mismatch URL due to user error
         package_or_url = fix_package_name(package_or_url, package_name)
 
@@ -409,13 +416,17 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
         )
 
         with installable_script(package_name, package_or_url, tuple(expected_apps or ())) as install_spec:
-            if lock_file is None:
+            if lock_file is not None:
+                self._install_locked_package(package_name, install_spec, lock_file, install_pip_args)
+            elif not already_installed:
                 _LOGGER.info("Installing %s", package_descr := full_package_description(package_name, package_or_url))
+                if with_requirements:
+                    _LOGGER.info("Installing %s alongside it", ", ".join(with_requirements))
                 with animate(f"installing {package_descr}", do_animation=self.do_animation):
                     process = self.backend.install(
                         venv_root=self.root,
                         venv_python=self.python_path,
-                        requirements=[install_spec],
+                        requirements=[install_spec, *with_requirements],
                         pip_args=install_pip_args,
                         verbose=self.verbose,
                         progress=self.show_progress,
@@ -425,10 +436,9 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
                     # constraint appears; uv installs regardless, which the caller catches from the metadata instead
                     if constraint := rejected_constraint(process.stderr or ""):
                         raise IncompatiblePythonError(constraint)
-                    msg = f"Error installing {full_package_description(package_name, package_or_url)}."
+                    msg = f"Error installing {full_package_description(package_name, package_or_url)}"
+                    msg += f" with {', '.join(with_requirements)}." if with_requirements else "."
                     raise PipxError(msg)
-            else:
-                self._install_locked_package(package_name, install_spec, lock_file, install_pip_args)
 
         self.update_package_metadata(
             package_name=package_name,
@@ -583,7 +593,15 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
 
     def get_venv_metadata_for_package(self, package_name: str, package_extras: set[str]) -> VenvMetadata:
         data_start = time.time()
-        venv_metadata = inspect_venv(package_name, package_extras, self.bin_path, self.python_path, self.man_path)
+        venv_metadata = inspect_venv(
+            package_name,
+            package_extras,
+            self.bin_path,
+            self.python_path,
+            self.man_path,
+            cache_dir=self.root,
+            venv_probe=self._probe,
+        )
         _LOGGER.info("get_venv_metadata_for_package: %.0fms", 1e3 * (time.time() - data_start))
         return venv_metadata
 
@@ -663,7 +681,7 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
         self.pipx_metadata.write()
 
     def get_python_version(self) -> str:
-        return run_subprocess([str(self.python_path), "--version"]).stdout.strip()
+        return f"Python {self.probe.environment['python_full_version']}"
 
     def list_installed_packages(self, *, not_required: bool = False) -> set[str]:
         return self.backend.list_installed(
@@ -679,11 +697,20 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
             index_args=index_args,
         )
 
+    @property
+    def probe(self) -> VenvProbe:
+        """The venv interpreter's paths, marker environment, and version, queried once per venv."""
+        if self._probe is None:
+            self._probe = probe_venv(self.python_path)
+        return self._probe
+
     @property
     def site_packages(self) -> list[Path]:
-        if self._site_packages is None:
-            self._site_packages = get_site_packages(self.python_path)
-        return self._site_packages
+        return self.probe.site_packages
+
+    def dependency_graph(self) -> DependencyGraph:
+        """The distributions installed in the venv right now and the requirements between them."""
+        return DependencyGraph.from_sys_path(self.probe.sys_path, self.probe.environment)
 
     def _distributions(self, name: str) -> Iterator[Distribution]:
         return iter(Distribution.discover(name=name, path=[str(path) for path in self.site_packages]))
@@ -709,6 +736,10 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
         *,
         python_args: list[str],
     ) -> NoReturn:
+        exec_app([*self.app_command(app, filename, python_args=python_args), *app_args])
+
+    def app_command(self, app: str, filename: str, *, python_args: list[str]) -> list[str]:
+        """The command line ``run_app`` executes for ``app``, before the app's own arguments."""
         entry_point = self._find_entry_point(app, "pipx.run")
         if entry_point is None and python_args:
             entry_point = self._find_entry_point(app, "console_scripts")
@@ -717,7 +748,7 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
             if python_args:
                 msg = f"Cannot pass Python arguments because {app!r} is not a Python entry point."
                 raise PipxError(msg)
-            exec_app([str(self.bin_path / filename), *app_args])
+            return [str(self.bin_path / filename)]
 
         _LOGGER.info("Using discovered entry point for 'pipx run'")
         code = (
@@ -726,7 +757,7 @@ class Venv:  # ruff:ignore[too-many-public-methods]  # single facade over a pipx
             f"sys.exit(EntryPoint(name={entry_point.name!r}, value={entry_point.value!r}, "
             f"group={entry_point.group!r}).load()())\n"
         )
-        exec_app([str(self.python_path), *python_args, "-c", code, *app_args])
+        return [str(self.python_path), *python_args, "-c", code]
 
     def has_app(self, app: str, filename: str) -> bool:
         if self._find_entry_point(app, "pipx.run") is not None:
@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import ast
 import configparser
+import hashlib
 import json
 import logging
+import os
 import shutil
 import sys
 import textwrap
 from importlib import metadata
 from pathlib import Path, PurePosixPath
-from typing import TYPE_CHECKING, Final, NamedTuple
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
 from urllib.parse import urlparse
-from urllib.request import url2pathname
 
 from packaging.requirements import Requirement
 from packaging.utils import canonicalize_name
@@ -22,20 +23,24 @@ else:
     import tomli as tomllib
 
 from pipx.constants import COMPLETION_SECTIONS, MAN_SECTIONS, WINDOWS
-from pipx.util import PipxError, run_subprocess
+from pipx.trace import traced
+from pipx.util import PipxError, replace_json, run_subprocess
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, Mapping
+    from collections.abc import Collection, Iterable, Iterator, Mapping
 
 logger = logging.getLogger(__name__)
 
+INSPECT_CACHE_FILENAME: Final[str] = "pipx_inspect_cache.json"
+# bump whenever the cached VenvMetadata shape or the inspection rules change, so older caches are discarded
+_INSPECT_CACHE_VERSION: Final[int] = 1
+_DISTRIBUTION_SUFFIXES: Final[tuple[str, ...]] = (".dist-info", ".egg-info")
 _DATA_FILE_PAIR_LEN: Final[int] = 2
 _MIN_MAN_TARGET_PARTS: Final[int] = 2
 
 
 class VenvInspectInformation(NamedTuple):
-    distributions: Mapping[str, metadata.Distribution]
-    env: dict[str, str]
+    graph: DependencyGraph
     bin_path: Path
     man_path: Path
 
@@ -74,12 +79,18 @@ def get_distributions_by_name(paths: list[str]) -> dict[str, metadata.Distributi
 
 
 def get_package_dependencies(dist: metadata.Distribution, extras: set[str], env: dict[str, str]) -> list[Requirement]:
-    eval_env = env.copy()
     # Add an empty extra to enable evaluation of non-extra markers
     if not extras:
         extras.add("")
+    return _applicable_requirements(map(Requirement, dist.requires or []), extras, env)
+
+
+def _applicable_requirements(
+    requirements: Iterable[Requirement], extras: Collection[str], env: dict[str, str]
+) -> list[Requirement]:
+    eval_env = env.copy()
     dependencies = []
-    for req in map(Requirement, dist.requires or []):
+    for req in requirements:
         if not req.marker:
             dependencies.append(req)
         else:
@@ -103,6 +114,62 @@ def get_required_dependency_names(dist: metadata.Distribution, env: dict[str, st
     return {canonicalize_name(req.name) for req in get_package_dependencies(dist, extras, env)}
 
 
+class DependencyGraph:
+    """The distributions installed in a venv and the requirements between them.
+
+    Each distribution's ``Requires-Dist`` is parsed once, and the requirements that apply for a set of extras are
+    worked out once, so walking the graph from several roots or answering several queries reuses that work.
+    """
+
+    def __init__(self, distributions: Mapping[str, metadata.Distribution], env: dict[str, str]) -> None:
+        self.distributions: Final[Mapping[str, metadata.Distribution]] = distributions
+        self._env: Final[dict[str, str]] = env
+        self._parsed: Final[dict[str, tuple[Requirement, ...]]] = {}
+        self._edges: Final[dict[tuple[str, frozenset[str]], tuple[Requirement, ...]]] = {}
+
+    @classmethod
+    def from_sys_path(cls, sys_path: list[str], env: dict[str, str]) -> DependencyGraph:
+        return cls(get_distributions_by_name(sys_path), env)
+
+    def requirements(self, name: str, extras: Iterable[str] = ()) -> tuple[Requirement, ...]:
+        """What the installed distribution ``name`` requires in this venv with ``extras`` selected."""
+        # an empty extra evaluates the markers that don't mention extras
+        key: Final[tuple[str, frozenset[str]]] = (name, frozenset(extras) or frozenset(("",)))
+        if (edges := self._edges.get(key)) is None:
+            if (parsed := self._parsed.get(name)) is None:
+                parsed = self._parsed[name] = tuple(map(Requirement, self.distributions[name].requires or []))
+            edges = self._edges[key] = tuple(_applicable_requirements(parsed, key[1], self._env))
+        return edges
+
+    def required_names(self, name: str) -> set[str]:
+        """Canonical names ``name`` depends on, including dependencies behind its declared extras.
+
+        Like :func:`get_required_dependency_names`, this treats a dependency only an extra pulls in as required.
+        """
+        extras: Final[list[str]] = self.distributions[name].metadata.get_all("Provides-Extra") or []
+        return {canonicalize_name(req.name) for req in self.requirements(name, extras)}
+
+    def reachable(self, roots: Iterable[str], *, excluding: Collection[str] = ()) -> set[str]:
+        """``roots`` and every installed distribution they depend on, never walking through ``excluding``."""
+        seen: Final[set[str]] = set()
+        pending: Final[list[str]] = [canonicalize_name(root) for root in roots]
+        while pending:
+            if (name := pending.pop()) in seen or name in excluding:
+                continue
+            seen.add(name)
+            if name in self.distributions:
+                pending.extend(self.required_names(name))
+        return seen
+
+    def not_required(self, *, excluding: Collection[str] = ()) -> set[str]:
+        """Installed distributions no other installed one requires, as if ``excluding`` were uninstalled."""
+        installed: Final[set[str]] = set(self.distributions) - set(excluding)
+        required: Final[set[str]] = set()
+        for name in installed:
+            required.update(self.required_names(name))
+        return installed - required
+
+
 def list_not_required_packages(venv_python: Path) -> set[str]:
     """Canonical names of installed packages that no other installed package requires.
 
@@ -110,14 +177,7 @@ def list_not_required_packages(venv_python: Path) -> set[str]:
     (including uv, which lacks the flag) computes the same result.
     """
     venv_sys_path, venv_env, _ = fetch_info_in_venv(venv_python)
-    distributions = tuple(metadata.distributions(path=venv_sys_path))
-    installed: set[str] = set()
-    required: set[str] = set()
-    for dist in distributions:
-        if (name := _distribution_name(dist)) is not None:
-            installed.add(canonicalize_name(name))
-        required |= get_required_dependency_names(dist, venv_env)
-    return installed - required
+    return DependencyGraph.from_sys_path(venv_sys_path, venv_env).not_required()
 
 
 def get_apps_from_entry_points(dist: metadata.Distribution, bin_path: Path) -> set[str]:
@@ -260,6 +320,9 @@ def _get_editable_project_root(dist: metadata.Distribution) -> Path | None:
     if parsed_url.scheme != "file":
         return None
 
+    # urllib.request drags in http.client, too much for every pipx startup that loads this module
+    from urllib.request import url2pathname  # ruff:ignore[import-outside-top-level]  # see above
+
     url_path = f"//{parsed_url.netloc}{parsed_url.path}" if parsed_url.netloc else parsed_url.path
     return Path(url2pathname(url_path))
 
@@ -351,7 +414,6 @@ def _get_man_section_from_data_files_target(target_dir: str) -> str | None:
 
 
 def _dfs_package_resources(  # ruff:ignore[too-many-arguments]  # threads three resource accumulators plus the visited set through recursion
-    dist: metadata.Distribution,
     package_req: Requirement,
     venv_inspect_info: VenvInspectInformation,
     *,
@@ -365,14 +427,14 @@ def _dfs_package_resources(  # ruff:ignore[too-many-arguments]  # threads three
         dep_visited = {canonicalize_name(package_req.name): True}
 
     share_path: Final[Path] = venv_inspect_info.man_path.parent
-    dependencies = get_package_dependencies(dist, package_req.extras, venv_inspect_info.env)
+    dependencies = venv_inspect_info.graph.requirements(canonicalize_name(package_req.name), package_req.extras)
     for dep_req in dependencies:
         dep_name = canonicalize_name(dep_req.name)
         if dep_name in dep_visited:
             # avoid infinite recursion, avoid duplicates in info
             continue
 
-        dep_dist = venv_inspect_info.distributions.get(dep_name)
+        dep_dist = venv_inspect_info.graph.distributions.get(dep_name)
         if dep_dist is None:
             msg = f"Pipx Internal Error: cannot find package {dep_req.name!r} metadata."
             raise PipxError(msg)
@@ -388,7 +450,6 @@ def _dfs_package_resources(  # ruff:ignore[too-many-arguments]  # threads three
         # recursively search for more
         dep_visited[dep_name] = True
         app_paths_of_dependencies, man_paths_of_dependencies, completion_paths_of_dependencies = _dfs_package_resources(
-            dep_dist,
             dep_req,
             venv_inspect_info,
             app_paths_of_dependencies=app_paths_of_dependencies,
@@ -415,73 +476,295 @@ def _windows_extra_app_paths(app_paths: list[Path]) -> list[Path]:
     return app_paths_output
 
 
-def fetch_info_in_venv(venv_python_path: Path) -> tuple[list[str], dict[str, str], str]:
-    command_str = textwrap.dedent(
-        """
-        import json
-        import os
-        import platform
-        import sys
-
-        impl_ver = sys.implementation.version
-        implementation_version = "{0.major}.{0.minor}.{0.micro}".format(impl_ver)
-        if impl_ver.releaselevel != "final":
-            implementation_version = "{}{}{}".format(
-                implementation_version,
-                impl_ver.releaselevel[0],
-                impl_ver.serial,
-            )
-
-        sys_path = sys.path
+_PROBE_SCRIPT: Final[str] = textwrap.dedent(
+    """
+    import json
+    import os
+    import platform
+    import sys
+    import sysconfig
+
+    impl_ver = sys.implementation.version
+    implementation_version = "{0.major}.{0.minor}.{0.micro}".format(impl_ver)
+    if impl_ver.releaselevel != "final":
+        implementation_version = "{}{}{}".format(
+            implementation_version,
+            impl_ver.releaselevel[0],
+            impl_ver.serial,
+        )
+
+    sys_path = sys.path
+    try:
+        sys_path.remove("")
+    except ValueError:
+        pass
+
+    names = sys.argv[1:]
+    pip_importable = None
+    if names[:1] == ["--pip"]:
+        names = names[1:]
         try:
-            sys_path.remove("")
-        except ValueError:
-            pass
+            from pip._internal.cli.main import main
+        except Exception:
+            pip_importable = False
+        else:
+            pip_importable = True
+
+    requires_python = {}
+    if names:
+        from importlib.metadata import PackageNotFoundError, distribution
 
-        print(
-            json.dumps(
-                {
-                    "sys_path": sys_path,
-                    "python_version": "{0.major}.{0.minor}.{0.micro}".format(sys.version_info),
-                    "environment": {
-                        "implementation_name": sys.implementation.name,
-                        "implementation_version": implementation_version,
-                        "os_name": os.name,
-                        "platform_machine": platform.machine(),
-                        "platform_release": platform.release(),
-                        "platform_system": platform.system(),
-                        "platform_version": platform.version(),
-                        "python_full_version": platform.python_version(),
-                        "platform_python_implementation": platform.python_implementation(),
-                        "python_version": ".".join(platform.python_version_tuple()[:2]),
-                        "sys_platform": sys.platform,
-                    },
-                }
-            )
+        for name in names:
+            try:
+                requires_python[name] = distribution(name).metadata["Requires-Python"] or ""
+            except PackageNotFoundError:
+                requires_python[name] = None
+
+    print(
+        json.dumps(
+            {
+                "sys_path": sys_path,
+                "python_version": "{0.major}.{0.minor}.{0.micro}".format(sys.version_info),
+                "purelib": sysconfig.get_path("purelib"),
+                "platlib": sysconfig.get_path("platlib"),
+                "pip_importable": pip_importable,
+                "requires_python": requires_python,
+                "environment": {
+                    "implementation_name": sys.implementation.name,
+                    "implementation_version": implementation_version,
+                    "os_name": os.name,
+                    "platform_machine": platform.machine(),
+                    "platform_release": platform.release(),
+                    "platform_system": platform.system(),
+                    "platform_version": platform.version(),
+                    "python_full_version": platform.python_version(),
+                    "platform_python_implementation": platform.python_implementation(),
+                    "python_version": ".".join(platform.python_version_tuple()[:2]),
+                    "sys_platform": sys.platform,
+                },
+            }
         )
-        """
     )
-    venv_info = json.loads(
-        run_subprocess(
-            [venv_python_path, "-c", command_str],
-            capture_stderr=False,
-            log_cmd_str="<fetch_info_in_venv commands>",
-        ).stdout
+    """
+)
+
+
+class VenvProbe(NamedTuple):
+    """Everything pipx reads from a venv's interpreter, gathered by one :func:`probe_venv` round-trip."""
+
+    sys_path: list[str]
+    environment: dict[str, str]
+    python_version: str
+    purelib: Path
+    platlib: Path
+    # ``None`` when the probe did not import pip; see ``check_pip`` on :func:`probe_venv`
+    pip_importable: bool | None
+    # canonical name to the declared Requires-Python ("" when undeclared, ``None`` when not installed)
+    requires_python: dict[str, str | None]
+
+    @property
+    def site_packages(self) -> list[Path]:
+        """The purelib directory first, then the platlib directory when that is a second directory."""
+        # some Linux layouts symlink lib64 to lib, so compare the resolved targets rather than the scheme strings
+        if self.platlib.resolve() == self.purelib.resolve():
+            return [self.purelib]
+        return [self.purelib, self.platlib]
+
+
+def probe_venv(venv_python_path: Path, *, distributions: Iterable[str] = (), check_pip: bool = False) -> VenvProbe:
+    """Start ``venv_python_path`` once and return its paths, marker environment, and version.
+
+    ``distributions`` adds the Requires-Python of each named distribution, and ``check_pip`` reports whether pip's
+    CLI imports, which is what a usable shared libraries environment needs.
+    """
+    names: Final[list[str]] = [canonicalize_name(name) for name in distributions]
+    process = run_subprocess(
+        [venv_python_path, "-c", _PROBE_SCRIPT, *(["--pip"] if check_pip else []), *names],
+        capture_stderr=False,
+        log_cmd_str="<probe_venv commands>",
+        log_stdout=False,
     )
-    return (
-        venv_info["sys_path"],
-        venv_info["environment"],
-        f"Python {venv_info['python_version']}",
+    try:
+        venv_info = json.loads(process.stdout)
+    except (TypeError, ValueError):
+        venv_info = None
+    if process.returncode or not isinstance(venv_info, dict):
+        msg = f"Unable to query the interpreter {venv_python_path} (exit code {process.returncode})."
+        raise PipxError(msg)
+    return VenvProbe(
+        sys_path=venv_info["sys_path"],
+        environment=venv_info["environment"],
+        python_version=venv_info["python_version"],
+        purelib=Path(venv_info["purelib"]),
+        platlib=Path(venv_info["platlib"]),
+        pip_importable=venv_info["pip_importable"],
+        requires_python=venv_info["requires_python"],
+    )
+
+
+@traced("inspect")
+def fetch_info_in_venv(venv_python_path: Path) -> tuple[list[str], dict[str, str], str]:
+    venv_probe: Final[VenvProbe] = probe_venv(venv_python_path)
+    return venv_probe.sys_path, venv_probe.environment, f"Python {venv_probe.python_version}"
+
+
+def _site_packages_fingerprint(sys_path: Iterable[str], bin_path: Path) -> str | None:
+    """Digest of every distribution directory on ``sys_path`` plus the bin directory, or ``None`` when unreadable.
+
+    Installers write a fresh ``*.dist-info`` directory for every install, upgrade, or reinstall, so the names and
+    mtimes change whenever the inspection result could; the bin directory covers scripts added or removed beside them.
+    """
+    digest = hashlib.sha256()
+    for entry in sys_path:
+        try:
+            with os.scandir(entry) as entries:
+                listing = sorted(
+                    (item.name, item.stat(follow_symlinks=False).st_mtime_ns)
+                    for item in entries
+                    if item.name.endswith(_DISTRIBUTION_SUFFIXES)
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            # zipped standard libraries and paths that do not exist yet contribute no distributions
+            listing = []
+        except OSError:
+            return None
+        digest.update(json.dumps([entry, listing]).encode())
+    try:
+        digest.update(str(bin_path.stat().st_mtime_ns).encode())
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _inspect_cache_key(root_package_name: str, extras: set[str], bin_path: Path, man_path: Path) -> str:
+    return json.dumps([canonicalize_name(root_package_name), sorted(extras), str(bin_path), str(man_path)])
+
+
+def _read_inspect_cache(cache_file: Path) -> dict[str, Any] | None:
+    try:
+        with cache_file.open("rb") as cache_fh:
+            payload = json.load(cache_fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != _INSPECT_CACHE_VERSION:
+        return None
+    return payload
+
+
+def _load_cached_metadata(cache_file: Path, key: str, bin_path: Path) -> VenvMetadata | None:
+    payload = _read_inspect_cache(cache_file)
+    if payload is None or (entry := payload.get("entries", {}).get(key)) is None:
+        return None
+    if _site_packages_fingerprint(payload.get("sys_path", []), bin_path) != payload.get("fingerprint"):
+        return None
+    try:
+        return _metadata_from_json(entry)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _store_cached_metadata(
+    cache_file: Path, key: str, sys_path: list[str], bin_path: Path, venv_metadata: VenvMetadata
+) -> None:
+    if (fingerprint := _site_packages_fingerprint(sys_path, bin_path)) is None:
+        return
+    payload = _read_inspect_cache(cache_file)
+    # a changed fingerprint means every other entry was computed against a different environment, so drop them
+    entries: dict[str, Any] = (
+        payload.get("entries", {}) if payload is not None and payload.get("fingerprint") == fingerprint else {}
     )
+    entries[key] = _metadata_to_json(venv_metadata)
+    try:
+        replace_json(
+            {"version": _INSPECT_CACHE_VERSION, "fingerprint": fingerprint, "sys_path": sys_path, "entries": entries},
+            cache_file,
+        )
+    except OSError as exc:
+        # the cache only saves time, so an unwritable venv still inspects correctly on the next run
+        logger.debug("Unable to write %s: %s", cache_file, exc)
+
+
+def _metadata_to_json(venv_metadata: VenvMetadata) -> dict[str, Any]:
+    encoded: dict[str, Any] = {}
+    for name, value in venv_metadata._asdict().items():
+        if isinstance(value, dict):
+            encoded[name] = {key: [str(path) for path in paths] for key, paths in value.items()}
+        elif isinstance(value, list):
+            encoded[name] = [str(item) for item in value]
+        else:
+            encoded[name] = value
+    return encoded
+
+
+def _metadata_from_json(encoded: dict[str, Any]) -> VenvMetadata:
+    decoded: dict[str, Any] = {}
+    for name in VenvMetadata._fields:
+        value = encoded[name]
+        if name.endswith("_paths_of_dependencies"):
+            decoded[name] = {key: [Path(path) for path in paths] for key, paths in value.items()}
+        elif name.endswith("_paths"):
+            decoded[name] = [Path(path) for path in value]
+        elif isinstance(value, list):
+            decoded[name] = [str(item) for item in value]
+        else:
+            decoded[name] = str(value)
+    return VenvMetadata(**decoded)
 
 
-def inspect_venv(  # ruff:ignore[too-many-locals]  # aggregates apps, man pages, and completions for root and deps into one VenvMetadata
+@traced("inspect")
+def inspect_venv(  # ruff:ignore[too-many-arguments]  # the cache directory rides along with the paths describing the venv
     root_package_name: str,
     root_package_extras: set[str],
     venv_bin_path: Path,
     venv_python_path: Path,
     venv_man_path: Path,
+    *,
+    cache_dir: Path | None = None,
+    venv_probe: VenvProbe | None = None,
 ) -> VenvMetadata:
+    """Resolve the apps, man pages, and completions ``root_package_name`` and its dependencies provide.
+
+    With ``cache_dir`` the result is kept in :data:`INSPECT_CACHE_FILENAME` there and reused while the venv's
+    distributions are unchanged, which skips both the interpreter round-trip and the walk over every RECORD. A
+    ``venv_probe`` the caller already holds stands in for that round-trip when the walk does run.
+    """
+    if cache_dir is None:
+        return _inspect_venv(
+            root_package_name,
+            root_package_extras,
+            venv_bin_path,
+            venv_python_path,
+            venv_man_path,
+            venv_probe=venv_probe,
+        )[0]
+
+    cache_file: Final[Path] = cache_dir / INSPECT_CACHE_FILENAME
+    key: Final[str] = _inspect_cache_key(root_package_name, root_package_extras, venv_bin_path, venv_man_path)
+    if (cached := _load_cached_metadata(cache_file, key, venv_bin_path)) is not None:
+        logger.info("Using cached inspection of %s from %s", root_package_name, cache_file)
+        return cached
+    venv_metadata, venv_sys_path, cacheable = _inspect_venv(
+        root_package_name,
+        root_package_extras,
+        venv_bin_path,
+        venv_python_path,
+        venv_man_path,
+        venv_probe=venv_probe,
+    )
+    if cacheable:
+        _store_cached_metadata(cache_file, key, venv_sys_path, venv_bin_path, venv_metadata)
+    return venv_metadata
+
+
+def _inspect_venv(  # ruff:ignore[too-many-locals, too-many-arguments]  # aggregates apps, man pages, and completions for root and deps into one VenvMetadata
+    root_package_name: str,
+    root_package_extras: set[str],
+    venv_bin_path: Path,
+    venv_python_path: Path,
+    venv_man_path: Path,
+    *,
+    venv_probe: VenvProbe | None,
+) -> tuple[VenvMetadata, list[str], bool]:
     app_paths_of_dependencies: dict[str, list[Path]] = {}
     apps_of_dependencies: list[str] = []
     man_paths_of_dependencies: dict[str, list[Path]] = {}
@@ -492,23 +775,23 @@ def inspect_venv(  # ruff:ignore[too-many-locals]  # aggregates apps, man pages,
     root_req = Requirement(root_package_name)
     root_req.extras = root_package_extras
 
-    (venv_sys_path, venv_env, venv_python_version) = fetch_info_in_venv(venv_python_path)
-
-    distributions = get_distributions_by_name(venv_sys_path)
+    if venv_probe is None:
+        (venv_sys_path, venv_env, venv_python_version) = fetch_info_in_venv(venv_python_path)
+    else:
+        venv_sys_path, venv_env = venv_probe.sys_path, venv_probe.environment
+        venv_python_version = f"Python {venv_probe.python_version}"
 
     venv_inspect_info = VenvInspectInformation(
         bin_path=venv_bin_path,
         man_path=venv_man_path,
-        env=venv_env,
-        distributions=distributions,
+        graph=DependencyGraph.from_sys_path(venv_sys_path, venv_env),
     )
 
-    root_dist = venv_inspect_info.distributions.get(canonicalize_name(root_req.name))
+    root_dist = venv_inspect_info.graph.distributions.get(canonicalize_name(root_req.name))
     if root_dist is None:
         msg = f"Pipx Internal Error: cannot find package {root_req.name!r} metadata."
         raise PipxError(msg)
     app_paths_of_dependencies, man_paths_of_dependencies, completion_paths_of_dependencies = _dfs_package_resources(
-        root_dist,
         root_req,
         venv_inspect_info,
         app_paths_of_dependencies=app_paths_of_dependencies,
@@ -537,7 +820,7 @@ def inspect_venv(  # ruff:ignore[too-many-locals]  # aggregates apps, man pages,
             dep_path.relative_to(venv_share_path).as_posix() for dep_path in completion_paths_of_dependencies[dep]
         ]
 
-    return VenvMetadata(
+    venv_metadata = VenvMetadata(
         apps=apps,
         app_paths=app_paths,
         apps_of_dependencies=apps_of_dependencies,
@@ -553,13 +836,19 @@ def inspect_venv(  # ruff:ignore[too-many-locals]  # aggregates apps, man pages,
         package_version=root_dist.version,
         python_version=venv_python_version,
     )
+    # an editable project's man pages live in its source tree, which no distribution directory change reflects
+    return venv_metadata, venv_sys_path, _get_editable_project_root(root_dist) is None
 
 
 __all__ = [
+    "INSPECT_CACHE_FILENAME",
+    "DependencyGraph",
     "VenvMetadata",
+    "VenvProbe",
     "fetch_info_in_venv",
     "get_distributions_by_name",
     "get_required_dependency_names",
     "inspect_venv",
     "list_not_required_packages",
+    "probe_venv",
 ]
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Literal
+
+from pipx import paths
+from pipx.constants import LINUX
+from pipx.trace import TracedFileLock
+from pipx.util import PipxError, replace_json, rmdir
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+if LINUX:
+    import fcntl
+
+_LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+_TEMPLATE_VERSION: Final[int] = 1
+_TEMPLATE_KEY_LENGTH: Final[int] = 16
+# ioctl request number of Linux's FICLONE, which shares the source's extents instead of copying its bytes
+_FICLONE: Final[int] = 0x40049409
+
+
+@dataclass(frozen=True)
+class _Template:
+    root: Path
+    # every spelling of the template's own path that the venv creator wrote into its files
+    spellings: tuple[str, ...]
+    rewrite: tuple[str, ...]
+
+
+class _NotRelocatableError(Exception):
+    pass
+
+
+def clone_venv(root: Path, *, python: str, key: Iterable[str], create: Callable[[Path], None]) -> None:
+    """Create the venv at ``root`` by copying a template that ``create`` built once for the same inputs.
+
+    The template is keyed on the resolved interpreter and everything in ``key`` that shapes what ``create`` builds.
+    Only files naming the template's own path are rewritten in the copy, which for a venv without pip is
+    ``pyvenv.cfg`` and the activation scripts. Whenever a template can't be used, ``create`` builds ``root`` directly.
+    """
+    template: Final[_Template | None] = _template(python, key, create)
+    if template is None:
+        create(root)
+        return
+    try:
+        _clone(template, root)
+    except OSError as error:
+        _LOGGER.debug("Unable to clone %s into %s: %s", template.root, root, error)
+        create(root)
+
+
+def _template(python: str, key: Iterable[str], create: Callable[[Path], None]) -> _Template | None:
+    interpreter: Final[str | None] = shutil.which(python)
+    if interpreter is None:
+        # a version request such as uv's ``3.12`` only names an interpreter once the creator resolves it
+        return None
+    try:
+        resolved = Path(interpreter).resolve()
+        interpreter_stat = resolved.stat()
+    except OSError:
+        return None
+    # an upgraded interpreter keeps its path but not its size and mtime, which retires the old template
+    identity: Final[tuple[str, ...]] = (
+        str(_TEMPLATE_VERSION),
+        python,
+        interpreter,
+        str(resolved),
+        str(interpreter_stat.st_size),
+        str(interpreter_stat.st_mtime_ns),
+        *key,
+    )
+    name: Final[str] = hashlib.sha256("\0".join(identity).encode()).hexdigest()[:_TEMPLATE_KEY_LENGTH]
+    templates: Final[Path] = paths.ctx.venv_templates
+    template_dir: Final[Path] = templates / name
+    record: Final[Path] = templates / f"{name}.json"
+    if (template := _read_record(record, template_dir)) is not None:
+        return template or None
+    templates.mkdir(parents=True, exist_ok=True)
+    with TracedFileLock(templates / f".{name}.lock"):
+        if (template := _read_record(record, template_dir)) is not None:
+            return template or None
+        # a build that was interrupted before its record was written leaves a partial template behind
+        rmdir(template_dir)
+        try:
+            create(template_dir)
+        except PipxError:
+            # report the failure against the venv the user asked for rather than the template
+            rmdir(template_dir)
+            return None
+        spellings: Final[tuple[str, ...]] = tuple(dict.fromkeys((str(template_dir), str(template_dir.resolve()))))
+        try:
+            template = _Template(template_dir, spellings, tuple(_files_naming(template_dir, spellings)))
+        except _NotRelocatableError as error:
+            _LOGGER.debug("Not cloning venvs from %s: %s", template_dir, error)
+            rmdir(template_dir)
+            template = None
+        _write_record(record, template)
+    return template
+
+
+def _files_naming(template_dir: Path, spellings: tuple[str, ...]) -> Iterator[str]:
+    needles: Final[tuple[bytes, ...]] = tuple(os.fsencode(spelling) for spelling in spellings)
+    for directory, _, filenames in os.walk(template_dir):
+        for filename in filenames:
+            path = Path(directory, filename)
+            if path.is_symlink():
+                if any(needle in os.fsencode(path.readlink()) for needle in needles):
+                    msg = f"{path} links into the venv by its absolute path"
+                    raise _NotRelocatableError(msg)
+                continue
+            content = path.read_bytes()
+            if not any(needle in content for needle in needles):
+                continue
+            # a launcher executable embeds its interpreter's path, and replacing it would corrupt the binary
+            if b"\0" in content:
+                msg = f"{path} embeds the venv's path in a binary"
+                raise _NotRelocatableError(msg)
+            yield path.relative_to(template_dir).as_posix()
+
+
+def _clone(template: _Template, root: Path) -> None:
+    shutil.copytree(template.root, root, symlinks=True, copy_function=_copy_file, dirs_exist_ok=True)
+    absolute: Final[Path] = root.absolute()
+    # each spelling of the template's path maps to the same spelling of the clone's, whose parent already exists
+    targets: Final[dict[bytes, bytes]] = {
+        os.fsencode(spelling): os.fsencode(target)
+        for spelling, target in zip(
+            template.spellings, (str(absolute), str(absolute.parent.resolve() / absolute.name)), strict=False
+        )
+    }
+    for relative in template.rewrite:
+        path = root / relative
+        content = path.read_bytes()
+        # the resolved spelling can end with the other one, so the longer is replaced first
+        for spelling, target in sorted(targets.items(), key=lambda item: -len(item[0])):
+            content = content.replace(spelling, target)
+        # writing in place keeps the copied permissions, which matter for the scripts
+        path.write_bytes(content)
+
+
+def _copy_file(source: str, destination: str) -> str:
+    if LINUX:
+        with (
+            suppress(OSError),
+            Path(source).open("rb") as source_fh,
+            Path(destination).open("wb") as destination_fh,
+        ):
+            fcntl.ioctl(destination_fh.fileno(), _FICLONE, source_fh.fileno())
+            shutil.copystat(source, destination)
+            return destination
+    # filesystems without reflinks get a plain copy
+    return shutil.copy2(source, destination)
+
+
+def _read_record(record: Path, template_dir: Path) -> _Template | Literal[False] | None:
+    """The template a finished build recorded, ``False`` when the build found it can't be cloned, or ``None``."""
+    try:
+        with record.open("rb") as record_fh:
+            payload = json.load(record_fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != _TEMPLATE_VERSION:
+        return None
+    spellings = payload.get("spellings")
+    rewrite = payload.get("rewrite")
+    if rewrite is None:
+        return False
+    if not isinstance(spellings, list) or not isinstance(rewrite, list) or not template_dir.is_dir():
+        return None
+    return _Template(template_dir, tuple(map(str, spellings)), tuple(map(str, rewrite)))
+
+
+def _write_record(record: Path, template: _Template | None) -> None:
+    payload: Final[dict[str, object]] = {
+        "version": _TEMPLATE_VERSION,
+        "spellings": None if template is None else list(template.spellings),
+        "rewrite": None if template is None else list(template.rewrite),
+    }
+    try:
+        replace_json(payload, record)
+    except OSError as exc:
+        # without the record the next venv creation builds the template again
+        _LOGGER.debug("Unable to write %s: %s", record, exc)
+
+
+__all__ = [
+    "clone_venv",
+]
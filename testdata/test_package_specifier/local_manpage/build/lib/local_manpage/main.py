@@ -0,0 +1,2 @@
+def main():
+    print("local-manpage")
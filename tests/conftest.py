@@ -142,19 +142,23 @@ def empty_project(root: Path, tmp_path: Path) -> Path:
 
 
 @pytest.fixture(autouse=True)
-def _backend_test_baseline(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Pin every test to pip with empty backend caches.
+def _backend_test_baseline(monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest.TempPathFactory) -> None:
+    """Pin every test to pip with empty backend and lookup caches.
 
     Without the env pin, unit tests that build a ``Venv`` outside the
     ``pipx_temp_env`` fixture would auto-detect uv from CI's PATH and fork a
-    real ``uv --version`` probe. Cache resets stop the previous test's
-    monkeypatched ``shutil.which`` from poisoning this one.
+    real ``uv --version`` probe. Cache resets, including a lookup cache
+    directory of the test's own, stop the previous test's monkeypatched
+    ``shutil.which`` or ``subprocess.run``, or the developer's own pipx, from
+    poisoning this one.
 
     Uv-backend tests opt back in with ``--backend uv``.
     """
     monkeypatch.setenv("PIPX_DEFAULT_BACKEND", "pip")
     find_uv_binary.cache_clear()
     _uv_backend_module._check_uv_version.cache_clear()  # ruff:ignore[private-member-access]  # cache reset has no public API
+    lookup_cache: Final[Path] = tmp_path_factory.mktemp("lookups")
+    monkeypatch.setattr(type(paths.ctx), "lookup_cache", property(lambda _ctx: lookup_cache))
     get_backend.cache_clear()
     reset_backend_override_warnings()
 
@@ -12,6 +12,7 @@ from pipx.animate import (
     CLEAR_LINE,
     EMOJI_ANIMATION_FRAMES,
     NONEMOJI_ANIMATION_FRAMES,
+    animations_paused,
     hide_cursor,
     show_cursor,
 )
@@ -186,3 +187,15 @@ def test_env_no_animate(
 
     assert not captured.out
     assert captured.err == expected_string
+
+
+def test_paused_animation_prints_plain_line(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(pipx.animate, "STDERR_IS_TTY", True)
+    monkeypatch.setenv("COLUMNS", "80")
+
+    with animations_paused(), pipx.animate.animate(TEST_STRING_40_CHAR, do_animation=True):
+        pass
+
+    assert capsys.readouterr().err == f"{TEST_STRING_40_CHAR}...\n"
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import json
 import subprocess
+from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING, Final, TypedDict
 
 import pytest
+from packaging.version import Version
 
-from pipx import backends, pipx_metadata_file
+from pipx import backends, paths, pipx_metadata_file
 from pipx.backends import (
     KNOWN_BACKENDS,
     PIP,
@@ -19,13 +21,17 @@ from pipx.backends import (
     resolve_backend_name,
 )
 from pipx.backends.pip import PipBackend
-from pipx.backends.uv import UvBackend, resolve_uv_binary
+from pipx.backends.uv import (
+    UvBackend,
+    _check_uv_version,  # ruff:ignore[import-private-name]  # cache reset has no public API
+    resolve_uv_binary,
+)
 from pipx.commands.run_uv import translate_pip_args_for_uv
 from pipx.constants import PIPX_SHARED_PTH
 from pipx.main import (
     _validate_backend_available,  # ruff:ignore[import-private-name]  # test exercises private helper, no public API
 )
-from pipx.util import PipxError
+from pipx.util import PipxError, StreamedProcess
 from pipx.venv import Venv, reset_backend_override_warnings
 from pipx.venv_inspect import list_not_required_packages
 
@@ -242,6 +248,56 @@ def test_resolve_uv_binary_reports_a_hanging_version_probe(mocker: MockerFixture
         resolve_uv_binary()
 
 
+@pytest.mark.parametrize(
+    ("replaced", "probes"),
+    [
+        pytest.param(False, 1, id="unchanged"),
+        pytest.param(True, 2, id="replaced"),
+    ],
+)
+def test_uv_binary_is_remembered_across_runs(
+    mocker: MockerFixture, tmp_path: Path, replaced: bool, probes: int
+) -> None:
+    binary: Final[Path] = tmp_path / "uv"
+    binary.write_text("uv", encoding="utf-8")
+    mocker.patch("pipx.backends.uv._FIND_UV_BIN_FROM_EXTRA", None)
+    mocker.patch("shutil.which", return_value=str(binary))
+    run: Final[MagicMock] = mocker.patch(
+        "pipx.backends.uv.subprocess.run",
+        return_value=subprocess.CompletedProcess([str(binary), "--version"], 0, stdout="uv 0.11.28", stderr=""),
+    )
+    assert _check_uv_version(resolve_uv_binary()) == Version("0.11.28")
+    if replaced:
+        binary.write_text("a newer uv", encoding="utf-8")
+        run.return_value = subprocess.CompletedProcess([str(binary), "--version"], 0, stdout="uv 0.12.0", stderr="")
+    # the in-process caches start empty in the next pipx run
+    find_uv_binary.cache_clear()
+    _check_uv_version.cache_clear()
+
+    assert (find_uv_binary(), _check_uv_version(binary)) == (
+        (binary, "path"),
+        Version("0.12.0" if replaced else "0.11.28"),
+    )
+    assert run.call_count == probes
+
+
+def test_uv_replaced_binary_is_probed_again(mocker: MockerFixture, tmp_path: Path) -> None:
+    binary: Final[Path] = tmp_path / "uv"
+    binary.write_text("uv", encoding="utf-8")
+    mocker.patch("pipx.backends.uv._FIND_UV_BIN_FROM_EXTRA", None)
+    mocker.patch("shutil.which", return_value=str(binary))
+    run: Final[MagicMock] = mocker.patch(
+        "pipx.backends.uv.subprocess.run",
+        return_value=subprocess.CompletedProcess([str(binary), "--version"], 0, stdout="uv 0.11.28", stderr=""),
+    )
+    assert resolve_uv_binary() == binary
+    find_uv_binary.cache_clear()
+    binary.write_text("a broken uv", encoding="utf-8")
+    run.side_effect = OSError("exec format error")
+
+    assert find_uv_binary() == (None, "missing")
+
+
 def test_uv_backend_rejects_pre_cooldown_version(mocker: MockerFixture) -> None:
     binary: Final[Path] = Path("/usr/local/bin/uv")
     mocker.patch("pipx.backends.uv.resolve_uv_binary", return_value=binary)
@@ -290,6 +346,42 @@ def test_backend_verbose_install_streams_output(backend_name: str, tmp_path: Pat
     )
 
 
+@pytest.mark.parametrize("backend_name", [pytest.param(PIP, id="pip"), pytest.param(UV, id="uv")])
+@pytest.mark.parametrize("returncode", [pytest.param(0, id="success"), pytest.param(1, id="failure")])
+def test_backend_install_closes_the_streamed_transcripts(
+    backend_name: str, returncode: int, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+) -> None:
+    binary: Final[Path] = tmp_path / "uv"
+    mocker.patch("pipx.backends.uv.resolve_uv_binary", return_value=binary)
+    mocker.patch("pipx.backends.uv.find_uv_binary", return_value=(binary, "path"))
+    mocker.patch(
+        "pipx.backends.uv.subprocess.run",
+        return_value=subprocess.CompletedProcess([str(binary), "--version"], 0, stdout="uv 0.11.28", stderr=""),
+    )
+    monkeypatch.setattr(paths.ctx, "log_file", tmp_path / "cmd.log")
+    process: Final[MagicMock] = mocker.MagicMock(
+        spec=StreamedProcess,
+        args=["install"],
+        returncode=returncode,
+        stdout="",
+        stderr="",
+        transcripts={},
+        pip_output=mocker.MagicMock(),
+    )
+    mocker.patch(f"pipx.backends.{backend_name}.run_subprocess", autospec=True, return_value=process)
+
+    with suppress(PipxError):
+        (UvBackend() if backend_name == UV else PipBackend()).install(
+            venv_root=tmp_path,
+            venv_python=tmp_path / "bin" / "python",
+            requirements=["demo"],
+            pip_args=[],
+            verbose=True,
+        )
+
+    process.close.assert_called_once_with()
+
+
 @pytest.mark.parametrize(
     ("backend_name", "progress", "flags", "streams"),
     [
@@ -11,10 +11,12 @@ from helpers import run_pipx_cli, skip_if_windows
 from pipx import paths
 from pipx.commands import common
 from pipx.commands.common import (
+    _batched_injections,  # ruff:ignore[import-private-name]  # test exercises private helper, no public API
     _remove_stale_venv_resources,  # ruff:ignore[import-private-name]  # test exercises private helper, no public API
     expose_resources_globally,
     get_exposed_paths_for_package,
 )
+from pipx.pipx_metadata_file import PackageInfo
 from pipx.venv import Venv
 
 if TYPE_CHECKING:
@@ -130,3 +132,44 @@ def test_get_exposed_paths_matches_copied_launcher(tmp_path: Path, mocker: Mocke
     exposed = get_exposed_paths_for_package(venv_resource_path, local_resource_dir)
 
     assert (launcher in exposed) is owned
+
+
+def _injected(package: str, pip_args: list[str], cooldown_days: int | None = None) -> PackageInfo:
+    return PackageInfo(
+        package=package,
+        package_or_url=package,
+        pip_args=pip_args,
+        include_dependencies=False,
+        include_apps=False,
+        apps=[],
+        app_paths=[],
+        apps_of_dependencies=[],
+        app_paths_of_dependencies={},
+        package_version="1.0",
+        cooldown_days=cooldown_days,
+    )
+
+
+@pytest.mark.parametrize(
+    ("cooldown_days", "expected"),
+    [
+        pytest.param(None, {"same": "same==1.0"}, id="recorded-cooldowns"),
+        pytest.param(3, {"same": "same==1.0", "other-cooldown": "other-cooldown==1.0"}, id="cooldown-given"),
+    ],
+)
+def test_batched_injections_compares_recorded_arguments(cooldown_days: int | None, expected: dict[str, str]) -> None:
+    injected = {
+        "same": _injected("same", ["--no-cache-dir"]),
+        "other-args": _injected("other-args", ["--pre"]),
+        "other-cooldown": _injected("other-cooldown", ["--no-cache-dir"], cooldown_days=7),
+    }
+
+    batched = _batched_injections(
+        injected,
+        lambda package: f"{package.package}=={package.package_version}",
+        main_pip_args=["--no-cache-dir"],
+        main_cooldown_days=cooldown_days,
+        cooldown_days=cooldown_days,
+    )
+
+    assert batched == expected
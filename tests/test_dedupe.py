@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+from typing import TYPE_CHECKING, Final
+
+import pytest
+
+from helpers import run_pipx_cli
+from pipx import paths
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import ModuleType
+
+    from pytest_mock import MockerFixture
+
+_DEDUPE_MODULE: Final[ModuleType] = importlib.import_module("pipx.commands.dedupe")
+
+
+@pytest.fixture
+def two_pycowsay_venvs(
+    pipx_temp_env: None,  # ruff:ignore[unused-function-argument]  # required so the temp env is active while pycowsay is installed
+    capsys: pytest.CaptureFixture[str],
+) -> tuple[Path, Path]:
+    assert run_pipx_cli(["install", "pycowsay"]) == 0
+    assert run_pipx_cli(["install", "pycowsay", "--suffix", "_b"]) == 0
+    capsys.readouterr()
+    return paths.ctx.venvs / "pycowsay", paths.ctx.venvs / "pycowsay-b"
+
+
+def _site_file(venv_dir: Path, name: str) -> Path:
+    return next(venv_dir.glob(f"*/python*/site-packages/pycowsay/{name}"))
+
+
+def test_dedupe_links_identical_installed_files(
+    two_pycowsay_venvs: tuple[Path, Path], capsys: pytest.CaptureFixture[str]
+) -> None:
+    first, second = two_pycowsay_venvs
+
+    assert run_pipx_cli(["dedupe"]) == 0
+
+    assert capsys.readouterr().out.startswith("Linked ")
+    assert _site_file(first, "main.py").samefile(_site_file(second, "main.py"))
+    assert not (first / "bin" / "pycowsay").samefile(second / "bin" / "pycowsay")
+
+
+def test_dedupe_keeps_files_that_differ(two_pycowsay_venvs: tuple[Path, Path]) -> None:
+    first, second = two_pycowsay_venvs
+    edited: Final[Path] = _site_file(second, "main.py")
+    edited.write_text(edited.read_text(encoding="utf-8").replace("cow", "cat"), encoding="utf-8")
+
+    assert run_pipx_cli(["dedupe"]) == 0
+
+    assert not _site_file(first, "main.py").samefile(edited)
+
+
+def test_dedupe_repeat_run_is_a_no_op(
+    two_pycowsay_venvs: tuple[Path, Path],  # ruff:ignore[unused-function-argument]  # installs the environments to deduplicate
+    capsys: pytest.CaptureFixture[str],
+    mocker: MockerFixture,
+) -> None:
+    assert run_pipx_cli(["dedupe"]) == 0
+    capsys.readouterr()
+    dedupe_hashlib: Final = mocker.patch.object(_DEDUPE_MODULE, "hashlib", wraps=hashlib)
+
+    assert run_pipx_cli(["dedupe", "--output", "json"]) == 0
+
+    assert (json.loads(capsys.readouterr().out)["data"], dedupe_hashlib.sha256.call_count) == (
+        {"environments": [], "freed_bytes": 0, "linked": 0},
+        0,
+    )
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_dedupe_no_packages(capsys: pytest.CaptureFixture[str]) -> None:
+    assert run_pipx_cli(["dedupe"]) == 0
+
+    assert capsys.readouterr().out == "pipx found no duplicate files to link.\n"
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 from helpers import run_pipx_cli, skip_if_windows
-from pipx import paths
+from pipx import backends, paths
 from pipx.commands.environment import ENVIRONMENT_VARIABLES
 from pipx.paths import get_expanded_environ
 
@@ -29,7 +29,7 @@ def test_cli_value_skips_unrelated_discovery(
         return_value=("pip", "auto-pip"),
     )
     find_uv_binary = mocker.patch.object(
-        environment_module,
+        backends,
         "find_uv_binary",
         autospec=True,
         return_value=(None, "missing"),
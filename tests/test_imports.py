@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 import subprocess
 import sys
@@ -23,3 +24,34 @@ def test_importing_util_first_succeeds(root: Path) -> None:
 
     assert result.returncode == 0, result.stderr
     assert result.stdout == "Success!\n"
+
+
+def test_version_loads_only_parser_command_modules(root: Path) -> None:
+    # every pipx call pays for what ``pipx.main`` drags in, so only the modules the parser itself needs may load; the
+    # venvs, the backends and the standalone Python downloader wait for the command that uses them
+    env = {**os.environ, "PYTHONPATH": str(root / "src")}
+    env.pop("_ARGCOMPLETE", None)
+    code = (
+        "import json, sys\n"
+        "from pipx.main import cli\n"
+        "sys.argv = ['pipx', '--version']\n"
+        "try:\n"
+        "    cli()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "deferred = ('argcomplete', 'http.client', 'pipx.backends.pip', 'pipx.backends.uv', 'pipx.standalone_python',"
+        " 'pipx.venv', 'pipx.venv_template', 'tarfile', 'urllib.request')\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith('pipx.commands') or m in deferred)))\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        check=False,
+        capture_output=True,
+        cwd=root,
+        env=env,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout.splitlines()[-1]) == ["pipx.commands", "pipx.commands.environment"]
@@ -7,7 +7,7 @@ import pytest
 
 from helpers import PACKAGE_CACHE_DIR_NAME, run_pipx_cli
 from package_info import PKG
-from pipx import paths
+from pipx import paths, shared_libs
 from pipx.pipx_metadata_file import PipxMetadata
 from pipx.util import pipx_wrap
 
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from pathlib import Path
 
+    from pytest_mock import MockerFixture
+
 
 @pytest.mark.parametrize(
     ("install_all_args", "expected_cooldown"),
@@ -69,10 +71,11 @@ def test_install_all(  # ruff:ignore[too-many-positional-arguments]  # pytest in
     )
 
 
+@pytest.mark.parametrize("jobs_args", [pytest.param([], id="serial"), pytest.param(["--jobs", "2"], id="concurrent")])
 @pytest.mark.usefixtures("pipx_temp_env")
-def test_install_all_multiple_errors(root: Path, capsys: pytest.CaptureFixture[str]) -> None:
+def test_install_all_multiple_errors(root: Path, capsys: pytest.CaptureFixture[str], jobs_args: list[str]) -> None:
     pipx_metadata_path = root / "testdata" / "pipx_metadata_multiple_errors.json"
-    assert run_pipx_cli(["install-all", str(pipx_metadata_path)])
+    assert run_pipx_cli(["install-all", *jobs_args, str(pipx_metadata_path)])
     captured = capsys.readouterr()
     assert "The following package(s) failed to install: dotenv, weblate" in captured.err
     assert f"No packages installed after running 'pipx install-all {pipx_metadata_path}'" in captured.out
@@ -106,3 +109,54 @@ def test_install_all_reports_injected_failure(
     error: Final[str] = " ".join(capsys.readouterr().err.split())
     expected_error: Final[str] = " ".join(pipx_wrap(f"Unable to parse package spec: {missing_spec}").split())
     assert (result, expected_error in error) == (1, True)
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_install_all_injects_a_conflicting_package_on_its_own(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    make_project_with_dependency: Callable[[str], Path],
+) -> None:
+    conflicting: Final[Path] = make_project_with_dependency("black==22.8.0")
+    assert not run_pipx_cli(["install", "black==22.10.0"])
+    assert not run_pipx_cli(["inject", "black", str(conflicting)])
+    capsys.readouterr()
+    assert not run_pipx_cli(["list", "--json"])
+    spec_file: Final[Path] = tmp_path / "pipx.json"
+    spec_file.write_text(capsys.readouterr().out, encoding="utf-8")
+    assert not run_pipx_cli(["uninstall-all"])
+    capsys.readouterr()
+
+    result: Final[int] = run_pipx_cli(["install-all", str(spec_file)])
+
+    metadata: Final[PipxMetadata] = PipxMetadata(paths.ctx.venvs / "black")
+    assert (
+        result,
+        sorted(metadata.injected_packages),
+        "injecting each one on its own" in capsys.readouterr().err,
+    ) == (0, ["empty-project"], True)
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_install_all_jobs_skips_maintenance_in_every_worker(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], mocker: MockerFixture
+) -> None:
+    for suffix in ("_one", "_two"):
+        assert not run_pipx_cli(["install", "pycowsay", f"--suffix={suffix}"])
+    capsys.readouterr()
+    assert not run_pipx_cli(["list", "--json"])
+    pipx_list_path: Final[Path] = tmp_path / "pipx_list.json"
+    pipx_list_path.write_text(capsys.readouterr().out, encoding="utf-8")
+    assert not run_pipx_cli(["uninstall-all"])
+    seen: Final[list[bool]] = []
+    # every new venv asks for the shared libraries, which reinstall pip in them unless maintenance is skipped
+    mocker.patch.object(
+        shared_libs.shared_libs,
+        "create",
+        side_effect=lambda **_options: seen.append(shared_libs.shared_libs_auto_upgrade_disabled()),
+    )
+
+    assert not run_pipx_cli(["install-all", "--jobs", "2", "--skip-maintenance", str(pipx_list_path)])
+
+    assert seen
+    assert all(seen)
@@ -255,6 +255,53 @@ def test_find_python_interpreter_missing_on_path_raises() -> None:
         assert "on your PATH" in str(e)
 
 
+def _fake_python(bin_dir: Path, name: str) -> Path:
+    bin_dir.mkdir(exist_ok=True)
+    python = bin_dir / name
+    python.write_text("#!/bin/sh\necho 3.99.1\n", encoding="utf-8")
+    python.chmod(0o755)
+    return python
+
+
+@pytest.mark.skipif(WINDOWS, reason="Unix command resolution")
+def test_find_python_interpreter_remembers_command_until_it_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    python = _fake_python(tmp_path / "bin", "python3.99")
+    monkeypatch.setenv("PATH", str(python.parent))
+    assert find_python_interpreter("3.99") == str(python)
+    monkeypatch.setattr(shutil, "which", lambda _name: None)
+
+    remembered = find_python_interpreter("3.99")
+    os.utime(python, ns=(0, 0))
+
+    assert remembered == str(python)
+    with pytest.raises(InterpreterResolutionError):
+        find_python_interpreter("3.99")
+
+
+@pytest.mark.skipif(WINDOWS, reason="Unix command resolution")
+def test_find_python_interpreter_searches_again_when_path_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PATH", str(_fake_python(tmp_path / "old", "python3.99").parent))
+    find_python_interpreter("3.99")
+    newer = _fake_python(tmp_path / "new", "python3.99")
+    monkeypatch.setenv("PATH", f"{newer.parent}{os.pathsep}{tmp_path / 'old'}")
+
+    assert find_python_interpreter("3.99") == str(newer)
+
+
+@pytest.mark.skipif(WINDOWS, reason="runs a shell script as the interpreter")
+def test_interpreter_version_is_probed_once(tmp_path: Path, mocker: MockerFixture) -> None:
+    python = str(_fake_python(tmp_path, "python3.99"))
+    run_subprocess = mocker.spy(pipx.interpreter, "run_subprocess")
+
+    versions = [pipx.interpreter.interpreter_version(python) for _ in range(2)]
+
+    assert (versions, run_subprocess.call_count) == (["3.99.1", "3.99.1"], 1)
+
+
 @pytest.mark.parametrize(
     "fetch_python",
     [
@@ -29,6 +29,7 @@ from pipx.commands.list_packages import list_packages
 from pipx.pipx_metadata_file import (
     PIPX_INFO_FILENAME,
     PackageInfo,
+    PipxMetadata,
     _json_decoder_object_hook,  # ruff:ignore[import-private-name]  # the decode hook has no public re-export
 )
 from pipx.util import PipxError
@@ -229,6 +230,33 @@ def test_list_short(capsys: pytest.CaptureFixture[str]) -> None:
     assert "pylint 3.0.4" in captured.out
 
 
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_list_short_answers_from_venv_index(capsys: pytest.CaptureFixture[str], mocker: MockerFixture) -> None:
+    assert not run_pipx_cli(["install", PKG["pycowsay"]["spec"]])
+    assert not run_pipx_cli(["list", "--short"])
+    capsys.readouterr()
+    read = mocker.spy(PipxMetadata, "read")
+
+    assert not run_pipx_cli(["list", "--short"])
+
+    assert (capsys.readouterr().out, read.call_count) == ("pycowsay 0.0.0.2\n", 0)
+
+
+@pytest.mark.parametrize("option", [pytest.param("--short", id="short"), pytest.param("--json", id="json")])
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_list_answers_from_metadata_written_by_install(
+    capsys: pytest.CaptureFixture[str], mocker: MockerFixture, option: str
+) -> None:
+    assert not run_pipx_cli(["install", PKG["pycowsay"]["spec"]])
+    capsys.readouterr()
+    read = mocker.spy(PipxMetadata, "read")
+    venv_init = mocker.spy(venv.Venv, "__init__")
+
+    assert not run_pipx_cli(["list", option])
+
+    assert ("pycowsay" in capsys.readouterr().out, read.call_count, venv_init.call_count) == (True, 0, 0)
+
+
 @pytest.mark.parametrize("option", [pytest.param("--short", id="short"), pytest.param("--pinned", id="pinned")])
 @pytest.mark.usefixtures("pipx_temp_env")
 def test_list_json_rejects_human_filter(
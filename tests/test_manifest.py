@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import json
 import subprocess
 from pathlib import Path
-from typing import TYPE_CHECKING, Final, Literal
+from threading import Barrier
+from typing import TYPE_CHECKING, Any, Final, Literal
 
 import pytest
 
@@ -10,9 +12,12 @@ from helpers import app_name, run_pipx_cli
 from pipx import paths
 from pipx.commands import manifest as manifest_module
 from pipx.pipx_metadata_file import PackageInfo, PipxMetadata
+from pipx.result import OperationError
+from pipx.shared_libs import shared_libs_auto_upgrade_disabled
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from unittest.mock import MagicMock
 
     from pytest_mock import MockerFixture
 
@@ -96,6 +101,129 @@ def test_sync_manifest_prunes_undeclared_tool(
     assert not (paths.ctx.venvs / "black").exists()
 
 
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_sync_manifest_jobs_serializes_only_tools_sharing_an_app(
+    write_manifest: Callable[[str], Path],
+    capsys: pytest.CaptureFixture[str],
+    mocker: MockerFixture,
+) -> None:
+    manifest: Final[Path] = write_manifest(
+        """[project]
+name = "pipx-tools"
+version = "1"
+dependencies = []
+
+[dependency-groups]
+alpha = ["alpha"]
+beta = ["beta"]
+gamma = ["gamma"]
+
+[tool.pipx]
+version = "1.0"
+
+[tool.pipx.tools.alpha]
+apps = ["shared"]
+
+[tool.pipx.tools.beta]
+apps = ["shared"]
+
+[tool.pipx.tools.gamma]
+apps = ["other"]
+"""
+    )
+    barrier: Final[Barrier] = Barrier(2)
+    started: Final[list[str]] = []
+
+    def install(venv_dir: Path, *args: object, **kwargs: object) -> MagicMock:
+        del args, kwargs
+        started.append(venv_dir.name)
+        if venv_dir.name != "beta":
+            barrier.wait(timeout=5)
+        return mocker.MagicMock(
+            errors=(OperationError(code="install_failed", message="gamma failed"),) if venv_dir.name == "gamma" else ()
+        )
+
+    mocker.patch.object(manifest_module, "install", autospec=True, side_effect=install)
+
+    assert run_pipx_cli(["manifest", "sync", "--jobs", "3", "--output", "json", str(manifest)])
+
+    result: Final[dict[str, Any]] = json.loads(capsys.readouterr().out)
+    assert (
+        started.index("alpha") < started.index("beta"),
+        result["data"]["environments"],
+        [error["environment"] for error in result["errors"]],
+    ) == (True, ["alpha", "beta"], ["gamma"])
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_sync_manifest_jobs_skips_maintenance_in_every_worker(
+    write_manifest: Callable[[str], Path],
+    mocker: MockerFixture,
+) -> None:
+    manifest: Final[Path] = write_manifest(
+        """[project]
+name = "pipx-tools"
+version = "1"
+dependencies = []
+
+[dependency-groups]
+alpha = ["alpha"]
+beta = ["beta"]
+
+[tool.pipx]
+version = "1.0"
+
+[tool.pipx.tools.alpha]
+apps = ["alpha"]
+
+[tool.pipx.tools.beta]
+apps = ["beta"]
+"""
+    )
+    seen: Final[list[bool]] = []
+
+    def install(*args: object, **kwargs: object) -> MagicMock:
+        del args, kwargs
+        seen.append(shared_libs_auto_upgrade_disabled())
+        return mocker.MagicMock(errors=())
+
+    mocker.patch.object(manifest_module, "install", autospec=True, side_effect=install)
+
+    assert not run_pipx_cli(["manifest", "sync", "--jobs", "2", "--skip-maintenance", str(manifest)])
+
+    assert seen == [True, True]
+
+
+def test_plan_sync_chains_tools_whose_apps_are_unknown_until_installed() -> None:
+    def tool(environment: str, apps: tuple[str, ...] = (), **options: Any) -> Any:  # ruff:ignore[any-type]  # the private tool record is built field by field
+        fields: Final[dict[str, Any]] = {
+            "package": environment,
+            "package_name": environment,
+            "suffix": "",
+            "include_dependencies": False,
+            "include_resources_from": (),
+            "expose": True,
+            "lock_file": None,
+        }
+        return manifest_module._ManifestTool(environment=environment, apps=apps, **{**fields, **options})  # ruff:ignore[private-member-access]  # the planner has no public wrapper
+
+    tools: Final[tuple[Any, ...]] = (
+        tool("alpha"),
+        tool("beta", ("beta",)),
+        tool("gamma", ("gamma",), include_dependencies=True),
+        tool("delta"),
+        tool("epsilon", ("beta",), suffix="-2"),
+    )
+
+    plan: Final[tuple[tuple[Any, ...], ...]] = manifest_module._plan_sync(tools)  # ruff:ignore[private-member-access]  # the planner has no public wrapper
+
+    assert [[item.environment for item in chain] for chain in plan] == [
+        ["alpha", "gamma", "delta"],
+        ["beta"],
+        ["epsilon"],
+    ]
+
+
 @pytest.mark.usefixtures("pipx_temp_env")
 def test_sync_manifest_hides_resources(
     write_manifest: Callable[[str], Path],
@@ -133,6 +261,65 @@ def test_sync_manifest_restores_environment_after_missing_app(
     ) == (True, True, ["pycowsay"], True, True)
 
 
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_sync_manifest_skips_unchanged_locked_tool(
+    write_manifest: Callable[[str], Path],
+    make_pylock: Callable[[str, str], Path],
+    capsys: pytest.CaptureFixture[str],
+    mocker: MockerFixture,
+) -> None:
+    lock_file: Final[Path] = make_pylock("pycowsay", "0.0.0.2")
+    manifest: Final[Path] = write_manifest(
+        _manifest("pycowsay>=0", "pycowsay", f'apps = ["pycowsay"]\nlock = "{lock_file.name}"\n')
+    )
+    assert not run_pipx_cli(["manifest", "sync", str(manifest)])
+    capsys.readouterr()
+    install: Final[MagicMock] = mocker.patch.object(manifest_module, "install")
+
+    assert not run_pipx_cli(["manifest", "sync", "--output", "json", str(manifest)])
+
+    data: Final[dict[str, Any]] = json.loads(capsys.readouterr().out)["data"]
+    assert (install.call_count, data["environments"], data["unchanged"]) == (0, [], ["pycowsay"])
+
+
+def _unexpose(venv_dir: Path) -> None:
+    assert not run_pipx_cli(["unexpose", venv_dir.name])
+
+
+def _rebase_interpreter(venv_dir: Path) -> None:
+    with (venv_dir / "pyvenv.cfg").open("a", encoding="utf-8") as pyvenv_cfg:
+        pyvenv_cfg.write("version = 3.99.0\n")
+
+
+@pytest.mark.parametrize(
+    "change",
+    [pytest.param(_unexpose, id="unexpose"), pytest.param(_rebase_interpreter, id="interpreter")],
+)
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_sync_manifest_resyncs_locked_tool_changed_outside_the_manifest(
+    write_manifest: Callable[[str], Path],
+    make_pylock: Callable[[str, str], Path],
+    capsys: pytest.CaptureFixture[str],
+    mocker: MockerFixture,
+    change: Callable[[Path], None],
+) -> None:
+    lock_file: Final[Path] = make_pylock("pycowsay", "0.0.0.2")
+    manifest: Final[Path] = write_manifest(
+        _manifest("pycowsay>=0", "pycowsay", f'apps = ["pycowsay"]\nlock = "{lock_file.name}"\n')
+    )
+    assert not run_pipx_cli(["manifest", "sync", str(manifest)])
+    change(paths.ctx.venvs / "pycowsay")
+    capsys.readouterr()
+    install: Final[MagicMock] = mocker.patch.object(
+        manifest_module, "install", return_value=mocker.MagicMock(errors=())
+    )
+
+    assert not run_pipx_cli(["manifest", "sync", "--output", "json", str(manifest)])
+
+    data: Final[dict[str, Any]] = json.loads(capsys.readouterr().out)["data"]
+    assert (install.call_count, data["unchanged"]) == (1, [])
+
+
 @pytest.mark.usefixtures("pipx_temp_env")
 def test_sync_manifest_reapplies_lock(
     write_manifest: Callable[[str], Path],
@@ -142,6 +329,9 @@ def test_sync_manifest_reapplies_lock(
     manifest = write_manifest(_manifest("pycowsay>=0", "pycowsay", f'apps = ["pycowsay"]\nlock = "{lock_file.name}"\n'))
     assert not run_pipx_cli(["manifest", "sync", str(manifest)])
     (marker := paths.ctx.venvs / "pycowsay" / "marker").touch()
+    # any edit to the lock file invalidates the recorded digest
+    with lock_file.open("a", encoding="utf-8") as lock:
+        lock.write("# relocked\n")
 
     assert not run_pipx_cli(["manifest", "sync", str(manifest)])
 
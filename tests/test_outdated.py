@@ -11,9 +11,11 @@ import pytest
 
 from helpers import mock_legacy_venv, run_pipx_cli
 from pipx import paths
+from pipx.commands.outdated import OUTDATED_CACHE_FILENAME, OUTDATED_CACHE_MAX_AGE_SEC
 from pipx.pipx_metadata_file import PIPX_INFO_FILENAME, PipxMetadata
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from contextlib import AbstractContextManager
     from pathlib import Path
     from unittest.mock import MagicMock
@@ -24,14 +26,16 @@ if TYPE_CHECKING:
     from pipx.venv import VenvContainer
 
 _JsonValue: TypeAlias = bool | int | float | str | list["_JsonValue"] | dict[str, "_JsonValue"] | None
-_OUTDATED_JSON: Final[str] = (
-    '[{"name":"pycowsay","version":"0.0.0.2","latest_version":"1.0","latest_filetype":"wheel"},'
-    '{"name":"packaging","version":"20","latest_version":"26","latest_filetype":"wheel"}]'
-)
 _OUTDATED_PROCESS: Final[subprocess.CompletedProcess[str]] = subprocess.CompletedProcess(
     args=[],
     returncode=0,
-    stdout=_OUTDATED_JSON,
+    stdout='{"name":"pycowsay","versions":["1.0","0.0.0.2"],"latest":"1.0"}',
+    stderr="",
+)
+_CURRENT_PROCESS: Final[subprocess.CompletedProcess[str]] = subprocess.CompletedProcess(
+    args=[],
+    returncode=0,
+    stdout='{"name":"pycowsay","versions":["0.0.0.2"],"latest":"0.0.0.2"}',
     stderr="",
 )
 
@@ -59,11 +63,7 @@ def test_list_outdated_selected_package(
     assert not run_pipx_cli(["install", "pycowsay"])
     assert not run_pipx_cli(["install", "pylint"])
     capsys.readouterr()
-    list_outdated = mocker.patch(
-        "pipx.backends.pip.run_subprocess",
-        autospec=True,
-        return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout="[]", stderr=""),
-    )
+    list_outdated = mocker.patch("pipx.backends.pip.run_subprocess", autospec=True, return_value=_CURRENT_PROCESS)
 
     assert not run_pipx_cli(["list", "pycowsay", "--outdated"])
 
@@ -97,11 +97,7 @@ def test_list_outdated_skips_removed_environment(
     ("outdated_environment", "expected"),
     [
         pytest.param(_OUTDATED_PROCESS, "pycowsay: 0.0.0.2 -> 1.0\n", id="outdated"),
-        pytest.param(
-            subprocess.CompletedProcess(args=[], returncode=0, stdout="[]", stderr=""),
-            "pipx found no available upgrades.\n",
-            id="current",
-        ),
+        pytest.param(_CURRENT_PROCESS, "pipx found no available upgrades.\n", id="current"),
     ],
     indirect=["outdated_environment"],
 )
@@ -177,18 +173,13 @@ def test_list_outdated_filters_injected(
     assert not run_pipx_cli(["install", "pycowsay"])
     assert not run_pipx_cli(["inject", "pycowsay", "black"])
     capsys.readouterr()
+    metadata = PipxMetadata(paths.ctx.venvs / "pycowsay")
+    metadata.injected_packages["black"] = replace(metadata.injected_packages["black"], package_version="23")
+    metadata.write()
     mocker.patch(
         "pipx.backends.pip.run_subprocess",
         autospec=True,
-        return_value=subprocess.CompletedProcess(
-            args=[],
-            returncode=0,
-            stdout=(
-                '[{"name":"pycowsay","version":"0.0.0.2","latest_version":"1.0"},'
-                '{"name":"black","version":"23","latest_version":"24"}]'
-            ),
-            stderr="",
-        ),
+        side_effect=_index_versions({"pycowsay": "1.0", "black": "24"}),
     )
 
     assert not run_pipx_cli(["list", "--outdated", *options])
@@ -201,22 +192,22 @@ def test_list_outdated_filters_injected(
     ("outdated_environment", "expected_error"),
     [
         pytest.param(
-            subprocess.CompletedProcess(args=["pip", "list"], returncode=1, stdout="", stderr="index unavailable"),
+            subprocess.CompletedProcess(args=["pip", "index"], returncode=1, stdout="", stderr="index unavailable"),
             "Package backend exited with code 1.\nstderr: index unavailable",
             id="exit-code",
         ),
         pytest.param(
-            subprocess.CompletedProcess(args=["pip", "list"], returncode=0, stdout="not json", stderr=""),
+            subprocess.CompletedProcess(args=["pip", "index"], returncode=0, stdout="not json", stderr=""),
             "Package backend returned invalid JSON for an outdated query.",
             id="invalid-json",
         ),
         pytest.param(
-            subprocess.CompletedProcess(args=["pip", "list"], returncode=0, stdout='[{"name":"demo"}]', stderr=""),
+            subprocess.CompletedProcess(args=["pip", "index"], returncode=0, stdout='{"name":"demo"}', stderr=""),
             "Package backend returned invalid JSON for an outdated query.",
             id="missing-key",
         ),
         pytest.param(
-            subprocess.CompletedProcess(args=["pip", "list"], returncode=0, stdout="null", stderr=""),
+            subprocess.CompletedProcess(args=["pip", "index"], returncode=0, stdout="null", stderr=""),
             "Package backend returned invalid JSON for an outdated query.",
             id="null",
         ),
@@ -246,7 +237,7 @@ def test_list_outdated_json_reports_backend_failure(
     "outdated_environment",
     [
         pytest.param(
-            subprocess.CompletedProcess(args=["pip", "list"], returncode=1, stdout="", stderr="index unavailable"),
+            subprocess.CompletedProcess(args=["pip", "index"], returncode=1, stdout="", stderr="index unavailable"),
             id="exit-code",
         )
     ],
@@ -384,6 +375,85 @@ def test_list_outdated_rejects_other_filters(
     assert capsys.readouterr().err == "--outdated cannot be combined with --short or --pinned.\n"
 
 
+@pytest.mark.parametrize(
+    ("refresh", "expected_calls"),
+    [pytest.param([], 1, id="cached"), pytest.param(["--refresh"], 2, id="refresh")],
+)
+def test_list_outdated_reuses_recent_index_answer(
+    outdated_environment: MagicMock,
+    capsys: pytest.CaptureFixture[str],
+    refresh: list[str],
+    expected_calls: int,
+) -> None:
+    assert not run_pipx_cli(["list", "--outdated"])
+    capsys.readouterr()
+
+    assert not run_pipx_cli(["list", "--outdated", *refresh])
+
+    captured = capsys.readouterr()
+    assert (captured.out, outdated_environment.call_count) == ("pycowsay: 0.0.0.2 -> 1.0\n", expected_calls)
+
+
+def test_list_outdated_asks_again_after_cache_expires(
+    outdated_environment: MagicMock,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    assert not run_pipx_cli(["list", "--outdated"])
+    cache_file = paths.ctx.lookup_cache / OUTDATED_CACHE_FILENAME
+    cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    for entry in cache["entries"].values():
+        entry["fetched"] -= OUTDATED_CACHE_MAX_AGE_SEC + 1
+    cache_file.write_text(json.dumps(cache), encoding="utf-8")
+    capsys.readouterr()
+
+    assert not run_pipx_cli(["list", "--outdated"])
+
+    assert (capsys.readouterr().out, outdated_environment.call_count) == ("pycowsay: 0.0.0.2 -> 1.0\n", 2)
+
+
+def test_list_outdated_does_not_cache_failure(outdated_environment: MagicMock) -> None:
+    outdated_environment.return_value = subprocess.CompletedProcess(
+        args=["pip", "index"], returncode=1, stdout="", stderr="index unavailable"
+    )
+    assert run_pipx_cli(["list", "--outdated"])
+    outdated_environment.return_value = _OUTDATED_PROCESS
+
+    assert (run_pipx_cli(["list", "--outdated"]), outdated_environment.call_count) == (0, 2)
+
+
+def test_list_outdated_caches_per_cooldown(outdated_environment: MagicMock) -> None:
+    assert not run_pipx_cli(["list", "--outdated"])
+    metadata = PipxMetadata(paths.ctx.venvs / "pycowsay")
+    metadata.main_package = replace(metadata.main_package, cooldown_days=7)
+    metadata.write()
+
+    assert not run_pipx_cli(["list", "--outdated"])
+
+    assert (outdated_environment.call_count, outdated_environment.call_args.args[0][-3:]) == (
+        2,
+        ["--uploaded-prior-to", "P7D", "pycowsay"],
+    )
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_list_refresh_requires_outdated(capsys: pytest.CaptureFixture[str]) -> None:
+    assert run_pipx_cli(["list", "--refresh"])
+    assert capsys.readouterr().err == "--refresh requires --outdated.\n"
+
+
+def _index_versions(latest: dict[str, str]) -> Callable[[list[str]], subprocess.CompletedProcess[str]]:
+    def index_versions(cmd: list[str], **_: object) -> subprocess.CompletedProcess[str]:
+        project = cmd[-1]
+        if project not in latest:
+            return subprocess.CompletedProcess(
+                args=cmd, returncode=1, stdout="", stderr=f"ERROR: No matching distribution found for {project}"
+            )
+        entry = {"name": project, "versions": [latest[project]], "latest": latest[project]}
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=json.dumps(entry), stderr="")
+
+    return index_versions
+
+
 def _outdated_result(
     *,
     packages_checked: int = 0,
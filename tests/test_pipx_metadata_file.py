@@ -4,14 +4,22 @@ import json
 import sys
 from dataclasses import replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final
 
 import pytest
 
 from helpers import assert_package_metadata, create_package_info_ref, run_pipx_cli
 from package_info import PKG
 from pipx import paths, pipx_metadata_file
-from pipx.pipx_metadata_file import PIPX_INFO_FILENAME, JsonEncoderHandlesPath, PackageInfo, PipxMetadata
+from pipx.pipx_metadata_file import (
+    PIPX_INFO_FILENAME,
+    VENV_INDEX_FILENAME,
+    JsonEncoderHandlesPath,
+    PackageInfo,
+    PipxMetadata,
+    PipxMetadataIndex,
+    save_written_metadata,
+)
 from pipx.util import PipxError
 
 if TYPE_CHECKING:
@@ -68,6 +76,7 @@ def test_pipx_metadata_file_create(tmp_path: Path) -> None:
     pipx_metadata.venv_args = ["--system-site-packages"]
     pipx_metadata.injected_packages = {"injected": TEST_PACKAGE2}
     pipx_metadata.exposure_enabled = False
+    pipx_metadata.manifest_digest = "0" * 64
     pipx_metadata.write()
 
     pipx_metadata2 = PipxMetadata(venv_dir)
@@ -80,6 +89,7 @@ def test_pipx_metadata_file_create(tmp_path: Path) -> None:
         "venv_args",
         "injected_packages",
         "exposure_enabled",
+        "manifest_digest",
     ]:
         assert getattr(pipx_metadata, attribute) == getattr(pipx_metadata2, attribute)
 
@@ -183,6 +193,48 @@ def test_pipx_metadata_file_defaults_cooldown_from_version_0_10(tmp_path: Path)
     assert PipxMetadata(venv_dir).main_package.cooldown_days is None
 
 
+def test_pipx_metadata_index_serves_saved_entries_and_rereads_changed_metadata(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    venv_dir: Final[Path] = tmp_path / "venvs" / "test-package"
+    venv_dir.mkdir(parents=True)
+    metadata: Final[PipxMetadata] = PipxMetadata(venv_dir, read=False)
+    metadata.main_package = TEST_PACKAGE1
+    metadata.write()
+    assert not (venv_dir.parent / VENV_INDEX_FILENAME).exists()
+    building_index: Final[PipxMetadataIndex] = PipxMetadataIndex(venv_dir.parent)
+    building_index.metadata(venv_dir)
+    building_index.save()
+    read = mocker.spy(PipxMetadata, "read")
+    indexed_version = PipxMetadataIndex(venv_dir.parent).metadata(venv_dir).main_package.package_version
+    payload: Final[dict[str, Any]] = metadata.to_dict()
+    payload["main_package"]["package_version"] = "9.9.9"
+    (venv_dir / PIPX_INFO_FILENAME).write_text(json.dumps(payload, cls=JsonEncoderHandlesPath), encoding="utf-8")
+
+    reread_version = PipxMetadataIndex(venv_dir.parent).metadata(venv_dir).main_package.package_version
+
+    assert (indexed_version, reread_version, read.call_count) == ("0.1.2", "9.9.9", 1)
+
+
+def test_save_written_metadata_indexes_the_writes_of_one_container(tmp_path: Path, mocker: MockerFixture) -> None:
+    venv_dir: Final[Path] = tmp_path / "venvs" / "test-package"
+    cached_dir: Final[Path] = tmp_path / "cache" / "test-package"
+    for directory in (venv_dir, cached_dir):
+        directory.mkdir(parents=True)
+        metadata = PipxMetadata(directory, read=False)
+        metadata.main_package = TEST_PACKAGE1
+        metadata.write()
+
+    save_written_metadata(venv_dir.parent)
+
+    read = mocker.spy(PipxMetadata, "read")
+    assert (
+        PipxMetadataIndex(venv_dir.parent).metadata(venv_dir).main_package.package_version,
+        read.call_count,
+        (cached_dir.parent / VENV_INDEX_FILENAME).exists(),
+    ) == ("0.1.2", 0, False)
+
+
 @pytest.mark.parametrize(
     "test_package",
     [
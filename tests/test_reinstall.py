@@ -17,11 +17,13 @@ from helpers import (
     skip_if_windows,
 )
 from pipx import paths, util, venv_inspect
+from pipx.backends.pip import PipBackend
 from pipx.pipx_metadata_file import PackageInfo, PipxMetadata
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from pathlib import Path
+    from unittest.mock import MagicMock
 
     from _pytest.capture import CaptureResult
     from pytest_mock import MockerFixture
@@ -75,6 +77,50 @@ def test_reinstall_preserves_cooldowns(
     ) == (True, True, 7, 5)
 
 
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_reinstall_installs_injected_packages_with_the_main_package(
+    empty_project: Path,
+    mocker: MockerFixture,
+) -> None:
+    assert not run_pipx_cli(["install", "pycowsay"])
+    assert not run_pipx_cli(["inject", "pycowsay", "black", str(empty_project)])
+    backend_install: Final[MagicMock] = mocker.spy(PipBackend, "install")
+
+    assert not run_pipx_cli(["reinstall", "--python", sys.executable, "pycowsay"])
+
+    metadata: Final[PipxMetadata] = PipxMetadata(paths.ctx.venvs / "pycowsay")
+    assert (
+        [sorted(call.kwargs["requirements"]) for call in backend_install.call_args_list],
+        sorted(metadata.injected_packages),
+    ) == ([sorted(["pycowsay", "black", str(empty_project)])], ["black", "empty-project"])
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_reinstall_injects_a_conflicting_package_on_its_own(
+    make_project_with_dependency: Callable[[str], Path],
+    capsys: pytest.CaptureFixture[str],
+    mocker: MockerFixture,
+) -> None:
+    conflicting: Final[Path] = make_project_with_dependency("black==22.8.0")
+    assert not run_pipx_cli(["install", "black==22.10.0"])
+    assert not run_pipx_cli(["inject", "black", str(conflicting)])
+    capsys.readouterr()
+    backend_install: Final[MagicMock] = mocker.spy(PipBackend, "install")
+
+    assert not run_pipx_cli(["reinstall", "--python", sys.executable, "black"])
+
+    metadata: Final[PipxMetadata] = PipxMetadata(paths.ctx.venvs / "black")
+    assert (
+        [sorted(call.kwargs["requirements"]) for call in backend_install.call_args_list],
+        sorted(metadata.injected_packages),
+        "injecting each one on its own" in capsys.readouterr().err,
+    ) == (
+        [sorted(["black==22.10.0", str(conflicting)]), ["black==22.10.0"], [str(conflicting)]],
+        ["empty-project"],
+        True,
+    )
+
+
 @pytest.mark.usefixtures("pipx_temp_env")
 def test_reinstall_pylock_restores_source_after_build_failure(
     make_pylock: Callable[[str, str], Path],
@@ -134,7 +180,9 @@ def test_reinstall_legacy_venv_inspects_once_for_resources(mocker: MockerFixture
     assert run_pipx_cli(["reinstall", "--python", sys.executable, "pycowsay"]) == 0
 
     assert executable_path.exists()
-    assert run_subprocess.call_count == 2
+    # the legacy venv's inspection, the backend's site-packages lookup, then one probe the new venv's Requires-Python
+    # check and resource inspection share
+    assert run_subprocess.call_count == 3
 
 
 @pytest.mark.usefixtures("pipx_temp_env")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import importlib
 import sys
-from typing import TYPE_CHECKING, NoReturn
+from typing import TYPE_CHECKING, Final, NoReturn
 
 import pytest
 
@@ -12,6 +12,8 @@ from pipx import paths, shared_libs
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest_mock import MockerFixture
+
 
 @pytest.mark.usefixtures("pipx_temp_env")
 def test_reinstall_all() -> None:
@@ -94,3 +96,40 @@ def test_reinstall_all_restores_package_after_keyboard_interrupt(
     assert (venv_dir / "pipx_metadata.json").read_text() == metadata_before
     assert not (venv_dir / "partial-install").exists()
     assert not any(path.name.endswith("-pipx-reinstall") for path in paths.ctx.venvs.iterdir())
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_reinstall_all_jobs_refreshes_shared_libs_once(
+    capsys: pytest.CaptureFixture[str],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    for suffix in ("_one", "_two"):
+        assert not run_pipx_cli(["install", "pycowsay", f"--suffix={suffix}"])
+    shared_libs.shared_libs.has_been_updated_this_run = False
+    capsys.readouterr()
+    caplog.clear()
+
+    assert not run_pipx_cli(["reinstall-all", "--python", sys.executable, "--jobs", "2"])
+
+    captured = capsys.readouterr()
+    assert caplog.text.count("Upgrading shared libraries in") == 1
+    assert captured.out.index("uninstalled pycowsay_one!") < captured.out.index("uninstalled pycowsay_two!")
+    assert {"reinstalled pycowsay-one", "reinstalled pycowsay-two"} <= set(captured.err.splitlines())
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_reinstall_all_jobs_skips_maintenance_in_every_worker(mocker: MockerFixture) -> None:
+    for suffix in ("_one", "_two"):
+        assert not run_pipx_cli(["install", "pycowsay", f"--suffix={suffix}"])
+    seen: Final[list[bool]] = []
+
+    def auto_upgrade_disabled() -> bool:
+        seen.append(shared_libs.shared_libs_auto_upgrade_disabled())
+        return seen[-1]
+
+    mocker.patch("pipx.venv.shared_libs_auto_upgrade_disabled", side_effect=auto_upgrade_disabled)
+
+    assert not run_pipx_cli(["reinstall-all", "--python", sys.executable, "--jobs", "2", "--skip-maintenance"])
+
+    assert seen
+    assert all(seen)
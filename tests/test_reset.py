@@ -49,6 +49,8 @@ def test_reset_unlinks_the_apps() -> None:
     [
         pytest.param("venvs", id="venvs"),
         pytest.param("venv_cache", id="cache"),
+        pytest.param("lookup_cache", id="lookups"),
+        pytest.param("venv_templates", id="templates"),
         pytest.param("standalone_python_cachedir", id="interpreters"),
     ],
 )
@@ -101,6 +103,8 @@ def test_reset_json_reports_what_it_removed(
                 str(paths.ctx.venvs),
                 str(paths.ctx.shared_libs),
                 str(paths.ctx.venv_cache),
+                str(paths.ctx.lookup_cache),
+                str(paths.ctx.venv_templates),
                 str(paths.ctx.standalone_python_cachedir),
                 str(paths.ctx.logs),
             ],
@@ -8,7 +8,7 @@ import shutil
 import subprocess
 import sys
 import textwrap
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, ClassVar, Final
 from unittest import mock
 
 import pytest
@@ -24,6 +24,7 @@ import pipx.main
 from helpers import PACKAGE_CACHE_DIR_NAME, run_pipx_cli
 from package_info import PKG
 from pipx import paths, shared_libs
+from pipx.commands.run_cache import LAST_USED_FILENAME
 from pipx.pipx_metadata_file import PipxMetadata
 from pipx.util import PipxError
 
@@ -108,6 +109,54 @@ def test_cache(caplog: pytest.LogCaptureFixture) -> None:
     assert "Removing cached venv" in caplog.text
 
 
+@pytest.mark.usefixtures("pipx_temp_env")
+@mock.patch("os.execvpe", new=execvpe_mock)
+def test_run_warm_cache_execs_from_launch_record(mocker: MockerFixture) -> None:
+    run_pipx_cli_exit(["run", "pycowsay", "cowsay", "args"], assert_exit=0)
+    venv: Final = mocker.patch.object(importlib.import_module("pipx.commands.run"), "Venv", side_effect=AssertionError)
+
+    run_pipx_cli_exit(["run", "pycowsay", "cowsay", "args"], assert_exit=0)
+
+    assert venv.call_count == 0
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+@mock.patch("os.execvpe", new=execvpe_mock)
+def test_run_ignores_launch_record_of_idle_venv(mocker: MockerFixture) -> None:
+    run_pipx_cli_exit(["run", "pycowsay", "cowsay", "args"], assert_exit=0)
+    run_module: Final = importlib.import_module("pipx.commands.run")
+    venv_dir: Final[Path] = next(paths.ctx.venv_cache.glob(f"*/{run_module.LAUNCH_RECORD_FILENAME}")).parent
+    os.utime(venv_dir / LAST_USED_FILENAME, (0, 0))
+    venv: Final = mocker.spy(run_module, "Venv")
+
+    run_pipx_cli_exit(["run", "pycowsay", "cowsay", "args"], assert_exit=0)
+
+    assert venv.called
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+@mock.patch("os.execvpe", new=execvpe_mock)
+def test_run_keeps_venv_used_within_expiry(monkeypatch: pytest.MonkeyPatch) -> None:
+    run_pipx_cli_exit(["run", "pycowsay", "cowsay", "args"], assert_exit=0)
+    venv_dir: Final[Path] = next(path for path in paths.ctx.venv_cache.iterdir() if path.is_dir())
+    marker: Final[Path] = venv_dir / "marker"
+    marker.touch()
+
+    class ShiftedDateTime(datetime.datetime):
+        shift: ClassVar[datetime.timedelta] = datetime.timedelta(days=10)
+
+        @classmethod
+        def now(cls, tz: datetime.tzinfo | None = None) -> ShiftedDateTime:
+            return cls.fromtimestamp((super().now(tz) + cls.shift).timestamp(), tz)
+
+    monkeypatch.setattr(datetime, "datetime", ShiftedDateTime)
+    run_pipx_cli_exit(["run", "pycowsay", "cowsay", "args"], assert_exit=0)
+    ShiftedDateTime.shift = datetime.timedelta(days=20)
+    run_pipx_cli_exit(["run", "pycowsay", "cowsay", "args"], assert_exit=0)
+
+    assert marker.exists()
+
+
 @pytest.mark.usefixtures("pipx_temp_env")
 @mock.patch("os.execvpe", new=execvpe_mock)
 def test_run_refresh_rebuilds_cached_environment() -> None:
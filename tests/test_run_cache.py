@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Final
+
+import pytest
+
+from pipx.commands.run_cache import (
+    LAST_USED_FILENAME,
+    RUN_CACHE_INDEX_FILENAME,
+    RUN_CACHE_MAX_ENTRIES,
+    RUN_CACHE_MAX_SIZE,
+    evict_run_cache,
+)
+from pipx.venv import VenvContainer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _cached_venv(root: Path, name: str, *, idle_days: float, size: int = 10) -> Path:
+    venv_dir: Final[Path] = root / name
+    venv_dir.mkdir(parents=True)
+    (venv_dir / "payload").write_bytes(b"x" * size)
+    used: Final[float] = time.time() - idle_days * 24 * 60 * 60
+    stamp: Final[Path] = venv_dir / LAST_USED_FILENAME
+    stamp.touch()
+    os.utime(stamp, (used, used))
+    return venv_dir
+
+
+def _cached_names(root: Path) -> set[str]:
+    return {path.name for path in root.iterdir() if path.is_dir()}
+
+
+@pytest.mark.parametrize(
+    ("variable", "quota", "expected"),
+    [
+        pytest.param(RUN_CACHE_MAX_ENTRIES, "3", {"newest", "middle", "keep"}, id="entries"),
+        pytest.param(RUN_CACHE_MAX_SIZE, "250", {"newest", "middle", "keep"}, id="size"),
+        pytest.param(RUN_CACHE_MAX_ENTRIES, "0", {"keep"}, id="never-keep"),
+        pytest.param(RUN_CACHE_MAX_ENTRIES, "many", {"newest", "middle", "oldest", "keep"}, id="invalid"),
+    ],
+)
+def test_evict_removes_least_recently_used_over_quota(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    variable: str,
+    quota: str,
+    expected: set[str],
+) -> None:
+    for name, idle_days in (("newest", 1), ("middle", 2), ("oldest", 3)):
+        _cached_venv(tmp_path, name, idle_days=idle_days, size=100)
+    keep: Final[Path] = _cached_venv(tmp_path, "keep", idle_days=5, size=10)
+    monkeypatch.setenv(variable, quota)
+
+    evict_run_cache(VenvContainer(tmp_path), keep=keep)
+
+    assert _cached_names(tmp_path) == expected
+
+
+def test_evict_counts_the_venv_about_to_be_built(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _cached_venv(tmp_path, "newest", idle_days=1)
+    _cached_venv(tmp_path, "oldest", idle_days=2)
+    monkeypatch.setenv(RUN_CACHE_MAX_ENTRIES, "2")
+
+    evict_run_cache(VenvContainer(tmp_path), keep=tmp_path / "unbuilt")
+
+    assert _cached_names(tmp_path) == {"newest"}
+
+
+def test_evict_expires_by_last_use(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    _cached_venv(tmp_path, "used", idle_days=13)
+    idle: Final[Path] = _cached_venv(tmp_path, "idle", idle_days=15)
+    caplog.set_level(logging.INFO)
+
+    evict_run_cache(VenvContainer(tmp_path), keep=tmp_path / "unbuilt")
+
+    assert _cached_names(tmp_path) == {"used"}
+    assert f"Removing expired venv {idle}" in caplog.text
+
+
+def test_evict_sweeps_at_most_once_per_interval(tmp_path: Path) -> None:
+    venv_container: Final[VenvContainer] = VenvContainer(tmp_path)
+    evict_run_cache(venv_container, keep=tmp_path / "unbuilt")
+    _cached_venv(tmp_path, "idle", idle_days=15)
+
+    evict_run_cache(venv_container, keep=tmp_path / "unbuilt")
+    swept_again: Final[bool] = not (tmp_path / "idle").exists()
+    index_path: Final[Path] = tmp_path / RUN_CACHE_INDEX_FILENAME
+    index: Final = json.loads(index_path.read_text(encoding="utf-8"))
+    index["evicted_at"] -= 2 * 60 * 60
+    index_path.write_text(json.dumps(index), encoding="utf-8")
+    evict_run_cache(venv_container, keep=tmp_path / "unbuilt")
+
+    assert (swept_again, (tmp_path / "idle").exists()) == (False, False)
+
+
+def test_evict_remembers_venv_sizes(tmp_path: Path) -> None:
+    venv_dir: Final[Path] = _cached_venv(tmp_path, "cached", idle_days=1, size=100)
+
+    evict_run_cache(VenvContainer(tmp_path), keep=tmp_path / "unbuilt")
+
+    index: Final = json.loads((tmp_path / RUN_CACHE_INDEX_FILENAME).read_text(encoding="utf-8"))
+    assert index["entries"] == {"cached": {"ctime": venv_dir.stat().st_ctime, "size": 100}}
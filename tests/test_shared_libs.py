@@ -13,7 +13,7 @@ from unittest.mock import patch
 
 import pytest
 
-from pipx import shared_libs
+from pipx import shared_libs, venv_inspect
 from pipx.backends.pip import PipBackend
 from pipx.constants import PIPX_SHARED_PTH, WINDOWS
 from pipx.venv import Venv
@@ -144,16 +144,72 @@ def test_shared_libs_validity_check_is_cached(
     shared_libs.shared_libs.python_path.parent.mkdir(parents=True)
     shared_libs.shared_libs.python_path.touch()
     shared_libs.shared_libs.pip_path.touch()
+    probe_output = json.dumps({
+        "sys_path": [],
+        "python_version": "3.12.0",
+        "purelib": str(shared_libs.shared_libs.root),
+        "platlib": str(shared_libs.shared_libs.root),
+        "pip_importable": True,
+        "requires_python": {},
+        "environment": {},
+    })
     run_subprocess = mocker.patch(
-        "pipx.shared_libs.run_subprocess",
+        "pipx.venv_inspect.run_subprocess",
         autospec=True,
-        return_value=subprocess.CompletedProcess(args=[], returncode=returncode, stdout="", stderr=""),
+        return_value=subprocess.CompletedProcess(args=[], returncode=returncode, stdout=probe_output, stderr=""),
     )
 
     assert (shared_libs.shared_libs.is_valid, shared_libs.shared_libs.is_valid) == (expected, expected)
     run_subprocess.assert_called_once()
 
 
+@pytest.mark.parametrize(
+    ("pip_changed", "probes"),
+    [
+        pytest.param(False, 0, id="unchanged"),
+        pytest.param(True, 1, id="pip-changed"),
+    ],
+)
+@pytest.mark.usefixtures("pipx_ultra_temp_env")
+def test_shared_libs_validity_comes_from_the_stamp(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    pip_changed: bool,
+    probes: int,
+) -> None:
+    monkeypatch.setenv(shared_libs.DISABLE_SHARED_LIBS_AUTO_UPGRADE, "1")
+    shared_libs.shared_libs.create(pip_args=["--no-index"])
+    site_packages = shared_libs.shared_libs.site_packages
+    if pip_changed:
+        record = next(path for directory in site_packages for path in directory.glob("pip-*.dist-info/RECORD"))
+        record.write_text(record.read_text(encoding="utf-8") + "pip/extra.py,,\n", encoding="utf-8")
+    run_subprocess = mocker.patch("pipx.venv_inspect.run_subprocess", wraps=venv_inspect.run_subprocess)
+    next_run = shared_libs._SharedLibs()  # ruff:ignore[private-member-access]  # a fresh instance stands in for the next pipx process
+
+    assert (next_run.is_valid, next_run.site_packages, run_subprocess.call_count) == (True, site_packages, probes)
+
+
+@pytest.mark.usefixtures("pipx_ultra_temp_env")
+def test_shared_libs_upgrade_checks_pip_again_before_stamping(mocker: MockerFixture) -> None:
+    shared_libs.shared_libs.create(verbose=True, pip_args=[])
+    shared_libs.shared_libs.has_been_updated_this_run = False
+    assert shared_libs.shared_libs.stamp_path.is_file()
+    mocker.patch(
+        "pipx.shared_libs.run_subprocess",
+        return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
+    )
+    # the upgrade left a pip behind that no longer imports
+    probe_venv = mocker.patch(
+        "pipx.shared_libs.probe_venv",
+        wraps=lambda python_path, **_options: venv_inspect.probe_venv(python_path)._replace(pip_importable=False),
+    )
+
+    shared_libs.shared_libs.upgrade(pip_args=[], verbose=True, raises=True)
+
+    probe_venv.assert_called_once_with(shared_libs.shared_libs.python_path, check_pip=True)
+    assert not shared_libs.shared_libs.stamp_path.exists()
+
+
 @pytest.mark.usefixtures("pipx_ultra_temp_env")
 def test_shared_libs_upgrade_enforces_pip_floor(
     mocker: MockerFixture,
@@ -10,12 +10,16 @@ import shutil
 import subprocess
 import sys
 import tarfile
+import threading
 import urllib.error
 import warnings
+from contextlib import contextmanager, suppress
 from dataclasses import replace
+from functools import partial
 from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Final
 
 import pytest
 
@@ -24,7 +28,9 @@ from package_info import PKG
 from pipx import constants, paths, pipx_metadata_file, standalone_python
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    import socket
+    from collections.abc import Callable, Generator
+    from socketserver import BaseServer
     from unittest.mock import MagicMock
 
     from pytest_mock import MockerFixture
@@ -42,28 +48,104 @@ def mock_which(name: str) -> str | None:
     return original_which(name)
 
 
-@pytest.mark.usefixtures("pipx_temp_env")
-def test_legacy_standalone_python_index_is_refreshed(monkeypatch: pytest.MonkeyPatch) -> None:
-    legacy_link = (
-        "https://github.com/astral-sh/python-build-standalone/releases/download/"
-        "20250818/cpython-3.13.7%2B20250818-x86_64-unknown-linux-gnu-install_only.tar.gz"
-    )
-    digest = "sha256:" + "0" * 64
-    current_releases = [(legacy_link, digest)]
+_LINUX_LINK = (
+    "https://github.com/astral-sh/python-build-standalone/releases/download/"
+    "20250818/cpython-{}%2B20250818-x86_64-unknown-linux-gnu-install_only.tar.gz"
+)
+_DIGEST = "sha256:" + "0" * 64
+
+
+@pytest.fixture
+def linux_index_file(mocker: MockerFixture) -> Path:
+    for name, value in (("system", "Linux"), ("machine", "x86_64"), ("libc_ver", ("glibc", "2.39"))):
+        mocker.patch.object(standalone_python.platform, name, return_value=value)
     cache_dir = standalone_python.paths.ctx.standalone_python_cachedir
-    index_file = cache_dir / "index.json"
     cache_dir.mkdir(parents=True)
-    index_file.write_text(
+    return cache_dir / "index.json"
+
+
+def _release_response(mocker: MockerFixture, *links: str, etag: str = '"v1"') -> MagicMock:
+    assets = [{"browser_download_url": link, "digest": _DIGEST} for link in links]
+    return mocker.MagicMock(**{
+        "__enter__.return_value.read.return_value": json.dumps({"assets": assets}),
+        "__enter__.return_value.headers": {"ETag": etag},
+    })
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_legacy_standalone_python_index_is_refreshed(linux_index_file: Path, mocker: MockerFixture) -> None:
+    legacy_link = _LINUX_LINK.format("3.13.7")
+    linux_index_file.write_text(
         json.dumps({
             "fetched": datetime.datetime.now(tz=datetime.timezone.utc).timestamp(),
             "releases": [legacy_link],
-        })
+        }),
+        encoding="utf-8",
+    )
+    darwin_link = legacy_link.replace("x86_64-unknown-linux-gnu", "aarch64-apple-darwin")
+    mocker.patch.object(standalone_python, "urlopen", return_value=_release_response(mocker, darwin_link, legacy_link))
+
+    assert standalone_python.get_or_update_index()["releases"] == [(legacy_link, _DIGEST)]
+    assert json.loads(linux_index_file.read_text(encoding="utf-8"))["releases"] == [[legacy_link, _DIGEST]]
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_standalone_python_index_is_pruned_and_sorted_once(linux_index_file: Path, mocker: MockerFixture) -> None:
+    links = [_LINUX_LINK.format(version) for version in ("3.9.20", "3.13.7", "3.10.15")]
+    linux_index_file.write_text(
+        json.dumps({
+            "fetched": datetime.datetime.now(tz=datetime.timezone.utc).timestamp(),
+            "releases": [[link.replace("x86_64-unknown", "aarch64-unknown"), _DIGEST] for link in links]
+            + [[link, _DIGEST] for link in links],
+        }),
+        encoding="utf-8",
+    )
+    urlopen = mocker.patch.object(standalone_python, "urlopen")
+
+    assert list(standalone_python.list_pythons()) == ["3.13.7", "3.10.15", "3.9.20"]
+    assert (json.loads(linux_index_file.read_text(encoding="utf-8"))["releases"], urlopen.call_count) == (
+        [[links[1], _DIGEST], [links[2], _DIGEST], [links[0], _DIGEST]],
+        0,
+    )
+
+
+@pytest.mark.usefixtures("pipx_temp_env", "linux_index_file")
+def test_standalone_python_index_revalidates_unchanged_release(mocker: MockerFixture) -> None:
+    link = _LINUX_LINK.format("3.13.7")
+    mocker.patch.object(standalone_python, "urlopen", return_value=_release_response(mocker, link))
+    standalone_python.get_or_update_index()
+    urlopen = mocker.patch.object(standalone_python, "urlopen", side_effect=_http_error(HTTPStatus.NOT_MODIFIED))
+
+    index = standalone_python.get_or_update_index(use_cache=False)
+
+    (request,), _ = urlopen.call_args
+    assert (request.get_header("If-none-match"), index["releases"], index["etag"]) == (
+        '"v1"',
+        [[link, _DIGEST]],
+        '"v1"',
     )
 
-    monkeypatch.setattr(standalone_python, "get_latest_python_releases", lambda: current_releases)
 
-    assert standalone_python.get_or_update_index()["releases"] == current_releases
-    assert json.loads(index_file.read_text())["releases"] == [[legacy_link, digest]]
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_standalone_python_index_of_another_machine_is_refetched(linux_index_file: Path, mocker: MockerFixture) -> None:
+    link = _LINUX_LINK.format("3.13.7")
+    linux_index_file.write_text(
+        json.dumps({
+            "fetched": datetime.datetime.now(tz=datetime.timezone.utc).timestamp(),
+            "releases": [],
+            "suffixes": ["aarch64-apple-darwin-install_only.tar.gz"],
+            "etag": '"v1"',
+            "last_modified": None,
+        }),
+        encoding="utf-8",
+    )
+    urlopen = mocker.patch.object(
+        standalone_python, "urlopen", return_value=_release_response(mocker, link, etag='"v2"')
+    )
+
+    assert standalone_python.list_pythons() == {"3.13.7": (link, _DIGEST)}
+    (request,), _ = urlopen.call_args
+    assert request.get_header("If-none-match") is None
 
 
 @pytest.mark.usefixtures("pipx_temp_env", "mocked_github_api")
@@ -167,7 +249,6 @@ def test_standalone_python_upgrade_keeps_old_build_when_unpack_fails(
     (install_dir / "bin" / "python3").write_text("old", encoding="utf-8")
     (install_dir / "keepme").write_text("v1", encoding="utf-8")
     publish(_python_archive_bytes())
-    mocker.patch.object(standalone_python, "_download")
     mocker.patch.object(standalone_python, "_unpack", side_effect=standalone_python.PipxError("boom"))
 
     with pytest.raises(standalone_python.PipxError, match="boom"):
@@ -326,6 +407,167 @@ def test_standalone_python_download_restarts_when_range_ignored(
     assert (Path(python_path).is_file(), sleep.call_count) == (True, 1)
 
 
+class _RangeRequestHandler(BaseHTTPRequestHandler):
+    def __init__(
+        self,
+        request: socket.socket,
+        client_address: tuple[str, int],
+        server: BaseServer,
+        *,
+        payload: bytes,
+        requested: list[str | None],
+        dropped: set[str],
+    ) -> None:
+        self._payload, self._requested, self._dropped = payload, requested, dropped
+        super().__init__(request, client_address, server)
+
+    def do_GET(self) -> None:
+        requested_range = self.headers.get("Range")
+        self._requested.append(requested_range)
+        start, end = 0, len(self._payload) - 1
+        if requested_range is not None:
+            first, last = requested_range.removeprefix("bytes=").split("-")
+            start, end = int(first), int(last) if last else end
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(self._payload)}")
+        else:
+            self.send_response(HTTPStatus.OK)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        body = self._payload[start : end + 1]
+        if requested_range in self._dropped:
+            # promise the whole range but hang up halfway through it, once
+            self._dropped.discard(requested_range)
+            body = body[: len(body) // 2]
+            self.close_connection = True
+        # the opening request hangs up once it has its own chunk
+        with suppress(ConnectionError):
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # ruff:ignore[builtin-argument-shadowing, any-type]  # matches BaseHTTPRequestHandler.log_message
+        pass
+
+
+@contextmanager
+def _ranged_server(payload: bytes, dropped: set[str]) -> Generator[tuple[str, list[str | None]], None, None]:
+    requested: list[str | None] = []
+    handler = partial(_RangeRequestHandler, payload=payload, requested=requested, dropped=dropped)
+    with ThreadingHTTPServer(("127.0.0.1", 0), handler) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            yield f"http://127.0.0.1:{server.server_address[1]}/python.tar.gz", requested
+        finally:
+            server.shutdown()
+
+
+@pytest.mark.parametrize(
+    ("dropped", "retried"),
+    [
+        pytest.param(set(), [], id="parallel"),
+        pytest.param({"bytes=1024-2047"}, ["bytes=1024-2047", "bytes=1536-2047"], id="resumes-its-chunk"),
+    ],
+)
+def test_standalone_python_download_fetches_ranges_in_parallel(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    dropped: set[str],
+    retried: list[str],
+) -> None:
+    monkeypatch.setattr(standalone_python, "_MIN_DOWNLOAD_CHUNK_SIZE", 1024)
+    mocker.patch.object(standalone_python.time, "sleep")
+    # distinct bytes throughout, so a chunk written at the wrong offset changes the archive
+    payload = b"".join(hashlib.sha256(bytes([number])).digest() for number in range(128))
+    received: list[bytes] = []
+
+    with _ranged_server(payload, dropped) as (url, requested):
+        checksum = standalone_python._download_resuming(url, tmp_path, received.append)  # ruff:ignore[private-member-access]  # the download itself has no public entry point short of installing a build
+
+    assert (b"".join(received) == payload, checksum) == (True, f"sha256:{hashlib.sha256(payload).hexdigest()}")
+    assert list(tmp_path.iterdir()) == []
+    assert sorted(requested, key=str) == sorted(
+        [None, "bytes=1024-2047", "bytes=2048-3071", "bytes=3072-4095", *retried[1:]], key=str
+    )
+
+
+def test_standalone_python_download_keeps_recording_while_the_sink_blocks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(standalone_python, "_MIN_DOWNLOAD_CHUNK_SIZE", 1024)
+    payload: Final[bytes] = b"".join(hashlib.sha256(bytes([number])).digest() for number in range(128))
+    sink_entered: Final[threading.Event] = threading.Event()
+    later_recorded: Final[threading.Event] = threading.Event()
+    received: Final[list[bytes]] = []
+    waited: Final[list[bool]] = []
+
+    def slow_sink(data: bytes) -> None:
+        if not received:
+            # an extraction that fell behind holds up the first bytes until the other connections have recorded theirs
+            sink_entered.set()
+            waited.append(later_recorded.wait(timeout=5))
+        received.append(data)
+
+    download = standalone_python._Download(tmp_path, slow_sink)  # ruff:ignore[private-member-access]  # drives the connections' side of the download directly
+    chunks = download.split(len(payload))
+    front: Final[threading.Thread] = threading.Thread(target=download.record, args=(download.chunks[0], payload[:1024]))
+    front.start()
+    assert sink_entered.wait(timeout=5)
+    for chunk in reversed(chunks):
+        download.record(chunk, payload[chunk.start : chunk.end])
+    later_recorded.set()
+    front.join()
+
+    assert (waited, b"".join(received) == payload, list(tmp_path.iterdir())) == ([True], True, [])
+
+
+def test_standalone_python_download_extracts_chunks_in_order(
+    tmp_path: Path, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(standalone_python, "_MIN_DOWNLOAD_CHUNK_SIZE", 1024)
+    mocker.patch.object(standalone_python.time, "sleep")
+    # incompressible, so the archive spans several chunks
+    content = b"".join(hashlib.sha256(number.to_bytes(2, "big")).digest() for number in range(256))
+    archive = io.BytesIO()
+    member = tarfile.TarInfo("python/bin/python3")
+    member.size = len(content)
+    with tarfile.open(fileobj=archive, mode="w:gz") as python_tar:
+        python_tar.addfile(member, io.BytesIO(content))
+    payload = archive.getvalue()
+    download_dir = tmp_path / "download"
+
+    with _ranged_server(payload, set()) as (url, requested):
+        standalone_python._download(  # ruff:ignore[private-member-access]  # the download itself has no public entry point short of installing a build
+            "3.99", url, download_dir, f"sha256:{hashlib.sha256(payload).hexdigest()}"
+        )
+
+    assert ((download_dir / "python" / "bin" / "python3").read_bytes() == content, len(requested)) == (True, 4)
+    assert [path.name for path in tmp_path.iterdir()] == ["download"]
+
+
+@pytest.mark.parametrize(
+    "tampered",
+    [
+        pytest.param(b"tampered", id="unreadable"),
+        pytest.param(_python_archive_bytes() + b"\0", id="extracts-cleanly"),
+    ],
+)
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_standalone_python_download_rejects_checksum_mismatch(
+    published_darwin_release: tuple[Path, Callable[[bytes], None]],
+    mocker: MockerFixture,
+    tampered: bytes,
+) -> None:
+    cache_dir, publish = published_darwin_release
+    publish(_python_archive_bytes())
+    mocker.patch.object(standalone_python, "urlopen", return_value=io.BytesIO(tampered))
+
+    with pytest.raises(standalone_python.PipxError, match="Checksum mismatch"):
+        standalone_python.download_python_build_standalone("3.99")
+
+    assert not (cache_dir / "3.99").exists()
+
+
 def test_get_latest_python_releases_retries_transient_http_error(mocker: MockerFixture) -> None:
     release = {"browser_download_url": "https://example.invalid/x.tar.gz", "digest": "sha256:" + "0" * 64}
     mocker.patch.object(
@@ -368,7 +610,8 @@ def test_get_latest_python_releases_sets_request_timeout(mocker: MockerFixture)
     )
 
     assert standalone_python.get_latest_python_releases() == []
-    urlopen.assert_called_once_with(standalone_python.GITHUB_API_URL, timeout=30)
+    (request,), kwargs = urlopen.call_args
+    assert (urlopen.call_count, request.full_url, kwargs) == (1, standalone_python.GITHUB_API_URL, {"timeout": 30})
 
 
 @pytest.mark.usefixtures("pipx_temp_env")
@@ -594,7 +837,7 @@ def test_upgrade_standalone_interpreters_reads_each_venv_once(
     mocker.patch.object(standalone_python, "list_pythons", return_value=["3.11.1", "3.12.1"])
     mocker.patch("pipx.commands.interpreter.subprocess.run", side_effect=read_version)
     download = mocker.patch.object(standalone_python, "download_python_build_standalone")
-    reinstall = mocker.patch("pipx.commands.interpreter.commands.reinstall", autospec=True)
+    reinstall = mocker.patch("pipx.commands.interpreter.reinstall", autospec=True)
     metadata_read = mocker.spy(pipx_metadata_file.PipxMetadata, "read")
 
     assert not run_pipx_cli(["interpreter", "upgrade"])
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Final, NoReturn
+
+import pytest
+
+from helpers import run_pipx_cli
+from pipx.trace import PIPX_TRACE
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_trace_records_command_phases(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    trace_file: Final[Path] = tmp_path / "trace.json"
+    monkeypatch.setenv(PIPX_TRACE, str(trace_file))
+
+    assert run_pipx_cli(["install", "pycowsay"]) == 0
+
+    events: Final[list[dict[str, object]]] = json.loads(trace_file.read_text(encoding="utf-8"))["traceEvents"]
+    spans: Final[dict[str, list[dict[str, object]]]] = {}
+    for event in events:
+        if event["ph"] == "X":
+            spans.setdefault(str(event["name"]), []).append(event)
+    assert {
+        "pipx",
+        "run_subprocess",
+        "PipBackend.create_venv",
+        "PipBackend.install",
+        "inspect_venv",
+        "expose_package_resources",
+        "acquire lock",
+    } <= spans.keys()
+    (command,) = spans["pipx"]
+    assert command["args"] == {"argv": ["install", "pycowsay"]}
+    assert all(0 <= float(str(span["dur"])) <= float(str(command["dur"])) for span in spans["run_subprocess"])
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_trace_is_written_when_the_command_fails(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    trace_file: Final[Path] = tmp_path / "nested" / "trace.json"
+    monkeypatch.setenv(PIPX_TRACE, str(trace_file))
+
+    assert run_pipx_cli(["install", "pycowsay", "--python", "3.0"]) == 1
+
+    events: Final[list[dict[str, object]]] = json.loads(trace_file.read_text(encoding="utf-8"))["traceEvents"]
+    assert [event["name"] for event in events if event["ph"] == "X"][-1] == "pipx"
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_trace_is_written_before_run_replaces_pipx(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+) -> None:
+    trace_file: Final[Path] = tmp_path / "trace.json"
+    monkeypatch.setenv(PIPX_TRACE, str(trace_file))
+    written: Final[list[dict[str, object]]] = []
+
+    def exec_app(*_args: object) -> NoReturn:
+        # what the trace holds when the process would be replaced is all it ever gets
+        written.extend(json.loads(trace_file.read_text(encoding="utf-8"))["traceEvents"])
+        raise SystemExit(0)
+
+    mocker.patch("pipx.util.WINDOWS", new=False)
+    mocker.patch("os.execvpe", side_effect=exec_app)
+
+    with pytest.raises(SystemExit):
+        run_pipx_cli(["run", "pycowsay", "hello"])
+
+    spans: Final[list[dict[str, object]]] = [event for event in written if event["ph"] == "X"]
+    (command,) = (span for span in spans if span["name"] == "pipx")
+    assert command["args"] == {"argv": ["run", "pycowsay", "hello"]}
+    assert all(float(str(span["dur"])) <= float(str(command["dur"])) for span in spans)
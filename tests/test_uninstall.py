@@ -178,6 +178,8 @@ def test_uninstall_legacy_venv_inspects_once(mocker: MockerFixture) -> None:
     executable_path = paths.ctx.bin_dir / app_name("pycowsay")
     assert executable_path.exists()
     mock_legacy_venv("pycowsay")
+    # without the install-time inspection result the legacy path has to inspect the venv itself
+    (paths.ctx.venvs / "pycowsay" / venv_inspect.INSPECT_CACHE_FILENAME).unlink()
     run_subprocess = mocker.spy(venv_inspect, "run_subprocess")
 
     assert run_pipx_cli(["uninstall", "pycowsay"]) == 0
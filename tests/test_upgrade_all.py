@@ -3,13 +3,15 @@ from __future__ import annotations
 import json
 import subprocess
 from threading import Barrier
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final
+from unittest.mock import PropertyMock
 
 import pytest
 
 from helpers import PACKAGE_CACHE_DIR_NAME, PIPX_METADATA_LEGACY_VERSIONS, mock_legacy_venv, run_pipx_cli
 from package_info import PKG
-from pipx import paths
+from pipx import paths, shared_libs
+from pipx.commands.upgrade import _upgrade_venv  # ruff:ignore[import-private-name]  # wrapped to hold workers together
 from pipx.pipx_metadata_file import PipxMetadata
 
 if TYPE_CHECKING:
@@ -20,6 +22,15 @@ if TYPE_CHECKING:
     from _pytest.capture import CaptureResult
     from pytest_mock import MockerFixture
 
+    from pipx.commands.upgrade import PackageUpgradeResult
+
+_CURRENT_CHECK: Final[subprocess.CompletedProcess[str]] = subprocess.CompletedProcess(
+    args=["pip", "index"],
+    returncode=0,
+    stdout='{"name":"pycowsay","versions":["0.0.0.2"],"latest":"0.0.0.2"}',
+    stderr="",
+)
+
 
 @pytest.mark.usefixtures("pipx_temp_env")
 def test_upgrade_all() -> None:
@@ -37,14 +48,49 @@ def test_upgrade_all_none(capsys: pytest.CaptureFixture[str]) -> None:
 
 
 @pytest.mark.usefixtures("pipx_temp_env")
-def test_upgrade_all_checks_current_packages_concurrently(
+def test_upgrade_all_checks_shared_package_once(
     capsys: pytest.CaptureFixture[str],
     mocker: MockerFixture,
 ) -> None:
     for suffix in ("_one", "_two", "_three"):
         assert not run_pipx_cli(["install", "pycowsay", f"--suffix={suffix}"])
     capsys.readouterr()
-    barrier: Final[Barrier] = Barrier(3)
+    check: Final[MagicMock] = mocker.patch(
+        "pipx.backends.pip.run_subprocess", autospec=True, return_value=_CURRENT_CHECK
+    )
+
+    assert (run_pipx_cli(["upgrade-all"]), check.call_count, check.call_args.args[0][-4:]) == (
+        0,
+        1,
+        ["index", "versions", "--json", "pycowsay"],
+    )
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_upgrade_all_refresh_skips_cached_index_answer(
+    capsys: pytest.CaptureFixture[str],
+    mocker: MockerFixture,
+) -> None:
+    assert not run_pipx_cli(["install", "pycowsay"])
+    capsys.readouterr()
+    check: Final[MagicMock] = mocker.patch(
+        "pipx.backends.pip.run_subprocess", autospec=True, return_value=_CURRENT_CHECK
+    )
+    assert not run_pipx_cli(["upgrade-all"])
+    assert not run_pipx_cli(["upgrade-all"])
+
+    assert (run_pipx_cli(["upgrade-all", "--refresh"]), check.call_count) == (0, 2)
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_upgrade_all_checks_current_packages_concurrently(
+    capsys: pytest.CaptureFixture[str],
+    mocker: MockerFixture,
+) -> None:
+    assert not run_pipx_cli(["install", "pycowsay"])
+    assert not run_pipx_cli(["inject", "pycowsay", PKG["black"]["spec"]])
+    capsys.readouterr()
+    barrier: Final[Barrier] = Barrier(2)
 
     def check_package(
         cmd: Sequence[str | Path],
@@ -58,14 +104,56 @@ def test_upgrade_all_checks_current_packages_concurrently(
         env_overrides: dict[str, str | None] | None = None,
     ) -> subprocess.CompletedProcess[str]:
         del capture_stdout, capture_stderr, log_cmd_str, log_stdout, log_stderr, run_dir, env_overrides
-        assert "list" in cmd
-        assert "--outdated" in cmd
+        assert "versions" in cmd
         barrier.wait(timeout=5)
-        return subprocess.CompletedProcess(cmd, returncode=0, stdout="[]", stderr="")
+        entry: Final[dict[str, object]] = {"name": cmd[-1], "versions": ["0.0.0.1"], "latest": "0.0.0.1"}
+        return subprocess.CompletedProcess(cmd, returncode=0, stdout=json.dumps(entry), stderr="")
 
     check: Final[MagicMock] = mocker.patch("pipx.backends.pip.run_subprocess", autospec=True, side_effect=check_package)
 
-    assert (run_pipx_cli(["upgrade-all"]), check.call_count) == (0, 3)
+    assert (run_pipx_cli(["upgrade-all", "--include-injected"]), check.call_count) == (0, 2)
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_upgrade_all_jobs_upgrades_environments_concurrently_in_stable_order(
+    capsys: pytest.CaptureFixture[str],
+    mocker: MockerFixture,
+) -> None:
+    for suffix in ("_one", "_two", "_three"):
+        assert not run_pipx_cli(["install", "pycowsay", f"--suffix={suffix}"])
+    capsys.readouterr()
+    mocker.patch(
+        "pipx.backends.pip.run_subprocess",
+        autospec=True,
+        return_value=_CURRENT_CHECK,
+    )
+    barrier: Final[Barrier] = Barrier(3)
+
+    def upgrade_together(*args: Any, **kwargs: Any) -> tuple[PackageUpgradeResult, ...]:  # ruff:ignore[any-type]  # forwards to _upgrade_venv unchanged
+        barrier.wait(timeout=5)
+        return _upgrade_venv(*args, **kwargs)
+
+    mocker.patch("pipx.commands.upgrade._upgrade_venv", side_effect=upgrade_together)
+
+    assert not run_pipx_cli(["upgrade-all", "--jobs", "3", "--output", "json"])
+
+    packages: Final[list[dict[str, object]]] = json.loads(capsys.readouterr().out)["data"]["packages"]
+    assert [package["environment"] for package in packages] == ["pycowsay_one", "pycowsay_three", "pycowsay_two"]
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_upgrade_all_jobs_skips_maintenance_in_every_worker(mocker: MockerFixture) -> None:
+    for suffix in ("_one", "_two"):
+        # outdated, so each worker goes on to upgrade it and reaches the shared libraries check
+        assert not run_pipx_cli(["install", PKG["black"]["spec"], f"--suffix={suffix}"])
+    mocker.patch.object(type(shared_libs.shared_libs), "needs_upgrade", new_callable=PropertyMock, return_value=True)
+    # upgrading a package refreshes the packaging libraries on purpose; only the maintenance check is under test
+    mocker.patch("pipx.venv.Venv.upgrade_packaging_libraries")
+    upgrade: Final[MagicMock] = mocker.patch.object(shared_libs.shared_libs, "upgrade")
+
+    assert not run_pipx_cli(["upgrade-all", "--jobs", "2", "--skip-maintenance"])
+
+    upgrade.assert_not_called()
 
 
 @pytest.mark.usefixtures("pipx_temp_env")
@@ -78,7 +166,7 @@ def test_upgrade_all_does_not_copy_current_environment(
     mocker.patch(
         "pipx.backends.pip.run_subprocess",
         autospec=True,
-        return_value=subprocess.CompletedProcess(args=["pip", "list"], returncode=0, stdout="[]", stderr=""),
+        return_value=_CURRENT_CHECK,
     )
     backup: Final[MagicMock] = mocker.patch("pipx.commands.transaction.copytree", autospec=True)
 
@@ -97,7 +185,7 @@ def test_upgrade_all_updates_current_cooldowns(
     mocker.patch(
         "pipx.backends.pip.run_subprocess",
         autospec=True,
-        return_value=subprocess.CompletedProcess(args=["pip", "list"], returncode=0, stdout="[]", stderr=""),
+        return_value=_CURRENT_CHECK,
     )
 
     assert not run_pipx_cli(["upgrade-all", "--include-injected", "--cooldown", "0"])
@@ -136,7 +224,7 @@ def test_upgrade_all_reports_outdated_check_failure(
         "pipx.backends.pip.run_subprocess",
         autospec=True,
         return_value=subprocess.CompletedProcess(
-            args=["pip", "list"],
+            args=["pip", "index"],
             returncode=1,
             stdout="",
             stderr="index unavailable",
@@ -160,7 +248,7 @@ def test_upgrade_all_skips_pinned_package_check(
     check: Final[MagicMock] = mocker.patch(
         "pipx.backends.pip.run_subprocess",
         autospec=True,
-        return_value=subprocess.CompletedProcess(args=["pip", "list"], returncode=0, stdout="[]", stderr=""),
+        return_value=_CURRENT_CHECK,
     )
 
     assert (
@@ -229,7 +317,7 @@ def test_upgrade_all_pylock_json(
     check: Final[MagicMock] = mocker.patch(
         "pipx.backends.pip.run_subprocess",
         autospec=True,
-        return_value=subprocess.CompletedProcess(args=["pip", "list"], returncode=0, stdout="[]", stderr=""),
+        return_value=_CURRENT_CHECK,
     )
 
     assert not run_pipx_cli(["upgrade-all", "--output", "json"])
@@ -318,7 +406,7 @@ def test_upgrade_all_with_index_args(
     check: Final[MagicMock] = mocker.patch(
         "pipx.backends.pip.run_subprocess",
         autospec=True,
-        return_value=subprocess.CompletedProcess(args=["pip", "list"], returncode=0, stdout="[]", stderr=""),
+        return_value=_CURRENT_CHECK,
     )
 
     assert (
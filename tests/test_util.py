@@ -11,10 +11,19 @@ import pytest
 
 from helpers import skip_if_windows
 from pipx import paths
-from pipx.util import exec_app, rmdir, run_subprocess, safe_unlink
+from pipx.util import (
+    PipOutputAnalysis,
+    StreamedProcess,
+    exec_app,
+    rmdir,
+    run_subprocess,
+    safe_unlink,
+    subprocess_post_check_handle_pip_error,
+)
 
 if TYPE_CHECKING:
     import subprocess
+    from unittest.mock import MagicMock
 
     from _pytest.capture import CaptureResult
     from pytest_mock import MockerFixture
@@ -255,6 +264,7 @@ def test_subprocess_stream_does_not_log_capture(
 def test_subprocess_stream_drains_before_output_error(mocker: MockerFixture) -> None:
     destination: Final[TextIOWrapper] = TextIOWrapper(BytesIO(), encoding="ascii")
     mocker.patch("pipx.util.sys.stdout", destination)
+    transcript: Final[MagicMock] = mocker.patch("pipx.util.SpooledTemporaryFile", autospec=True)
 
     with pytest.raises(UnicodeEncodeError):
         run_subprocess(
@@ -262,3 +272,77 @@ def test_subprocess_stream_drains_before_output_error(mocker: MockerFixture) ->
             capture_stderr=False,
             stream_output=True,
         )
+
+    transcript.return_value.close.assert_called_once_with()
+
+
+def test_subprocess_stream_keeps_only_the_tail_in_memory(mocker: MockerFixture) -> None:
+    mocker.patch("pipx.util.sys.stdout", StringIO())
+    result: Final[subprocess.CompletedProcess[str]] = run_subprocess(
+        [sys.executable, "-c", "for number in range(1000): print(number)"],
+        capture_stderr=False,
+        stream_output=True,
+    )
+
+    assert isinstance(result, StreamedProcess)
+    result.transcripts["stdout"].seek(0)
+    assert (result.stdout, result.transcripts["stdout"].read()) == (
+        "".join(f"{number}\n" for number in range(800, 1000)),
+        "".join(f"{number}\n" for number in range(1000)),
+    )
+
+
+def test_streamed_process_close_removes_the_transcripts(mocker: MockerFixture) -> None:
+    mocker.patch("pipx.util.sys.stdout", StringIO())
+    result: Final[subprocess.CompletedProcess[str]] = run_subprocess(
+        [sys.executable, "-c", "print('done')"], capture_stderr=False, stream_output=True
+    )
+    assert isinstance(result, StreamedProcess)
+
+    result.close()
+
+    assert result.transcripts["stdout"].closed
+
+
+def test_pip_output_analysis_keeps_the_latest_lines_of_a_category(capsys: pytest.CaptureFixture[str]) -> None:
+    analysis: Final[PipOutputAnalysis] = PipOutputAnalysis()
+    for number in range(150):
+        analysis.feed_stderr(f"step {number} not found")
+
+    analysis.report()
+
+    assert capsys.readouterr().err.splitlines()[-101:] == [
+        "Some possibly relevant errors from pip install:",
+        *(f"    step {number} not found" for number in range(50, 150)),
+    ]
+
+
+def test_streamed_pip_failure_logs_everything_and_reports_relevant_errors(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(paths.ctx, "log_file", tmp_path / "cmd.log")
+    result: Final[subprocess.CompletedProcess[str]] = run_subprocess(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys; print('Collecting broken'); "
+                "[print(f'error: step {n}', file=sys.stderr) for n in range(30)]; "
+                "[print(f'step {n} not found', file=sys.stderr) for n in range(12)]; sys.exit(1)"
+            ),
+        ],
+        stream_output=True,
+    )
+    capsys.readouterr()
+
+    subprocess_post_check_handle_pip_error(result)
+
+    reported: Final[list[str]] = capsys.readouterr().err.splitlines()
+    # less useful categories are dropped to shorten the report, but the last one left is shown in full
+    assert reported[-13:] == [
+        "Some possibly relevant errors from pip install:",
+        *(f"    step {n} not found" for n in range(12)),
+    ]
+    assert "error: step 0\n" in (tmp_path / "cmd_pip_errors.log").read_text(encoding="utf-8")
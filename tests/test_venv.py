@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import subprocess
 from typing import TYPE_CHECKING, Final
 
@@ -31,10 +32,19 @@ def venv_with_site_packages(tmp_path: Path, mocker: MockerFixture) -> tuple[Venv
     platlib_demo.mkdir(parents=True)
     (platlib_demo / "METADATA").write_text("Name: demo2\nVersion: 1.0\n", encoding="utf-8")
 
+    probe_output: Final[str] = json.dumps({
+        "sys_path": [str(purelib), str(platlib)],
+        "python_version": "3.12.0",
+        "purelib": str(purelib),
+        "platlib": str(platlib),
+        "pip_importable": None,
+        "requires_python": {},
+        "environment": {"python_full_version": "3.12.0"},
+    })
     run_subprocess: Final[MagicMock] = mocker.patch(
-        "pipx.util.run_subprocess",
+        "pipx.venv_inspect.run_subprocess",
         autospec=True,
-        return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout=f"{purelib}\n{platlib}\n", stderr=""),
+        return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout=probe_output, stderr=""),
     )
     return venv, (purelib_demo, platlib_demo), run_subprocess
 
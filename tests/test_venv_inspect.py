@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING
+import platform
+import sys
+import sysconfig
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
 
+from packaging.requirements import Requirement
 from packaging.utils import canonicalize_name
 
 from pipx import venv_inspect
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from pytest_mock import MockerFixture
 
 
@@ -77,3 +80,88 @@ def test_inspect_venv_refreshes_distribution_paths(tmp_path: Path, mocker: Mocke
     os.utime(site_packages, ns=(site_packages_stat.st_atime_ns, site_packages_stat.st_mtime_ns))
 
     assert venv_inspect.inspect_venv(*args).package_version == "1.0"
+
+
+def test_inspect_venv_reuses_cache_until_distributions_change(tmp_path: Path, mocker: MockerFixture) -> None:
+    site_packages = tmp_path / "site-packages"
+    _write_dist_info(site_packages, "root-package")
+    (tmp_path / "bin").mkdir()
+    fetch_info = mocker.patch.object(
+        venv_inspect,
+        "fetch_info_in_venv",
+        autospec=True,
+        return_value=([str(site_packages)], {}, "Python 3.10.0"),
+    )
+    args: tuple[str, set[str], Path, Path, Path] = (
+        "root-package",
+        set(),
+        tmp_path / "bin",
+        tmp_path / "python",
+        tmp_path / "man",
+    )
+
+    first = venv_inspect.inspect_venv(*args, cache_dir=tmp_path)
+    assert venv_inspect.inspect_venv(*args, cache_dir=tmp_path) == first
+    assert fetch_info.call_count == 1
+
+    _write_dist_info(site_packages, "dependency-package")
+
+    assert venv_inspect.inspect_venv(*args, cache_dir=tmp_path) == first
+    assert fetch_info.call_count == 2
+
+
+def test_inspect_venv_cache_keys_on_extras(tmp_path: Path, mocker: MockerFixture) -> None:
+    site_packages = tmp_path / "site-packages"
+    _write_dist_info(site_packages, "root-package", ('dependency-package; extra == "more"',))
+    _write_dist_info(site_packages, "dependency-package")
+    (tmp_path / "bin").mkdir()
+    fetch_info = mocker.patch.object(
+        venv_inspect,
+        "fetch_info_in_venv",
+        autospec=True,
+        return_value=([str(site_packages)], {}, "Python 3.10.0"),
+    )
+    paths: tuple[Path, Path, Path] = (tmp_path / "bin", tmp_path / "python", tmp_path / "man")
+
+    venv_inspect.inspect_venv("root-package", set(), *paths, cache_dir=tmp_path)
+    venv_inspect.inspect_venv("root-package", {"more"}, *paths, cache_dir=tmp_path)
+    venv_inspect.inspect_venv("root-package", {"more"}, *paths, cache_dir=tmp_path)
+
+    assert fetch_info.call_count == 2
+
+
+def test_dependency_graph_answers_every_query_from_one_parse(tmp_path: Path, mocker: MockerFixture) -> None:
+    site_packages: Final[Path] = tmp_path / "site-packages"
+    _write_dist_info(site_packages, "app", ("shared", "only-app"))
+    _write_dist_info(site_packages, "plugin", ("shared", 'windows-only; sys_platform == "win32"'))
+    for name in ("shared", "only-app", "windows-only"):
+        _write_dist_info(site_packages, name)
+    requirement: Final = mocker.patch.object(venv_inspect, "Requirement", wraps=Requirement)
+
+    graph: Final = venv_inspect.DependencyGraph.from_sys_path([str(site_packages)], {"sys_platform": "linux"})
+
+    assert (
+        graph.not_required(),
+        graph.not_required(excluding={"plugin"}),
+        graph.reachable(["app"], excluding={"plugin"}),
+        graph.reachable(["plugin"]),
+        requirement.call_count,
+    ) == (
+        {"app", "plugin", "windows-only"},
+        {"app", "windows-only"},
+        {"app", "shared", "only-app"},
+        {"plugin", "shared"},
+        4,
+    )
+
+
+def test_probe_venv_answers_every_query_in_one_call() -> None:
+    probe = venv_inspect.probe_venv(Path(sys.executable), distributions=("Pytest", "pipx-no-such-dist"), check_pip=True)
+
+    assert probe.python_version == platform.python_version()
+    assert probe.environment["python_full_version"] == platform.python_version()
+    assert probe.site_packages[0] == Path(sysconfig.get_path("purelib"))
+    assert str(probe.purelib) in probe.sys_path
+    assert probe.pip_importable is not None
+    assert probe.requires_python["pytest"] is not None
+    assert probe.requires_python["pipx-no-such-dist"] is None
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Final
+
+import pytest
+
+from pipx import paths
+from pipx.backends.pip import PipBackend
+from pipx.constants import WINDOWS
+from pipx.util import get_venv_paths
+from pipx.venv_template import clone_venv
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _FakeVenvCreator:
+    def __init__(self, *, binary: bool = False) -> None:
+        self.built: list[Path] = []
+        self._binary = binary
+
+    def __call__(self, root: Path) -> None:
+        self.built.append(root)
+        (root / "bin").mkdir(parents=True)
+        (root / "pyvenv.cfg").write_text(f"command = python -m venv {root}\n", encoding="utf-8")
+        script: Final[Path] = root / "bin" / "tool"
+        script.write_text(f"#!{root}/bin/python\n", encoding="utf-8")
+        script.chmod(0o755)
+        (root / "bin" / "untouched").write_bytes(b"\0no path here")
+        if self._binary:
+            (root / "bin" / "launcher.exe").write_bytes(b"MZ\0" + str(root).encode())
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_clone_venv_builds_the_template_once(tmp_path: Path) -> None:
+    create: Final[_FakeVenvCreator] = _FakeVenvCreator()
+
+    for name in ("first", "second"):
+        clone_venv(tmp_path / name, python=sys.executable, key=("fake",), create=create)
+
+    second: Final[Path] = tmp_path / "second"
+    assert create.built == [next(path for path in paths.ctx.venv_templates.iterdir() if path.is_dir())]
+    assert (second / "pyvenv.cfg").read_text(encoding="utf-8") == f"command = python -m venv {second}\n"
+    assert (second / "bin" / "tool").read_text(encoding="utf-8") == f"#!{second}/bin/python\n"
+    assert (second / "bin" / "untouched").read_bytes() == b"\0no path here"
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_clone_venv_keys_the_template_on_its_inputs(tmp_path: Path) -> None:
+    create: Final[_FakeVenvCreator] = _FakeVenvCreator()
+
+    clone_venv(tmp_path / "first", python=sys.executable, key=("fake", "--copies"), create=create)
+    clone_venv(tmp_path / "second", python=sys.executable, key=("fake",), create=create)
+
+    assert len(create.built) == 2
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_clone_venv_builds_directly_when_the_template_embeds_its_path_in_a_binary(tmp_path: Path) -> None:
+    create: Final[_FakeVenvCreator] = _FakeVenvCreator(binary=True)
+
+    for name in ("first", "second"):
+        clone_venv(tmp_path / name, python=sys.executable, key=("fake",), create=create)
+
+    assert create.built[1:] == [tmp_path / "first", tmp_path / "second"]
+    assert not any(path.is_dir() for path in paths.ctx.venv_templates.iterdir())
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_clone_venv_builds_directly_for_an_unresolved_interpreter(tmp_path: Path) -> None:
+    create: Final[_FakeVenvCreator] = _FakeVenvCreator()
+
+    clone_venv(tmp_path / "venv", python="3.99", key=("fake",), create=create)
+
+    assert create.built == [tmp_path / "venv"]
+
+
+@pytest.mark.usefixtures("pipx_temp_env")
+def test_pip_backend_clone_runs_as_its_own_venv(tmp_path: Path) -> None:
+    for name in ("first", "second"):
+        PipBackend().create_venv(
+            tmp_path / name, python=sys.executable, venv_args=[], pip_args=[], include_pip=False, verbose=False
+        )
+
+    _, python_path, _ = get_venv_paths(tmp_path / "second")
+    prefix: Final[str] = subprocess.run(
+        [str(python_path), "-c", "import sys; print(sys.prefix)"], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    assert prefix == str(tmp_path / "second")
+    if not WINDOWS:
+        assert str(paths.ctx.venv_templates) not in (tmp_path / "second" / "bin" / "activate").read_text()